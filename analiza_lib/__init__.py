@@ -1,7 +1,40 @@
-from .integrations import romberg_integration, simpsons_rule, trapezoidal_rule
-from .roots_finding import Newton_Raphson, Bisection_Method, Secant_Method
-from .interpolation import linear_interpolation, polynomial_interpolation, lagrange_interpolation, neville, cubic_spline_interpolation
-from .solving_equations import jacobi_solver, gauss_seidel_solver,condition_number
-from .machine_precision import calculate_machine_epsilon
-from .graphs import plot_linear_interpolation_graph, plot_polynomial_interpolation_graph, plot_lagrange_interpolation_graph, plot_neville_interpolation_graph, plot_cubic_spline_interpolation_graph, plot_bisection_graph, plot_newtonraphson_graph, plot_secant_graph
+import importlib
 
+# Public names and the submodule that defines each of them. Submodules are
+# imported on first use of one of their names, so a script that only
+# integrates never imports the interpolation code or the plotting module,
+# and matplotlib itself is only imported when the first plot is drawn.
+# "from analiza_lib import *" still imports everything.
+_EXPORTS = {
+    "integrations": ("romberg_integration", "simpsons_rule", "trapezoidal_rule"),
+    "roots_finding": ("Newton_Raphson", "Bisection_Method", "Secant_Method"),
+    "interpolation": ("linear_interpolation", "polynomial_interpolation", "lagrange_interpolation", "neville", "cubic_spline_interpolation",
+                      "PiecewisePolynomial", "LinearInterpolant", "CubicSplineInterpolant", "PolynomialInterpolant", "make_interpolant",
+                      "save_interpolant", "load_interpolant"),
+    "streaming_interpolation": ("iter_table_chunks", "stream_interpolate", "resample_file"),
+    "solving_equations": ("jacobi_solver", "gauss_seidel_solver", "condition_number",
+                          "jacobi_iterations", "gauss_seidel_iterations", "mixed_precision_solver", "block_gauss_seidel_iterations"),
+    "grid_interpolation": ("GridInterpolant", "BilinearInterpolant", "BicubicInterpolant", "bilinear_interpolation", "bicubic_interpolation", "GRID_INTERPOLANTS"),
+    "machine_precision": ("calculate_machine_epsilon", "default_tolerance", "tolerance_floor", "float_dtype", "FLOAT_DTYPES"),
+    "caching": ("LRUCache", "DiskCache"),
+    "graphs": ("plot_linear_interpolation_graph", "plot_polynomial_interpolation_graph", "plot_lagrange_interpolation_graph", "plot_neville_interpolation_graph", "plot_cubic_spline_interpolation_graph", "plot_bisection_graph", "plot_newtonraphson_graph", "plot_secant_graph", "plot_grid_interpolation_graph",
+               "PlotCache", "configure_plot_cache", "plot_cache_key", "adaptive_sample", "evaluate_batch",
+               "MemoizedFunction", "RootSolution", "solve_root", "plot_root_solution", "solve_and_plot_root"),
+}
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
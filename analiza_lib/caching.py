@@ -0,0 +1,281 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+def default_sizeof(value):
+    """
+    Estimate the memory held by a cached value.
+
+    Objects exposing an ``nbytes`` attribute (NumPy arrays, interpolants) report
+    it directly; anything else falls back to sys.getsizeof.
+
+    Parameters:
+        value (object): The cached value.
+
+    Returns:
+        int: Size in bytes.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with memory accounting.
+
+    Entries are evicted oldest-first whenever the number of entries exceeds
+    max_entries or their total size exceeds max_bytes. With a ttl, entries
+    also expire that many seconds after they were stored.
+
+    Parameters:
+        max_entries (int, optional): Maximum number of entries (default is 128).
+        max_bytes (int, optional): Maximum total size in bytes, None for no limit.
+        sizeof (function, optional): Returns the size of a value in bytes.
+        ttl (float, optional): Lifetime of an entry in seconds, None for no expiry.
+
+    Raises:
+        ValueError: If the limits are not positive.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, sizeof=default_sizeof, ttl=None):
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive number.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Return the value for key and mark it as recently used.
+
+        Parameters:
+            key (hashable): The cache key.
+            default (object, optional): Returned when the key is missing.
+
+        Returns:
+            object: The cached value or default.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            value, size, expires = self._entries[key]
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.nbytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Insert or replace a value, evicting old entries to stay within limits.
+
+        Parameters:
+            key (hashable): The cache key.
+            value (object): The value to store.
+
+        Raises:
+            ValueError: If the value alone is larger than max_bytes.
+        """
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise ValueError(f"Value of {size} bytes exceeds the cache limit of {self.max_bytes} bytes.")
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size, expires)
+            self.nbytes += size
+
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self.nbytes > self.max_bytes):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """
+        Remove key from the cache.
+
+        Parameters:
+            key (hashable): The cache key.
+            default (object, optional): Returned when the key is missing.
+
+        Returns:
+            object: The removed value or default.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value, size, _ = self._entries.pop(key)
+            self.nbytes -= size
+            return value
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """
+        Report cache usage.
+
+        Returns:
+            dict: Entry count, size in bytes, limits, hits, misses, evictions and expirations.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class DiskCache:
+    """
+    Size-capped cache of text values stored as files in a directory.
+
+    Each entry is one file named after its key. When the total size exceeds
+    max_bytes, the least recently used files (by modification time, which is
+    refreshed on every hit) are deleted.
+
+    Parameters:
+        directory (str): Directory holding the cache files; created if missing.
+        max_bytes (int, optional): Maximum total size of the files (default is 256 MB).
+
+    Raises:
+        ValueError: If max_bytes is not positive.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive number.")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.cache")
+
+    def get(self, key, default=None):
+        """
+        Return the stored text for key and mark it as recently used.
+
+        Parameters:
+            key (str): The cache key; must be a valid file name.
+            default (object, optional): Returned when the key is missing.
+
+        Returns:
+            str: The cached text or default.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                value = file.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store text under key, then evict old files to stay within max_bytes.
+
+        The file is written to a unique temporary file and renamed, so
+        concurrent readers, in this or another process, never see a partial
+        entry.
+
+        Parameters:
+            key (str): The cache key; must be a valid file name.
+            value (str): The text to store.
+        """
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with open(descriptor, "w", encoding="utf-8") as file:
+                file.write(value)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".cache"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # removed by another process meanwhile
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+
+    def stats(self):
+        """
+        Report cache usage.
+
+        Returns:
+            dict: Directory, size limit, hits, misses and evictions.
+        """
+        return {
+            "directory": self.directory,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,261 +1,717 @@
 import base64
+import functools
+import hashlib
+import inspect
 import io
+import types
 
-import matplotlib.pyplot as plt
 import numpy as np
-from analiza_lib import *
 
-def plot_linear_interpolation_graph(x_vals, y_vals, filename="linear_interpolation.png"):
+from analiza_lib import instrumentation
+from analiza_lib.caching import LRUCache, DiskCache
+from analiza_lib.interpolation import make_interpolant
+from analiza_lib.roots_finding import Newton_Raphson, Bisection_Method, Secant_Method
+
+
+class PlotCache:
     """
-    Plots and saves a linear interpolation graph.
+    Content-addressed cache of rendered plots.
+
+    The key is a SHA-256 hash of the plot method, its canonicalized inputs and
+    the render options, so identical requests share one rendered image no
+    matter how the arguments were passed. Hits are served from an in-memory
+    LRU tier first, then from an optional on-disk tier that survives restarts
+    and is shared by worker processes.
+
+    Parameters:
+        max_entries (int, optional): Maximum plots kept in memory (default is 256).
+        max_bytes (int, optional): Maximum memory for plots in bytes (default is 64 MB).
+        directory (str, optional): Directory of the on-disk tier, None to disable it.
+        max_disk_bytes (int, optional): Maximum size of the on-disk tier (default is 256 MB).
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024, directory=None,
+                 max_disk_bytes=256 * 1024 * 1024):
+        self.memory = LRUCache(max_entries, max_bytes, sizeof=len)
+        self.disk = DiskCache(directory, max_disk_bytes) if directory else None
+
+    def get(self, key):
+        """
+        Return the cached image for key, or None.
+
+        Parameters:
+            key (str): The cache key.
+
+        Returns:
+            str: The base64-encoded image, or None on a miss.
+        """
+        image = self.memory.get(key)
+        if image is None and self.disk is not None:
+            image = self.disk.get(key)
+            if image is not None:
+                self.memory.put(key, image)
+        return image
+
+    def put(self, key, image):
+        """
+        Store a rendered image in both tiers.
+
+        Parameters:
+            key (str): The cache key.
+            image (str): The base64-encoded image.
+        """
+        self.memory.put(key, image)
+        if self.disk is not None:
+            self.disk.put(key, image)
+
+    def clear(self):
+        """Empty the in-memory tier."""
+        self.memory.clear()
+
+    def stats(self):
+        """
+        Report cache usage.
+
+        Returns:
+            dict: Statistics of the memory tier and, if enabled, the disk tier.
+        """
+        return {"memory": self.memory.stats(), "disk": self.disk.stats() if self.disk else None}
+
+
+plot_cache = PlotCache()
+
+
+def configure_plot_cache(max_entries=256, max_bytes=64 * 1024 * 1024, directory=None,
+                         max_disk_bytes=256 * 1024 * 1024):
+    """
+    Replace the plot cache used by every plot_* function.
+
+    Parameters:
+        max_entries (int, optional): Maximum plots kept in memory; 0 disables caching.
+        max_bytes (int, optional): Maximum memory for plots in bytes.
+        directory (str, optional): Directory of the on-disk tier, None to disable it.
+        max_disk_bytes (int, optional): Maximum size of the on-disk tier.
+
+    Returns:
+        PlotCache: The new cache, or None when caching is disabled.
+    """
+    global plot_cache
+    plot_cache = PlotCache(max_entries, max_bytes, directory, max_disk_bytes) if max_entries else None
+    return plot_cache
+
+
+def _canonical_parts(value, parts):
+    """
+    Append a canonical byte representation of value to parts.
+
+    Numbers and numeric sequences are normalized to float64, so 1, 1.0 and
+    [1, 2] versus (1.0, 2.0) hash alike. Functions are identified by their
+    compiled code and constants, which is stable for expressions evaluated
+    from the same text.
+
+    Parameters:
+        value (object): The value to canonicalize.
+        parts (list of bytes): Output list.
+
+    Raises:
+        TypeError: If value cannot be canonicalized.
+    """
+    if value is None or isinstance(value, (bool, str)):
+        parts.append(repr(value).encode())
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        parts.append(b"f" + np.float64(value).tobytes())
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        array = np.asarray(value, dtype=float)
+        parts.append(b"a" + repr(array.shape).encode() + array.tobytes())
+    elif isinstance(value, types.CodeType):
+        parts.append(b"c" + value.co_code + repr(value.co_names).encode())
+        for constant in value.co_consts:
+            _canonical_parts(constant, parts)
+    elif isinstance(value, types.FunctionType):
+        _canonical_parts(value.__code__, parts)
+        for default in value.__defaults__ or ():
+            _canonical_parts(default, parts)
+        for cell in value.__closure__ or ():
+            _canonical_parts(cell.cell_contents, parts)
+    elif hasattr(value, "__dict__"):
+        parts.append(type(value).__name__.encode())
+        for name, attribute in sorted(vars(value).items()):
+            parts.append(name.encode())
+            _canonical_parts(attribute, parts)
+    else:
+        raise TypeError(f"Cannot canonicalize {type(value).__name__}")
+
+
+def plot_cache_key(method, arguments):
+    """
+    Compute the content hash identifying a plot.
+
+    Parameters:
+        method (str): Name of the plot function.
+        arguments (dict): Bound arguments of the call, including render options.
+
+    Returns:
+        str: Hex digest, or None if an argument cannot be canonicalized.
+    """
+    parts = [method.encode()]
+    try:
+        for name, value in arguments.items():
+            parts.append(name.encode())
+            _canonical_parts(value, parts)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(b"\0".join(parts)).hexdigest()
+
+
+def _cached_plot(plot_function):
+    """
+    Decorator serving a plot function from plot_cache.
+
+    The filename argument does not affect the image and is left out of the key.
+    """
+    signature = inspect.signature(plot_function)
+
+    @functools.wraps(plot_function)
+    def wrapper(*args, **kwargs):
+        cache = plot_cache
+        if cache is None:
+            return plot_function(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items() if name != "filename"}
+        key = plot_cache_key(plot_function.__name__, arguments)
+        if key is None:
+            return plot_function(*args, **kwargs)
+
+        image = cache.get(key)
+        if image is None:
+            image = plot_function(*args, **kwargs)
+            cache.put(key, image)
+        return image
+
+    return wrapper
+
+
+def _new_figure():
+    """
+    Create a figure with its own Agg canvas.
+
+    Figures built this way never touch the global pyplot state, so plots can
+    be rendered concurrently from worker threads and are freed by the garbage
+    collector instead of a figure manager. matplotlib is imported here, on
+    the first plot, rather than with the module.
+
+    Returns:
+        tuple: The matplotlib Figure and its single Axes.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot()
+
+
+def _render_base64(figure, image_format="png"):
+    """
+    Render a figure and encode it as base64.
+
+    Parameters:
+        figure (matplotlib.figure.Figure): The figure to render.
+        image_format (str): image format accepted by savefig, e.g. "png" or "svg".
+
+    Returns:
+        str: The base64-encoded image.
+    """
+    buf = io.BytesIO()
+    figure.savefig(buf, format=image_format)
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+
+def evaluate_batch(func, xs):
+    """
+    Evaluate a function at many points, in one vectorized call when possible.
+
+    Functions written for scalars (using math, conditionals, ...) fail or
+    return the wrong shape on arrays; they fall back to one call per point.
+
+    Parameters:
+        func (function): the function to evaluate.
+        xs (numpy.ndarray): the points.
+
+    Returns:
+        numpy.ndarray: func at each point, as floats.
+    """
+    try:
+        ys = np.asarray(func(xs), dtype=float)
+        if ys.shape == xs.shape:
+            return ys
+    except Exception:
+        pass
+    return np.array([func(xi) for xi in xs], dtype=float)
+
+
+def adaptive_sample(func, a, b, initial_points=33, max_points=400, tolerance=1e-3, max_depth=12):
+    """
+    Sample a function for plotting, refining only where the curve needs it.
+
+    Starting from an even grid, every segment is tested by evaluating its
+    midpoint: if the function deviates from the straight segment by more
+    than tolerance times the vertical range of the plot (or is not finite),
+    the midpoint is kept and both halves are tested in the next round. All
+    midpoints of a round are evaluated in one vectorized call. When the
+    point budget would be exceeded, the segments with the largest
+    deviation are refined first.
+
+    Parameters:
+        func (function): the function to sample.
+        a (float): start of the interval.
+        b (float): end of the interval.
+        initial_points (int): size of the starting even grid.
+        max_points (int): maximum total number of samples.
+        tolerance (float): allowed deviation relative to the vertical range.
+        max_depth (int): maximum number of refinement rounds.
+
+    Returns:
+        tuple of numpy.ndarray: sorted sample points and function values.
+
+    Raises:
+        ValueError: if the interval or the sampling limits are invalid.
+    """
+    if not b > a:
+        raise ValueError("b must be bigger then a.")
+    if initial_points < 2 or max_points < initial_points:
+        raise ValueError("max_points must be at least initial_points, which must be at least 2.")
+
+    xs = np.linspace(a, b, initial_points)
+    ys = evaluate_batch(func, xs)
+    finite = ys[np.isfinite(ys)]
+    span = finite.max() - finite.min() if finite.size else 0.0
+    scale = tolerance * (span if span > 0 else 1.0)
+
+    left_x, right_x = xs[:-1], xs[1:]
+    left_y, right_y = ys[:-1], ys[1:]
+    new_x, new_y = [xs], [ys]
+    count = len(xs)
+
+    for _ in range(max_depth):
+        budget = max_points - count
+        if budget <= 0 or len(left_x) == 0:
+            break
+
+        mid_x = (left_x + right_x) / 2
+        mid_y = evaluate_batch(func, mid_x)
+        count += len(mid_x)
+        new_x.append(mid_x)
+        new_y.append(mid_y)
+
+        # Deviation of the midpoint from the chord; non-finite values always refine
+        deviation = np.abs(mid_y - (left_y + right_y) / 2)
+        deviation[~np.isfinite(deviation)] = np.inf
+        refine = np.nonzero(deviation > scale)[0]
+
+        # Each refined segment costs two midpoints in the next round
+        budget = max_points - count
+        if 2 * len(refine) > budget:
+            keep = budget // 2
+            refine = refine[np.argsort(-deviation[refine], kind="stable")[:keep]]
+            refine.sort()
+
+        left_x, right_x = (np.concatenate([left_x[refine], mid_x[refine]]),
+                           np.concatenate([mid_x[refine], right_x[refine]]))
+        left_y, right_y = (np.concatenate([left_y[refine], mid_y[refine]]),
+                           np.concatenate([mid_y[refine], right_y[refine]]))
+
+    xs = np.concatenate(new_x)
+    ys = np.concatenate(new_y)
+    order = np.argsort(xs, kind="stable")
+    return xs[order], ys[order]
+
+
+OUTPUT_FORMATS = ("png", "svg", "series")
+
+
+def _encode_series(xs, ys):
+    """
+    Encode a sampled curve as a compact binary array instead of an image.
+
+    Parameters:
+        xs (array-like): sampled x values.
+        ys (array-like): corresponding y values.
+
+    Returns:
+        str: base64 of a little-endian float32 array of shape (2, n),
+        the x values followed by the y values.
+    """
+    series = np.asarray([xs, ys], dtype='<f4')
+    return base64.b64encode(series.tobytes()).decode('utf-8')
+
+
+def _check_output_format(output_format):
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {', '.join(OUTPUT_FORMATS)}.")
+
+
+def _plot_interpolation_graph(name, title, method, x_vals, y_vals, output_format="png"):
+    """
+    Shared template of the interpolation graphs: data points and the interpolated curve.
 
     Parameters:
+        name (str): name of the calling function, used in error messages.
+        title (str): method name shown in the title and legend.
+        method (str): interpolation method, see make_interpolant.
         x_vals (list): x data points.
         y_vals (list): corresponding y values.
-        filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
+
+    Returns:
+        str: The base64-encoded image or series.
 
     Raises:
         ValueError: if x_vals and y_vals have different lengths.
         Exception: for any general error.
     """
     try:
-        # Check if lists are the same length
+        _check_output_format(output_format)
         if len(x_vals) != len(y_vals):
             raise ValueError("x_vals and y_vals must be the same length.")
-        
-        # Create 300 x values between min and max for smooth plotting
-        xs = np.linspace(min(x_vals), max(x_vals), 300)
-        
-        # Calculate interpolated y values for each x in xs
-        ys = [linear_interpolation(x_vals, y_vals, xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
-        plt.plot(xs, ys, '-', label='Linear Interpolation')  # plot interpolated line
-        plt.xlabel('X')
-        plt.ylabel('Y')
-        plt.title('Linear Interpolation Graph')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save the plot as an image file
-        # plt.savefig(filename)
-        #
-        # # Show the plot on screen
-        # plt.show()
-        #
-        # # Close the plot to free memory
-        # plt.close()
-    
+
+        # Build the interpolant once and sample it adaptively for smooth plotting
+        interpolant = make_interpolant(method, x_vals, y_vals)
+        xs, ys = adaptive_sample(interpolant, min(x_vals), max(x_vals))
+        if output_format == "series":
+            return _encode_series(xs, ys)
+
+        figure, axes = _new_figure()
+        axes.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
+        axes.plot(xs, ys, '-', label=title)  # plot interpolated curve
+        axes.set_xlabel('X')
+        axes.set_ylabel('Y')
+        axes.set_title(f'{title} Graph')
+        axes.legend()
+        axes.grid(True)
+        return _render_base64(figure, output_format)
+
     except Exception as e:
-        print(f"Error in plot_linear_interpolation_graph: {e}")
+        print(f"Error in {name}: {e}")
         raise
 
-def plot_polynomial_interpolation_graph(x_vals, y_vals, filename="polynomial_interpolation.png"):
+
+def _plot_root_graph(name, title, func, root, a, b, output_format="png", history=()):
     """
-    Plots and saves a polynomial interpolation graph using the polynomial_interpolation function.
+    Shared template of the root-finding graphs: the function, the x-axis and the root.
 
     Parameters:
-        x_vals (list): x data points.
-        y_vals (list): corresponding y values.
-        filename (str): name of the image file to save the plot.
+        name (str): name of the calling function, used in error messages.
+        title (str): method name shown in the title.
+        func (function): the function whose root was found.
+        root (float): the root.
+        a (float): start of the plotted range.
+        b (float): end of the plotted range.
+        output_format (str): "png" or "svg" image, or "series" for the sampled function.
+        history (list): iterates of the solver, drawn as the path to the root.
+
+    Returns:
+        str: The base64-encoded image or series.
+    """
+    try:
+        _check_output_format(output_format)
+        xs, ys = adaptive_sample(func, a, b)
+        if output_format == "series":
+            return _encode_series(xs, ys)
+
+        figure, axes = _new_figure()
+        axes.plot(xs, ys, label='Function f(x)')
+        axes.axhline(0, color='black', linewidth=0.5)  # x-axis
+        if len(history):
+            axes.plot(history, [func(xi) for xi in history], 'x--', color='gray',
+                      linewidth=0.8, label='Iterates')  # path of the solver
+        axes.plot(root, func(root), 'ro', label=f'Root at x={root:.5f}')  # root point
+        axes.set_xlabel('X')
+        axes.set_ylabel('f(X)')
+        axes.set_title(f'{title} Root Finding')
+        axes.legend()
+        axes.grid(True)
+        return _render_base64(figure, output_format)
+
+    except Exception as e:
+        print(f"Error in {name}: {e}")
+        raise
+
+
+class MemoizedFunction:
+    """
+    Scalar function wrapper that remembers every value it computed.
+
+    Array arguments (plot sampling) are passed straight through, so they
+    can still be evaluated in one vectorized call.
+
+    Parameters:
+        func (function): the function to wrap.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.values = {}
+        self.evaluations = 0
+
+    def __call__(self, x):
+        if np.ndim(x) != 0:
+            self.evaluations += np.size(x)
+            return self.func(x)
+
+        key = float(x)
+        if key not in self.values:
+            self.evaluations += 1
+            self.values[key] = self.func(x)
+        return self.values[key]
+
+
+ROOT_METHODS = {
+    "bisection": "Bisection Method",
+    "newton_raphson": "Newton-Raphson Method",
+    "secant": "Secant Method",
+}
+
+
+class RootSolution:
+    """
+    Result of solve_root: the root, the iterates and the memoized function
+    values, kept so the plot reuses them instead of solving again.
+
+    Parameters:
+        method (str): "bisection", "newton_raphson" or "secant".
+        arguments (dict): The problem, used for the plot cache key.
+        memoized (MemoizedFunction): The function with the values the solver computed.
+        root (float): The root.
+        history (list): Iterates of the solver.
+        a (float): Start of the plotted range.
+        b (float): End of the plotted range.
+    """
+
+    def __init__(self, method, arguments, memoized, root, history, a, b):
+        self.method = method
+        self.arguments = arguments
+        self.memoized = memoized
+        self.root = root
+        self.history = history
+        self.a = a
+        self.b = b
+
+
+def solve_root(method, func, x0, x1=None, dfunc=None, tol=1e-5, max_iter=100):
+    """
+    Run a root finder once on the memoized function.
+
+    The solver call is timed, and the function evaluations it made are
+    counted, under the solver's name (see analiza_lib.instrumentation); the
+    evaluations of a later plot are not.
+
+    Parameters:
+        method (str): "bisection", "newton_raphson" or "secant".
+        func (function): the function for which to find the root.
+        x0 (float): start of the interval (bisection) or initial guess.
+        x1 (float): end of the interval (bisection) or second guess (secant).
+        dfunc (function): derivative of the function (Newton-Raphson).
+        tol (float): tolerance.
+        max_iter (int): maximum number of iterations.
+
+    Returns:
+        RootSolution: the root, its iterates and the memoized function.
 
     Raises:
-        ValueError: if x_vals and y_vals have different lengths.
-        Exception: for any general error.
+        ValueError: for an unknown method or invalid input.
     """
+    if method not in ROOT_METHODS:
+        raise ValueError(f"Unknown root-finding method: {method}")
+
+    memoized = MemoizedFunction(func)
+    history = []
+    if method == "bisection":
+        solver = Bisection_Method
+        arguments = (memoized, x0, x1, tol, max_iter, history)
+        a, b = x0 - 1, x1 + 1
+    elif method == "newton_raphson":
+        if dfunc is None:
+            raise ValueError("This method requires a derivative, but none was provided.")
+        solver = Newton_Raphson
+        arguments = (memoized, instrumentation.counted(dfunc, solver.__name__), x0, tol, max_iter, history)
+        a, b = x0 - 2, x0 + 2
+    else:
+        solver = Secant_Method
+        arguments = (memoized, x0, x1, tol, max_iter, history)
+        a, b = x0 - 2, x1 + 2
+
     try:
-        if len(x_vals) != len(y_vals):
-            raise ValueError("x_vals and y_vals must be the same length.")
+        root = instrumentation.timed(solver)(*arguments)
+    finally:
+        instrumentation.record_evaluations(solver.__name__, memoized.evaluations)
+
+    problem = {"method": method, "func": func, "x0": x0, "x1": x1, "dfunc": dfunc, "tol": tol, "max_iter": max_iter}
+    return RootSolution(method, problem, memoized, root, history, a, b)
+
+
+def plot_root_solution(solution, output_format="png"):
+    """
+    Plot a solve_root result: the function, the iterate path and the root.
 
-        # Generate 300 x values within the range for smooth plotting
-        xs = np.linspace(min(x_vals), max(x_vals), 300)
-        
-        # Calculate interpolated y values for each x in xs
-        ys = [polynomial_interpolation(x_vals, y_vals, xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
-        plt.plot(xs, ys, '-', label='Polynomial Interpolation')  # plot interpolated curve
-        plt.xlabel('X')
-        plt.ylabel('Y')
-        plt.title('Polynomial Interpolation Graph')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
+    The plot is served from plot_cache when the same problem was plotted before.
+
+    Parameters:
+        solution (RootSolution): the result of solve_root.
+        output_format (str): "png" or "svg" image, or "series" for the sampled function.
+
+    Returns:
+        str: the base64-encoded plot.
+    """
+    cache = plot_cache
+    key = plot_cache_key("solve_and_plot_root", {**solution.arguments, "output_format": output_format}
+                         ) if cache is not None else None
+    image = cache.get(key) if key is not None else None
+    if image is None:
+        image = _plot_root_graph("solve_and_plot_root", ROOT_METHODS[solution.method], solution.memoized,
+                                 solution.root, solution.a, solution.b, output_format, solution.history)
+        if key is not None:
+            cache.put(key, image)
+    return image
+
+
+def solve_and_plot_root(method, func, x0, x1=None, dfunc=None, tol=1e-5, max_iter=100, output_format="png"):
+    """
+    Run a root finder once and plot its result from the same function values.
+
+    The function is memoized, so the repeated evaluations inside the solver,
+    the iterate path and the root marker cost nothing extra, and the curve
+    is sampled with vectorized calls. The plot is served from plot_cache when
+    the same problem was plotted before; the solver itself always runs.
+    Callers that time the two steps separately use solve_root and
+    plot_root_solution.
+
+    Parameters:
+        method (str): "bisection", "newton_raphson" or "secant".
+        func (function): the function for which to find the root.
+        x0 (float): start of the interval (bisection) or initial guess.
+        x1 (float): end of the interval (bisection) or second guess (secant).
+        dfunc (function): derivative of the function (Newton-Raphson).
+        tol (float): tolerance.
+        max_iter (int): maximum number of iterations.
+        output_format (str): "png", "svg", "series", or None to skip plotting.
+
+    Returns:
+        tuple: the root and the base64-encoded plot (None when skipped).
+
+    Raises:
+        ValueError: for an unknown method or invalid input.
+        Exception: for any general error.
+    """
+    try:
+        solution = solve_root(method, func, x0, x1, dfunc, tol, max_iter)
+        if output_format is None:
+            return solution.root, None
+        return solution.root, plot_root_solution(solution, output_format)
 
     except Exception as e:
-        print(f"Error in plot_polynomial_interpolation_graph: {e}")
+        print(f"Error in solve_and_plot_root: {e}")
         raise
 
-def plot_lagrange_interpolation_graph(x_vals, y_vals, filename="lagrange_interpolation.png"):
+
+@_cached_plot
+def plot_linear_interpolation_graph(x_vals, y_vals, filename="linear_interpolation.png", output_format="png"):
     """
-    Plots and saves a Lagrange interpolation graph using the lagrange_interpolation function.
+    Plots and saves a linear interpolation graph.
 
     Parameters:
         x_vals (list): x data points.
         y_vals (list): corresponding y values.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
 
     Raises:
         ValueError: if x_vals and y_vals have different lengths.
         Exception: for any general error.
     """
-    try:
-        if len(x_vals) != len(y_vals):
-            raise ValueError("x_vals and y_vals must be the same length.")
-
-        # Generate 300 x values within the range for smooth plotting
-        xs = np.linspace(min(x_vals), max(x_vals), 300)
-        
-        # Calculate interpolated y values for each x in xs
-        ys = [lagrange_interpolation(x_vals, y_vals, xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
-        plt.plot(xs, ys, '-', label='Lagrange Interpolation')  # plot interpolated curve
-        plt.xlabel('X')
-        plt.ylabel('Y')
-        plt.title('Lagrange Interpolation Graph')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
+    return _plot_interpolation_graph('plot_linear_interpolation_graph', 'Linear Interpolation',
+                                     'linear', x_vals, y_vals, output_format)
 
-    except Exception as e:
-        print(f"Error in plot_lagrange_interpolation_graph: {e}")
-        raise
 
-def plot_neville_interpolation_graph(x_vals, y_vals, filename="neville_interpolation.png"):
+@_cached_plot
+def plot_polynomial_interpolation_graph(x_vals, y_vals, filename="polynomial_interpolation.png", output_format="png"):
     """
-    Plots and saves a Neville interpolation graph using the neville function.
+    Plots and saves a polynomial interpolation graph.
 
     Parameters:
         x_vals (list): x data points.
         y_vals (list): corresponding y values.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
 
     Raises:
         ValueError: if x_vals and y_vals have different lengths.
         Exception: for any general error.
     """
-    try:
-        if len(x_vals) != len(y_vals):
-            raise ValueError("x_vals and y_vals must be the same length.")
+    return _plot_interpolation_graph('plot_polynomial_interpolation_graph', 'Polynomial Interpolation',
+                                     'polynomial', x_vals, y_vals, output_format)
 
-        # Generate 300 x values within the range for smooth plotting
-        xs = np.linspace(min(x_vals), max(x_vals), 300)
-        
-        # Calculate interpolated y values for each x in xs
-        ys = [neville(x_vals, y_vals, xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
-        plt.plot(xs, ys, '-', label='Neville Interpolation')  # plot interpolated curve
-        plt.xlabel('X')
-        plt.ylabel('Y')
-        plt.title('Neville Interpolation Graph')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
 
-    except Exception as e:
-        print(f"Error in plot_neville_interpolation_graph: {e}")
-        raise
+@_cached_plot
+def plot_lagrange_interpolation_graph(x_vals, y_vals, filename="lagrange_interpolation.png", output_format="png"):
+    """
+    Plots and saves a Lagrange interpolation graph.
 
-def plot_cubic_spline_interpolation_graph(x_vals, y_vals, filename="cubic_spline_interpolation.png"):
+    Parameters:
+        x_vals (list): x data points.
+        y_vals (list): corresponding y values.
+        filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
+
+    Raises:
+        ValueError: if x_vals and y_vals have different lengths.
+        Exception: for any general error.
+    """
+    return _plot_interpolation_graph('plot_lagrange_interpolation_graph', 'Lagrange Interpolation',
+                                     'lagrange', x_vals, y_vals, output_format)
+
+
+@_cached_plot
+def plot_neville_interpolation_graph(x_vals, y_vals, filename="neville_interpolation.png", output_format="png"):
     """
-    Plots and saves a Cubic Spline interpolation graph using the cubic_spline_interpolation function.
+    Plots and saves a Neville interpolation graph.
 
     Parameters:
         x_vals (list): x data points.
         y_vals (list): corresponding y values.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
 
     Raises:
         ValueError: if x_vals and y_vals have different lengths.
         Exception: for any general error.
     """
-    try:
-        if len(x_vals) != len(y_vals):
-            raise ValueError("x_vals and y_vals must be the same length.")
+    return _plot_interpolation_graph('plot_neville_interpolation_graph', 'Neville Interpolation',
+                                     'neville', x_vals, y_vals, output_format)
 
-        # Generate 300 x values within the range for smooth plotting
-        xs = np.linspace(min(x_vals), max(x_vals), 300)
-        
-        # Calculate interpolated y values for each x in xs
-        ys = [cubic_spline_interpolation(x_vals, y_vals, xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(x_vals, y_vals, 'o', label='Data Points')  # plot original data points as dots
-        plt.plot(xs, ys, '-', label='Cubic Spline Interpolation')  # plot interpolated curve
-        plt.xlabel('X')
-        plt.ylabel('Y')
-        plt.title('Cubic Spline Interpolation Graph')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
 
-    except Exception as e:
-        print(f"Error in plot_cubic_spline_interpolation_graph: {e}")
-        raise
+@_cached_plot
+def plot_cubic_spline_interpolation_graph(x_vals, y_vals, filename="cubic_spline_interpolation.png", output_format="png"):
+    """
+    Plots and saves a Cubic Spline interpolation graph.
 
-def plot_bisection_graph(func, a, b, tol=1e-5, filename="bisection_method.png"):
+    Parameters:
+        x_vals (list): x data points.
+        y_vals (list): corresponding y values.
+        filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
+
+    Raises:
+        ValueError: if x_vals and y_vals have different lengths.
+        Exception: for any general error.
+    """
+    return _plot_interpolation_graph('plot_cubic_spline_interpolation_graph', 'Cubic Spline Interpolation',
+                                     'cubic_spline', x_vals, y_vals, output_format)
+
+
+def plot_bisection_graph(func, a, b, tol=1e-5, filename="bisection_method.png", output_format="png"):
     """
     Plots and saves a graph for the Bisection method showing the function and the root found.
 
@@ -265,43 +721,12 @@ def plot_bisection_graph(func, a, b, tol=1e-5, filename="bisection_method.png"):
         b (float): end of interval.
         tol (float): tolerance.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
     """
-    try:
-        # Calculate root using Bisection_Method
-        root = Bisection_Method(func, a, b, tol)
-
-        # Generate x values for plotting
-        xs = np.linspace(a - 1, b + 1, 300)
-        ys = [func(xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(xs, ys, label='Function f(x)')
-        plt.axhline(0, color='black', linewidth=0.5)  # x-axis
-        plt.plot(root, func(root), 'ro', label=f'Root at x={root:.5f}')  # root point
-        plt.xlabel('X')
-        plt.ylabel('f(X)')
-        plt.title('Bisection Method Root Finding')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
+    return solve_and_plot_root('bisection', func, a, b, tol=tol, output_format=output_format)[1]
 
-    except Exception as e:
-        print(f"Error in plot_bisection_graph: {e}")
-        raise
 
-def plot_newtonraphson_graph(func, dfunc, x0, tol=1e-5, filename="newtonraphson_method.png"):
+def plot_newtonraphson_graph(func, dfunc, x0, tol=1e-5, filename="newtonraphson_method.png", output_format="png"):
     """
     Plots and saves a graph for the Newton-Raphson method showing the function and the root found.
 
@@ -311,43 +736,12 @@ def plot_newtonraphson_graph(func, dfunc, x0, tol=1e-5, filename="newtonraphson_
         x0 (float): initial guess.
         tol (float): tolerance.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
     """
-    try:
-        # Calculate root using Newton-Raphson
-        root = Newton_Raphson(func, dfunc, x0, tol)
-
-        # Generate x values for plotting
-        xs = np.linspace(x0 - 2, x0 + 2, 300)
-        ys = [func(xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(xs, ys, label='Function f(x)')
-        plt.axhline(0, color='black', linewidth=0.5)  # x-axis
-        plt.plot(root, func(root), 'ro', label=f'Root at x={root:.5f}')  # root point
-        plt.xlabel('X')
-        plt.ylabel('f(X)')
-        plt.title('Newton-Raphson Method Root Finding')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
+    return solve_and_plot_root('newton_raphson', func, x0, dfunc=dfunc, tol=tol, output_format=output_format)[1]
 
-    except Exception as e:
-        print(f"Error in plot_newtonraphson_graph: {e}")
-        raise
 
-def plot_secant_graph(func, x0, x1, tol=1e-5, filename="secant_method.png"):
+def plot_secant_graph(func, x0, x1, tol=1e-5, filename="secant_method.png", output_format="png"):
     """
     Plots and saves a graph for the Secant method showing the function and the root found.
 
@@ -357,38 +751,47 @@ def plot_secant_graph(func, x0, x1, tol=1e-5, filename="secant_method.png"):
         x1 (float): second initial guess.
         tol (float): tolerance.
         filename (str): name of the image file to save the plot.
+        output_format (str): "png" or "svg" image, or "series" for the sampled curve.
+    """
+    return solve_and_plot_root('secant', func, x0, x1, tol=tol, output_format=output_format)[1]
+
+
+@_cached_plot
+def plot_grid_interpolation_graph(interpolant, resolution=200, title="Grid Interpolation Graph"):
+    """
+    Plots a 2-D grid interpolant as a color map over its whole grid.
+
+    Parameters:
+        interpolant (GridInterpolant): bilinear or bicubic grid interpolant.
+        resolution (int): number of samples along each axis.
+        title (str): title of the plot.
+
+    Raises:
+        ValueError: if resolution is smaller than 2.
+        Exception: for any general error.
     """
     try:
-        # Calculate root using Secant_Method
-        root = Secant_Method(func, x0, x1, tol)
-
-        # Generate x values for plotting
-        xs = np.linspace(x0 - 2, x1 + 2, 300)
-        ys = [func(xi) for xi in xs]
-
-        # Create the plot
-        plt.figure()
-        plt.plot(xs, ys, label='Function f(x)')
-        plt.axhline(0, color='black', linewidth=0.5)  # x-axis
-        plt.plot(root, func(root), 'ro', label=f'Root at x={root:.5f}')  # root point
-        plt.xlabel('X')
-        plt.ylabel('f(X)')
-        plt.title('Secant Method Root Finding')
-        plt.legend()
-        plt.grid(True)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-        return image_base64
-
-        # # Save and show the plot
-        # plt.savefig(filename)
-        # plt.show()
-        # plt.close()
+        if resolution < 2:
+            raise ValueError("resolution must be at least 2.")
+
+        # Evaluate the whole sampling grid in one vectorized call
+        xs = np.linspace(interpolant.x[0], interpolant.x[-1], resolution)
+        ys = np.linspace(interpolant.y[0], interpolant.y[-1], resolution)
+        zs = interpolant(xs[:, None], ys[None, :])
+
+        figure, axes = _new_figure()
+        image = axes.imshow(zs.T, origin='lower', aspect='auto',
+                            extent=(xs[0], xs[-1], ys[0], ys[-1]))  # rows of zs.T run along y
+        figure.colorbar(image, label='Z')
+        grid_x, grid_y = np.meshgrid(interpolant.x, interpolant.y, indexing='ij')
+        axes.plot(grid_x.ravel(), grid_y.ravel(), 'k.', markersize=3, label='Grid Points')
+        axes.set_xlabel('X')
+        axes.set_ylabel('Y')
+        axes.set_title(title)
+        axes.legend()
+
+        return _render_base64(figure)
 
     except Exception as e:
-        print(f"Error in plot_secant_graph: {e}")
+        print(f"Error in plot_grid_interpolation_graph: {e}")
         raise
@@ -178,3 +178,141 @@ def matrix_inverse(matrix):
                 identity = np.dot(elementary_matrix, identity)
 
     return identity
+
+
+def lu_factor(matrix):
+    """
+    LU factorization with partial pivoting, P A = L U, in the dtype of matrix.
+
+    Parameters:
+        matrix (numpy.ndarray): The square matrix A.
+
+    Returns:
+        tuple: lu, holding U on and above the diagonal and the multipliers of
+        the unit lower triangular L below it, and perm, the row order of P A.
+
+    Raises:
+        ValueError: If the matrix is not square or is singular.
+    """
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Input matrix must be square.")
+
+    lu = np.array(matrix, copy=True)
+    n = lu.shape[0]
+    perm = np.arange(n)
+
+    for k in range(n):
+        # Partial pivoting: bring the largest entry of the column to the diagonal
+        pivot = k + int(np.argmax(np.abs(lu[k:, k])))
+        if lu[pivot, k] == 0:
+            raise ValueError("Matrix is singular, cannot factorize it.")
+        if pivot != k:
+            lu[[k, pivot]] = lu[[pivot, k]]
+            perm[[k, pivot]] = perm[[pivot, k]]
+
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+    return lu, perm
+
+
+def lu_solve(lu, perm, constants, transpose=False):
+    """
+    Solve A x = b, or A^T x = b, with a factorization from lu_factor.
+
+    The substitutions run in the dtype of lu.
+
+    Parameters:
+        lu (numpy.ndarray): Combined L and U factors.
+        perm (numpy.ndarray): Row order from lu_factor.
+        constants (numpy.ndarray): Right-hand side b, a vector or one column per system.
+        transpose (bool, optional): Solve with A^T instead of A (default is False).
+
+    Returns:
+        numpy.ndarray: The solution x.
+    """
+    n = lu.shape[0]
+    if not transpose:
+        # L y = P b, then U x = y
+        x = np.array(constants, dtype=lu.dtype)[perm]
+        for i in range(1, n):
+            x[i] -= lu[i, :i] @ x[:i]
+        for i in range(n - 1, -1, -1):
+            x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+        return x
+
+    # U^T z = b, then L^T w = z, and x = P^T w
+    z = np.array(constants, dtype=lu.dtype)
+    for i in range(n):
+        z[i] = (z[i] - lu[:i, i] @ z[:i]) / lu[i, i]
+    for i in range(n - 2, -1, -1):
+        z[i] -= lu[i + 1:, i] @ z[i + 1:]
+    x = np.empty_like(z)
+    x[perm] = z
+    return x
+
+
+def estimate_inverse_norm(lu, perm, max_steps=5):
+    """
+    Estimate the infinity norm of A^-1 from a factorization of A (Hager's method).
+
+    ||A^-1|| (infinity norm) is the 1-norm of A^-T, which Hager's method
+    estimates from a few solves with A and A^T instead of forming the inverse.
+    The estimate is a lower bound and usually exact or close.
+
+    Parameters:
+        lu (numpy.ndarray): Combined L and U factors from lu_factor.
+        perm (numpy.ndarray): Row order from lu_factor.
+        max_steps (int, optional): Maximum number of solve pairs (default is 5).
+
+    Returns:
+        float: The estimated norm.
+    """
+    n = lu.shape[0]
+    x = np.full(n, 1.0 / n, dtype=lu.dtype)
+    estimate = 0.0
+
+    for step in range(max_steps):
+        y = lu_solve(lu, perm, x, transpose=True)  # y = A^-T x
+        estimate = float(np.abs(y).sum())
+        signs = np.where(y >= 0, 1.0, -1.0).astype(lu.dtype)
+        z = lu_solve(lu, perm, signs)  # z = A^-1 sign(y)
+        j = int(np.argmax(np.abs(z)))
+        if step > 0 and abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n, dtype=lu.dtype)
+        x[j] = 1.0
+
+    return estimate
+
+
+def multicolor_ordering(matrix):
+    """
+    Split the unknowns of a system into colors: sets of rows that do not
+    couple with each other, so each set can be updated at once.
+
+    Rows i and j couple when A[i, j] or A[j, i] is nonzero. Colors are
+    assigned greedily in row order, which gives the red-black checkerboard
+    for 5-point grid stencils; a fully coupled matrix needs one color per row.
+
+    Parameters:
+        matrix (numpy.ndarray or list of lists): Coefficient matrix A.
+
+    Returns:
+        list of numpy.ndarray: The row indices of each color, in update order.
+    """
+    pattern = np.asarray(matrix) != 0
+    pattern |= pattern.T
+    np.fill_diagonal(pattern, False)
+
+    n = pattern.shape[0]
+    colors = np.full(n, -1)
+    for i in range(n):
+        taken = set(colors[pattern[i]].tolist())
+        color = 0
+        while color in taken:
+            color += 1
+        colors[i] = color
+
+    return [np.flatnonzero(colors == color) for color in range(colors.max(initial=-1) + 1)]
@@ -0,0 +1,149 @@
+import functools
+import threading
+import time
+
+import numpy as np
+
+# Opt-in measurements of the numerical code: function evaluations, time per
+# algorithm call and iteration counts, aggregated per name.
+#
+# While disabled, counted() and timed() return the function unchanged and
+# record_iterations() returns at once, so the algorithms run exactly as
+# without instrumentation. Wrappers are created at call time, so enable()
+# only affects functions wrapped afterwards.
+
+_enabled = False
+_lock = threading.Lock()
+_metrics = {}
+
+
+def enable():
+    """Start recording measurements."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording measurements; recorded values are kept until reset()."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+    Returns:
+        bool: Whether measurements are recorded.
+    """
+    return _enabled
+
+
+def _record(name, calls=0, seconds=0.0, evaluations=0, iterations=0):
+    with _lock:
+        entry = _metrics.get(name)
+        if entry is None:
+            entry = _metrics[name] = {"calls": 0, "seconds": 0.0, "evaluations": 0, "iterations": 0}
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+        entry["evaluations"] += evaluations
+        entry["iterations"] += iterations
+
+
+def counted(func, name):
+    """
+    Count the evaluations of a user function, e.g. the integrand.
+
+    A vectorized call counts one evaluation per array element. Only calls
+    that return a usable result are counted: a call that raises, or an array
+    call that does not return one value per element, is not, so the
+    point-by-point fallback of graphs.evaluate_batch is counted instead of
+    the failed array call.
+
+    Parameters:
+        func (function): The function to count.
+        name (str): Name the evaluations are recorded under, usually the algorithm.
+
+    Returns:
+        function: A counting wrapper, or func itself while disabled.
+    """
+    if not _enabled:
+        return func
+
+    @functools.wraps(func)
+    def counting(x, *args, **kwargs):
+        result = func(x, *args, **kwargs)
+        if np.ndim(x) == 0 or np.shape(result) == np.shape(x):
+            _record(name, evaluations=np.size(x))
+        return result
+    return counting
+
+
+def timed(func, name=None):
+    """
+    Record the number of calls of an algorithm and the time they take.
+
+    Parameters:
+        func (function): The algorithm.
+        name (str, optional): Name to record under (default is the function name).
+
+    Returns:
+        function: A timing wrapper, or func itself while disabled.
+    """
+    if not _enabled:
+        return func
+    name = name or func.__name__
+
+    @functools.wraps(func)
+    def timing(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, calls=1, seconds=time.perf_counter() - start)
+    return timing
+
+
+def record_iterations(name, count):
+    """
+    Record the iterations an algorithm needed; a no-op while disabled.
+
+    Parameters:
+        name (str): Name of the algorithm.
+        count (int): Number of iterations.
+    """
+    if _enabled:
+        _record(name, iterations=count)
+
+
+def record_evaluations(name, count):
+    """
+    Record function evaluations counted by the caller; a no-op while disabled.
+
+    Parameters:
+        name (str): Name of the algorithm.
+        count (int): Number of evaluations.
+    """
+    if _enabled:
+        _record(name, evaluations=count)
+
+
+def snapshot(reset=False):
+    """
+    Return the recorded measurements.
+
+    Parameters:
+        reset (bool, optional): Clear them afterwards (default is False).
+
+    Returns:
+        dict: For each name, calls, seconds, evaluations and iterations.
+    """
+    with _lock:
+        result = {name: dict(entry) for name, entry in _metrics.items()}
+        if reset:
+            _metrics.clear()
+    return result
+
+
+def reset():
+    """Clear the recorded measurements."""
+    with _lock:
+        _metrics.clear()
@@ -1,7 +1,27 @@
 import numpy as np
 
+from analiza_lib.machine_precision import float_dtype
 
-def trapezoidal_rule(func, a, b, subintervals):
+# Python and NumPy scalars accepted as integration limits
+_NUMBERS = (int, float, np.integer, np.floating)
+
+
+def _in_dtype(func, a, b, dtype):
+    """
+    Prepare the integrand and the limits for computing in dtype.
+
+    float64 keeps Python floats, which are the fastest scalars; other types
+    convert the limits and every function value, so sums stay in dtype.
+    """
+    if dtype == np.float64:
+        return func, a, b
+
+    def converted(x):
+        return dtype.type(func(x))
+    return converted, dtype.type(a), dtype.type(b)
+
+
+def trapezoidal_rule(func, a, b, subintervals, dtype=None):
     """
     Trapezoidal Rule for Numerical Integration.
 
@@ -13,6 +33,8 @@ def trapezoidal_rule(func, a, b, subintervals):
     a (float): The lower limit of integration.
     b (float): The upper limit of integration.
     subintervals (int): The number of subintervals (must be >= 1).
+    dtype (str or numpy.dtype, optional): float32, float64 or longdouble to compute in
+        (default is the type of a and b; float64 for Python numbers).
 
     Returns:
     float: The approximate definite integral.
@@ -25,7 +47,7 @@ def trapezoidal_rule(func, a, b, subintervals):
     if not isinstance(subintervals, int):
         raise ValueError("The segment can only be divided into whole numbers.")
 
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+    if not isinstance(a, _NUMBERS) or not isinstance(b, _NUMBERS):
         raise ValueError("a and b must be numbers.")
 
     if not callable(func):
@@ -37,6 +59,7 @@ def trapezoidal_rule(func, a, b, subintervals):
     if subintervals < 1:
         raise ValueError("The segment cannot be divided by less than 1.")
 
+    func, a, b = _in_dtype(func, a, b, float_dtype(dtype, a, b))
 
     height = (b - a) / subintervals
     integral = 0.5 * (func(a) + func(b))  # Initialize with endpoints
@@ -50,7 +73,7 @@ def trapezoidal_rule(func, a, b, subintervals):
     return integral
 
 
-def simpsons_rule(func, a, b, subintervals):
+def simpsons_rule(func, a, b, subintervals, dtype=None):
     """
     Simpson's Rule for Numerical Integration.
 
@@ -63,6 +86,8 @@ def simpsons_rule(func, a, b, subintervals):
     a (float): The lower limit of integration.
     b (float): The upper limit of integration.
     subintervals (int): The number of subintervals (must be even and >= 2).
+    dtype (str or numpy.dtype, optional): float32, float64 or longdouble to compute in
+        (default is the type of a and b; float64 for Python numbers).
 
     Returns:
     float: The approximate definite integral.
@@ -74,7 +99,7 @@ def simpsons_rule(func, a, b, subintervals):
     if not isinstance(subintervals, int):
         raise ValueError("The segment can only be divided into whole numbers.")
 
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+    if not isinstance(a, _NUMBERS) or not isinstance(b, _NUMBERS):
         raise ValueError("a and b must be numbers.")
 
     if not callable(func):
@@ -89,6 +114,8 @@ def simpsons_rule(func, a, b, subintervals):
     if subintervals < 2:
         raise ValueError("Number of subintervals (n) must be at least 2.")
 
+    func, a, b = _in_dtype(func, a, b, float_dtype(dtype, a, b))
+
     height = (b - a) / subintervals
 
     integral = func(a) + func(b)  # Initialize with endpoints
@@ -105,7 +132,7 @@ def simpsons_rule(func, a, b, subintervals):
     return integral
 
 
-def romberg_integration(func, a, b, iterations):
+def romberg_integration(func, a, b, iterations, dtype=None):
     """
     Romberg Integration for Numerical Integration.
 
@@ -117,6 +144,8 @@ def romberg_integration(func, a, b, iterations):
     a (float): The lower limit of integration.
     b (float): The upper limit of integration.
     iterations (int): The number of Romberg iterations (must be >= 1).
+    dtype (str or numpy.dtype, optional): float32, float64 or longdouble to compute in
+        (default is the type of a and b; float64 for Python numbers).
 
     Returns:
     float: The approximate definite integral.
@@ -128,7 +157,7 @@ def romberg_integration(func, a, b, iterations):
     if not isinstance(iterations, int):
         raise ValueError("n must be an integer.")
 
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+    if not isinstance(a, _NUMBERS) or not isinstance(b, _NUMBERS):
         raise ValueError("a and b must be numbers.")
 
     if not callable(func):
@@ -140,9 +169,11 @@ def romberg_integration(func, a, b, iterations):
     if iterations < 1:
         raise ValueError("iterations cannot be smaller than 1.")
 
+    dtype = float_dtype(dtype, a, b)
+    func, a, b = _in_dtype(func, a, b, dtype)
 
     height = b - a
-    result = np.zeros((iterations, iterations), dtype=float)
+    result = np.zeros((iterations, iterations), dtype=dtype)
 
     result[0, 0] = 0.5 * height * (func(a) + func(b))
 
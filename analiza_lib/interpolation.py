@@ -1,3 +1,11 @@
+import json
+
+import numpy as np
+
+from analiza_lib import kernels
+from analiza_lib.machine_precision import float_dtype
+
+
 def linear_interpolation(x_vals, y_vals, x):
     """
     Performs linear interpolation for a given point x using x_vals and y_vals.
@@ -145,6 +153,32 @@ def neville(x_vals, y_vals, x_interpolate):
         raise ValueError("x points, y points, and x_interpolate must contain numeric values")
 
 
+    kernel = kernels.get("neville_column")
+    if kernel is not None:
+        if len(set(x_vals)) != n:
+            raise ValueError("There are 2 x points with the same value")
+        return float(kernel(np.array(x_vals), np.array(y_vals), x_interpolate))
+
+    return _neville_tableau(x_vals, y_vals, x_interpolate)
+
+
+def _neville_tableau(x_vals, y_vals, x_interpolate):
+    """
+    Neville's tableau in lists of Python floats, the path used without numba.
+
+    Parameters:
+        x_vals (list of float): List of x data points.
+        y_vals (list of float): Corresponding y-values.
+        x_interpolate (float): The x-value to interpolate.
+
+    Returns:
+        float: The interpolated y-value at the given x.
+
+    Raises:
+        ValueError: If x-values are duplicated.
+    """
+    n = len(x_vals)
+
     # Initialize the tableau
     tableau = [[0.0] * n for _ in range(n)]
     for i in range(n):
@@ -231,3 +265,546 @@ def cubic_spline_interpolation(x_vals, y_vals, x_interp):
 
     except Exception as e:
         return f"Error: {e}"
+
+
+def _as_float_table(x_vals, y_vals, min_points, dtype=None):
+    """
+    Validate a data table and convert it to floating-point NumPy arrays.
+
+    Parameters:
+        x_vals (list of float): x data points.
+        y_vals (list of float): Corresponding y-values.
+        min_points (int): Minimum number of data points required.
+        dtype (str or numpy.dtype, optional): float32, float64 or longdouble
+            (default is the type of the inputs; float64 for lists).
+
+    Returns:
+        tuple of numpy.ndarray: The x and y arrays.
+
+    Raises:
+        ValueError: If the lists are mismatched, too short, or non-numeric.
+    """
+    if len(x_vals) != len(y_vals):
+        raise ValueError("x and y lists must be the same length")
+    if len(x_vals) < min_points:
+        raise ValueError(f"At least {min_points} data points are required")
+    dtype = float_dtype(dtype, x_vals, y_vals)
+    try:
+        x = np.array(x_vals, dtype=dtype)
+        y = np.array(y_vals, dtype=dtype)
+    except (TypeError, ValueError):
+        raise ValueError("x points and y points must contain numeric values")
+    if x.ndim != 1 or y.ndim != 1:
+        raise ValueError("x points and y points must be one-dimensional")
+    return x, y
+
+
+class PiecewisePolynomial:
+    """
+    Piecewise polynomial in local power form.
+
+    On the interval [breaks[i], breaks[i + 1]] the value is
+    sum(coefficients[j, i] * (x - breaks[i]) ** j for j in range(order)).
+    The coefficient arrays are built once, so any number of points can be
+    evaluated without rebuilding the interpolant. Evaluation computes in the
+    floating-point type of the coefficients, e.g. float32 for half the memory.
+
+    Parameters:
+        breaks (numpy.ndarray): Sorted interval end points, length m + 1.
+        coefficients (numpy.ndarray): Local coefficients, shape (order, m).
+        extrapolate (bool, optional): Evaluate outside [breaks[0], breaks[-1]]
+            with the end pieces instead of raising (default is False).
+    """
+
+    array_fields = ("breaks", "coefficients")
+
+    def __init__(self, breaks, coefficients, extrapolate=False):
+        dtype = float_dtype(None, breaks, coefficients)
+        self.breaks = np.asarray(breaks, dtype=dtype)
+        self.coefficients = np.asarray(coefficients, dtype=dtype)
+        self.extrapolate = extrapolate
+
+        if self.breaks.ndim != 1 or len(self.breaks) < 2:
+            raise ValueError("At least two break points are required")
+        if self.coefficients.ndim != 2 or self.coefficients.shape[1] != len(self.breaks) - 1:
+            raise ValueError("coefficients must have shape (order, number of intervals)")
+        if np.any(np.diff(self.breaks) <= 0):
+            raise ValueError("x values must be sorted in ascending order without duplicates")
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the coefficient arrays, in bytes."""
+        return self.breaks.nbytes + self.coefficients.nbytes
+
+    def save(self, path):
+        """
+        Save the interpolant to a binary file, see save_interpolant.
+
+        Parameters:
+            path (str): Destination file path.
+        """
+        save_interpolant(self, path)
+
+    def interval_index(self, x):
+        """
+        Find the interval of each query point.
+
+        Parameters:
+            x (numpy.ndarray): Query points.
+
+        Returns:
+            numpy.ndarray: Index i such that breaks[i] <= x <= breaks[i + 1].
+        """
+        index = np.searchsorted(self.breaks, x, side="right") - 1
+        return np.clip(index, 0, len(self.breaks) - 2)
+
+    def __call__(self, x):
+        """
+        Evaluate the polynomial at one point or an array of points.
+
+        Parameters:
+            x (float or array-like): The x-value(s) to interpolate.
+
+        Returns:
+            float or numpy.ndarray: The interpolated value(s).
+
+        Raises:
+            ValueError: If a point is outside the table and extrapolate is False.
+        """
+        points = np.asarray(x, dtype=self.coefficients.dtype)
+        if not self.extrapolate and points.size and (
+                points.min() < self.breaks[0] or points.max() > self.breaks[-1]):
+            raise ValueError("The point is outside the range of the table")
+
+        index = self.interval_index(points)
+        dx = points - self.breaks[index]
+
+        # Horner's scheme over the local coefficients
+        result = self.coefficients[-1, index]
+        for j in range(self.coefficients.shape[0] - 2, -1, -1):
+            result = result * dx + self.coefficients[j, index]
+
+        if np.ndim(x) == 0:
+            return float(result)
+        return result
+
+    def derivative(self):
+        """
+        Differentiate every piece analytically.
+
+        Returns:
+            PiecewisePolynomial: The derivative, one degree lower.
+        """
+        order = self.coefficients.shape[0]
+        if order == 1:
+            return PiecewisePolynomial(self.breaks, np.zeros_like(self.coefficients), self.extrapolate)
+        powers = np.arange(1, order, dtype=self.coefficients.dtype)[:, None]
+        return PiecewisePolynomial(self.breaks, self.coefficients[1:] * powers, self.extrapolate)
+
+    def antiderivative(self):
+        """
+        Integrate every piece analytically.
+
+        The integration constants make the result continuous and zero at breaks[0].
+
+        Returns:
+            PiecewisePolynomial: The antiderivative, one degree higher.
+        """
+        order = self.coefficients.shape[0]
+        powers = np.arange(1, order + 1, dtype=self.coefficients.dtype)[:, None]
+        coefficients = np.zeros((order + 1, self.coefficients.shape[1]), dtype=self.coefficients.dtype)
+        coefficients[1:] = self.coefficients / powers
+
+        # Integral of each full piece, accumulated into the constant terms
+        h = np.diff(self.breaks)
+        piece_integrals = np.sum(coefficients[1:] * h ** powers, axis=0)
+        coefficients[0, 1:] = np.cumsum(piece_integrals[:-1])
+        return PiecewisePolynomial(self.breaks, coefficients, self.extrapolate)
+
+    def integrate(self, a, b):
+        """
+        Compute the exact integral from a to b.
+
+        Parameters:
+            a (float or array-like): Lower limit(s) of integration.
+            b (float or array-like): Upper limit(s) of integration.
+
+        Returns:
+            float or numpy.ndarray: The integral(s); negative when b < a.
+
+        Raises:
+            ValueError: If a limit is outside the table and extrapolate is False.
+        """
+        antiderivative = self.antiderivative()
+        return antiderivative(b) - antiderivative(a)
+
+
+class LinearInterpolant(PiecewisePolynomial):
+    """
+    Precomputed piecewise linear interpolant of a data table.
+
+    Parameters:
+        x_vals (list of float): Sorted list of x data points.
+        y_vals (list of float): Corresponding y-values.
+        dtype (str or numpy.dtype, optional): Floating-point type of the
+            coefficients (default is the type of the inputs; float64 for lists).
+
+    Raises:
+        ValueError: For invalid input or unsorted x values.
+    """
+
+    def __init__(self, x_vals, y_vals, dtype=None):
+        x, y = _as_float_table(x_vals, y_vals, 2, dtype)
+        slopes = np.diff(y) / np.diff(x)
+        super().__init__(x, np.vstack([y[:-1], slopes]))
+
+
+class CubicSplineInterpolant(PiecewisePolynomial):
+    """
+    Precomputed natural cubic spline of a data table.
+
+    Uses the same tridiagonal construction as cubic_spline_interpolation,
+    but keeps the a, b, c, d coefficients so the spline is built only once.
+
+    Parameters:
+        x_vals (list of float): Sorted list of x data points.
+        y_vals (list of float): Corresponding y-values.
+        dtype (str or numpy.dtype, optional): Floating-point type of the
+            coefficients (default is the type of the inputs; float64 for lists).
+
+    Raises:
+        ValueError: For invalid input or unsorted x values.
+    """
+
+    def __init__(self, x_vals, y_vals, dtype=None):
+        x, y = _as_float_table(x_vals, y_vals, 3, dtype)
+        h = np.diff(x)
+        if np.any(h <= 0):
+            raise ValueError("x values must be sorted in ascending order.")
+
+        n = len(x)
+        slopes = np.diff(y) / h
+        alpha = 3 * (slopes[1:] - slopes[:-1])
+
+        # Solve the tridiagonal system for c (Thomas algorithm)
+        mu = np.zeros(n, dtype=x.dtype)
+        z = np.zeros(n, dtype=x.dtype)
+        for i in range(1, n - 1):
+            l_i = 2 * (x[i + 1] - x[i - 1]) - h[i - 1] * mu[i - 1]
+            mu[i] = h[i] / l_i
+            z[i] = (alpha[i - 1] - h[i - 1] * z[i - 1]) / l_i
+
+        c = np.zeros(n, dtype=x.dtype)
+        for j in range(n - 2, -1, -1):
+            c[j] = z[j] - mu[j] * c[j + 1]
+
+        b = slopes - h * (c[1:] + 2 * c[:-1]) / 3
+        d = (c[1:] - c[:-1]) / (3 * h)
+        super().__init__(x, np.vstack([y[:-1], b, c[:-1], d]))
+
+
+class PolynomialInterpolant:
+    """
+    Precomputed interpolating polynomial in barycentric Lagrange form.
+
+    The barycentric weights are computed once in O(n^2); each evaluation
+    then costs O(n) per point instead of rebuilding the Lagrange terms.
+    Lagrange, Neville and polynomial interpolation all produce this
+    same polynomial.
+
+    Parameters:
+        x_vals (list of float): List of x data points.
+        y_vals (list of float): Corresponding y-values.
+        extrapolate (bool, optional): Allow points outside the table (default is True).
+        dtype (str or numpy.dtype, optional): Floating-point type of the nodes,
+            values and weights (default is the type of the inputs; float64 for lists).
+
+    Raises:
+        ValueError: If inputs are invalid or x-values are duplicated.
+    """
+
+    array_fields = ("x", "y", "weights")
+
+    def __init__(self, x_vals, y_vals, extrapolate=True, dtype=None):
+        self.x, self.y = _as_float_table(x_vals, y_vals, 1, dtype)
+        self.extrapolate = extrapolate
+
+        differences = self.x[:, None] - self.x[None, :]
+        np.fill_diagonal(differences, 1.0)
+        if np.any(differences == 0):
+            raise ValueError("There are 2 x points with the same value")
+        # Scaling every weight by the same factor leaves the polynomial
+        # unchanged; differences scaled to an interval of length 4 keep the
+        # products of many nodes from overflowing or underflowing
+        span = self.x.max() - self.x.min()
+        if span > 0:
+            differences *= 4 / span
+            np.fill_diagonal(differences, 1.0)
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            weights = 1.0 / np.prod(differences, axis=1)
+            weights /= np.abs(weights).max()
+        if not np.all(np.isfinite(weights)) or np.any(weights == 0):
+            raise ValueError("The barycentric weights cannot be represented; use fewer nodes or a spline")
+        self.weights = weights
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the node, value and weight arrays, in bytes."""
+        return self.x.nbytes + self.y.nbytes + self.weights.nbytes
+
+    def save(self, path):
+        """
+        Save the interpolant to a binary file, see save_interpolant.
+
+        Parameters:
+            path (str): Destination file path.
+        """
+        save_interpolant(self, path)
+
+    def __call__(self, x):
+        """
+        Evaluate the polynomial at one point or an array of points.
+
+        Parameters:
+            x (float or array-like): The x-value(s) to interpolate.
+
+        Returns:
+            float or numpy.ndarray: The interpolated value(s).
+
+        Raises:
+            ValueError: If a point is outside the table and extrapolate is False.
+        """
+        return self._evaluate(x, self.extrapolate)
+
+    def _evaluate(self, x, extrapolate):
+        # Evaluation with the range check passed in, so callers never toggle
+        # the attribute of an interpolant that other threads may be using
+        points = np.asarray(x, dtype=self.x.dtype)
+        if not extrapolate and points.size and (
+                points.min() < self.x.min() or points.max() > self.x.max()):
+            raise ValueError("The point is outside the range of the table")
+
+        flat = points.reshape(-1)
+        diff = flat[:, None] - self.x[None, :]
+        exact_rows, exact_cols = np.nonzero(diff == 0)
+        diff[exact_rows] = 1.0
+
+        terms = self.weights / diff
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (terms @ self.y) / terms.sum(axis=1)
+        # Points that coincide with a node take the tabulated value
+        result[exact_rows] = self.y[exact_cols]
+
+        if np.ndim(x) == 0:
+            return float(result[0])
+        return result.reshape(points.shape)
+
+    def _with_values(self, x, y, weights):
+        # Build a polynomial on known nodes without recomputing validation
+        polynomial = object.__new__(PolynomialInterpolant)
+        polynomial.x, polynomial.y, polynomial.weights = x, y, weights
+        polynomial.extrapolate = self.extrapolate
+        return polynomial
+
+    def derivative(self):
+        """
+        Differentiate the polynomial with the barycentric differentiation matrix.
+
+        The derivative has lower degree, so it is represented exactly by its
+        values on the same nodes.
+
+        Returns:
+            PolynomialInterpolant: The derivative.
+        """
+        differences = self.x[:, None] - self.x[None, :]
+        np.fill_diagonal(differences, 1.0)
+        matrix = (self.weights[None, :] / self.weights[:, None]) / differences
+        np.fill_diagonal(matrix, 0.0)
+        np.fill_diagonal(matrix, -matrix.sum(axis=1))
+        return self._with_values(self.x, matrix @ self.y, self.weights)
+
+    def integrate(self, a, b):
+        """
+        Compute the exact integral from a to b with Gauss-Legendre quadrature.
+
+        n // 2 + 1 nodes integrate a polynomial of degree n - 1 exactly.
+
+        Parameters:
+            a (float or array-like): Lower limit(s) of integration.
+            b (float or array-like): Upper limit(s) of integration.
+
+        Returns:
+            float or numpy.ndarray: The integral(s); negative when b < a.
+
+        Raises:
+            ValueError: If a limit is outside the table and extrapolate is False.
+        """
+        return self._integrate(a, b, self.extrapolate)
+
+    def _integrate(self, a, b, extrapolate):
+        lower, upper = np.broadcast_arrays(np.asarray(a, dtype=self.x.dtype), np.asarray(b, dtype=self.x.dtype))
+        nodes, weights = np.polynomial.legendre.leggauss(len(self.x) // 2 + 1)
+        nodes, weights = nodes.astype(self.x.dtype), weights.astype(self.x.dtype)
+
+        half_width = (upper - lower)[..., None] / 2
+        midpoint = (upper + lower)[..., None] / 2
+        self._evaluate(np.stack([lower, upper]), extrapolate)  # range check of the limits
+        values = self._evaluate(midpoint + half_width * nodes, extrapolate)
+        result = np.sum(values * weights, axis=-1) * half_width[..., 0]
+
+        if np.ndim(a) == 0 and np.ndim(b) == 0:
+            return float(result)
+        return result
+
+    def antiderivative(self):
+        """
+        Integrate the polynomial, zero at the first data point.
+
+        The antiderivative is one degree higher, so one extra node is placed
+        in the middle of the widest gap between the data points.
+
+        Returns:
+            PolynomialInterpolant: The antiderivative.
+        """
+        order = np.argsort(self.x)
+        sorted_x = self.x[order]
+        if len(sorted_x) == 1:
+            extra = sorted_x[0] + 1.0
+        else:
+            widest = np.argmax(np.diff(sorted_x))
+            extra = (sorted_x[widest] + sorted_x[widest + 1]) / 2
+
+        nodes = np.append(self.x, extra)
+        values = self._integrate(self.x[0], nodes, True)
+        return PolynomialInterpolant(nodes, values, self.extrapolate)
+
+
+INTERPOLANTS = {
+    "linear": LinearInterpolant,
+    "polynomial": lambda x_vals, y_vals, dtype=None: PolynomialInterpolant(x_vals, y_vals, False, dtype),
+    "lagrange": PolynomialInterpolant,
+    "neville": PolynomialInterpolant,
+    "cubic_spline": CubicSplineInterpolant,
+}
+
+
+def make_interpolant(method, x_vals, y_vals, dtype=None):
+    """
+    Build a reusable interpolant for the given method.
+
+    Parameters:
+        method (str): One of "linear", "polynomial", "lagrange", "neville", "cubic_spline".
+        x_vals (list of float): x data points.
+        y_vals (list of float): Corresponding y-values.
+        dtype (str or numpy.dtype, optional): float32, float64 or longdouble to store and
+            evaluate in (default is the type of the inputs; float64 for lists).
+
+    Returns:
+        PiecewisePolynomial or PolynomialInterpolant: Callable interpolant.
+
+    Raises:
+        ValueError: If the method is unknown or the data is invalid.
+    """
+    if method not in INTERPOLANTS:
+        raise ValueError(f"Unknown interpolation method: {method}")
+    return INTERPOLANTS[method](x_vals, y_vals, dtype=dtype)
+
+
+INTERPOLANT_FILE_MAGIC = b"ANLZINT1"
+INTERPOLANT_FILE_ALIGNMENT = 64
+
+
+def save_interpolant(interpolant, path):
+    """
+    Save an interpolant to a compact binary file.
+
+    Layout: an 8-byte magic string, a 4-byte little-endian header length,
+    a JSON header describing the class and arrays, then the raw little-endian
+    arrays in their floating-point type, each aligned to 64 bytes so they can be memory-mapped.
+
+    Parameters:
+        interpolant (PiecewisePolynomial or PolynomialInterpolant): The interpolant to save.
+        path (str): Destination file path.
+
+    Raises:
+        ValueError: If the object is not a supported interpolant.
+    """
+    kind = type(interpolant).__name__
+    if kind not in INTERPOLANT_CLASSES:
+        raise ValueError(f"Cannot save objects of type {kind}")
+
+    arrays = [np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+              for array in (getattr(interpolant, name) for name in interpolant.array_fields)]
+
+    # The header size depends on the offsets, so lay the arrays out relative
+    # to a generously padded header and shift them once its size is known.
+    def build_header(data_start):
+        entries = []
+        offset = data_start
+        for name, array in zip(interpolant.array_fields, arrays):
+            entries.append({"name": name, "dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+            offset += -(-array.nbytes // INTERPOLANT_FILE_ALIGNMENT) * INTERPOLANT_FILE_ALIGNMENT
+        return json.dumps({"kind": kind, "extrapolate": interpolant.extrapolate, "arrays": entries}).encode()
+
+    prefix = len(INTERPOLANT_FILE_MAGIC) + 4
+    data_start = 0
+    header = build_header(data_start)
+    while data_start < prefix + len(header):
+        data_start = -(-(prefix + len(header)) // INTERPOLANT_FILE_ALIGNMENT) * INTERPOLANT_FILE_ALIGNMENT
+        header = build_header(data_start)
+
+    with open(path, "wb") as file:
+        file.write(INTERPOLANT_FILE_MAGIC)
+        file.write(len(header).to_bytes(4, "little"))
+        file.write(header)
+        for entry, array in zip(json.loads(header)["arrays"], arrays):
+            file.write(b"\0" * (entry["offset"] - file.tell()))
+            file.write(array.tobytes())
+
+
+def load_interpolant(path, mmap=True):
+    """
+    Load an interpolant saved with save_interpolant.
+
+    With mmap=True the arrays are read-only np.memmap views of the file, so
+    loading costs no copies and processes opening the same file share one
+    page-cache copy. Nothing is recomputed or re-validated.
+
+    Parameters:
+        path (str): Path of the saved file.
+        mmap (bool, optional): Memory-map the arrays instead of reading them (default is True).
+
+    Returns:
+        PiecewisePolynomial or PolynomialInterpolant: The loaded interpolant.
+
+    Raises:
+        ValueError: If the file is not a saved interpolant.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(INTERPOLANT_FILE_MAGIC)) != INTERPOLANT_FILE_MAGIC:
+            raise ValueError("Not an interpolant file")
+        header_length = int.from_bytes(file.read(4), "little")
+        header = json.loads(file.read(header_length))
+
+        if header.get("kind") not in INTERPOLANT_CLASSES:
+            raise ValueError(f"Unknown interpolant type: {header.get('kind')}")
+
+        interpolant = object.__new__(INTERPOLANT_CLASSES[header["kind"]])
+        interpolant.extrapolate = header["extrapolate"]
+        for entry in header["arrays"]:
+            shape = tuple(entry["shape"])
+            if mmap:
+                array = np.memmap(path, dtype=entry["dtype"], mode="r", offset=entry["offset"], shape=shape)
+            else:
+                file.seek(entry["offset"])
+                count = int(np.prod(shape))
+                array = np.fromfile(file, dtype=entry["dtype"], count=count).reshape(shape)
+            setattr(interpolant, entry["name"], array)
+
+    return interpolant
+
+
+INTERPOLANT_CLASSES = {
+    cls.__name__: cls
+    for cls in (PiecewisePolynomial, LinearInterpolant, CubicSplineInterpolant, PolynomialInterpolant)
+}
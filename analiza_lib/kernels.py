@@ -0,0 +1,181 @@
+import os
+import warnings
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # optional: the pure-Python paths are used instead
+    numba = None
+
+# Numba-compiled versions of the sequential inner loops: the Gauss-Seidel
+# sweep and Neville's tableau. Each update depends on the one before it, so
+# NumPy cannot vectorize them, and in pure Python every element costs
+# microseconds of interpreter overhead.
+#
+# Kernels are compiled on first use when numba is installed, unless
+# ANALIZA_JIT=0. Before a compiled kernel is used, it is run next to the
+# pure-Python path on a fixed example; if the results disagree beyond
+# AGREEMENT_RTOL (or compiling fails) a warning is issued and the
+# pure-Python path stays in use. get() returns None whenever the caller
+# should take its pure-Python path.
+
+JIT_ENABLED = numba is not None and os.environ.get("ANALIZA_JIT", "1") != "0"
+
+# Largest relative difference accepted between the compiled and Python paths
+AGREEMENT_RTOL = 1e-10
+
+
+def gauss_seidel_sweep(matrix, constants, guess):
+    """
+    One Gauss-Seidel sweep over a NumPy system, updating guess in place.
+
+    Computes in the dtype of the arrays.
+
+    Parameters:
+        matrix (numpy.ndarray): Coefficient matrix A, including its diagonal.
+        constants (numpy.ndarray): Right-hand side vector b.
+        guess (numpy.ndarray): The current guess, overwritten with the next one.
+    """
+    n = guess.shape[0]
+    for i in range(n):
+        total = constants[i]
+        for j in range(n):
+            if j != i:
+                total -= matrix[i, j] * guess[j]
+        guess[i] = total / matrix[i, i]
+
+
+def neville_column(x_vals, y_vals, x):
+    """
+    Neville's tableau evaluated one column at a time in O(n) memory.
+
+    Column j overwrites column j - 1 from the top, since entry i of the new
+    column only needs entries i and i + 1 of the old one. The x values must
+    be distinct.
+
+    Parameters:
+        x_vals (numpy.ndarray): x data points.
+        y_vals (numpy.ndarray): Corresponding y-values.
+        x (float): The x-value to interpolate.
+
+    Returns:
+        float: The interpolated y-value, the top entry of the last column.
+    """
+    n = x_vals.shape[0]
+    column = y_vals.copy()
+    for j in range(1, n):
+        for i in range(n - j):
+            column[i] = ((x - x_vals[i + j]) * column[i] -
+                         (x - x_vals[i]) * column[i + 1]) / (x_vals[i] - x_vals[i + j])
+    return column[0]
+
+
+def _relative_difference(compiled, reference):
+    compiled = np.asarray(compiled, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    return float(np.abs(compiled - reference).max() / max(np.abs(reference).max(), np.finfo(float).tiny))
+
+
+def _check_gauss_seidel(kernel):
+    # Five sweeps on a diagonally dominant system, against the list-based sweep
+    from analiza_lib.solving_equations import _gauss_seidel_sweep
+
+    rng = np.random.default_rng(0)
+    matrix = rng.uniform(-1, 1, (20, 20))
+    matrix[np.diag_indices(20)] = np.abs(matrix).sum(axis=1) + 1
+    constants = rng.uniform(-10, 10, 20)
+
+    sweep, reference = _gauss_seidel_sweep(matrix.tolist(), constants.tolist(), [0.0] * 20, None, jit=False)
+    compiled = np.zeros(20)
+    for _ in range(5):
+        reference = sweep(reference)
+        kernel(matrix, constants, compiled)
+    return _relative_difference(compiled, reference)
+
+
+def _check_neville(kernel):
+    # Points inside and outside a random table, against the tableau in lists
+    from analiza_lib.interpolation import _neville_tableau
+
+    rng = np.random.default_rng(0)
+    x_vals = np.sort(rng.uniform(0, 10, 12))
+    y_vals = np.sin(x_vals)
+    points = [-1.0, 0.5, 3.3, 7.25, 11.0]
+    compiled = [kernel(x_vals, y_vals, x) for x in points]
+    reference = [_neville_tableau(x_vals.tolist(), y_vals.tolist(), x) for x in points]
+    return _relative_difference(compiled, reference)
+
+
+_KERNELS = {
+    "gauss_seidel_sweep": (gauss_seidel_sweep, _check_gauss_seidel),
+    "neville_column": (neville_column, _check_neville),
+}
+
+_selected = {}
+
+
+def _compile(name):
+    kernel, check = _KERNELS[name]
+    try:
+        compiled = numba.njit(cache=True)(kernel)
+        difference = check(compiled)
+    except Exception as e:
+        warnings.warn(f"Compiling the {name} kernel failed, using the Python path: {e}")
+        return None, None
+    if not difference <= AGREEMENT_RTOL:
+        warnings.warn(f"The compiled {name} kernel differs from the Python path by {difference:.3g}, "
+                      f"using the Python path.")
+        return None, difference
+    return compiled, difference
+
+
+def get(name):
+    """
+    Return a compiled kernel, compiling and checking it on first use.
+
+    Parameters:
+        name (str): "gauss_seidel_sweep" or "neville_column".
+
+    Returns:
+        function: The compiled kernel, or None to use the pure-Python path.
+
+    Raises:
+        ValueError: If the kernel name is unknown.
+    """
+    if name not in _KERNELS:
+        raise ValueError(f"Unknown kernel: {name}")
+    if not JIT_ENABLED:
+        return None
+    if name not in _selected:
+        _selected[name] = _compile(name)
+    return _selected[name][0]
+
+
+def warm_up():
+    """Compile and check every kernel now instead of on first use."""
+    for name in _KERNELS:
+        get(name)
+
+
+def verify():
+    """
+    Compare every kernel with its pure-Python path.
+
+    Returns:
+        dict: For each kernel, whether the compiled version is used and the
+        largest relative difference found (None without numba).
+    """
+    report = {}
+    for name in _KERNELS:
+        compiled = get(name)
+        difference = _selected.get(name, (None, None))[1]
+        report[name] = {"compiled": compiled is not None, "difference": difference}
+    return report
+
+
+if __name__ == "__main__":
+    if not JIT_ENABLED:
+        print("numba is not installed or ANALIZA_JIT=0: the pure-Python paths are used.")
+    for name, result in verify().items():
+        print(f"{name}: compiled={result['compiled']} relative difference={result['difference']}")
@@ -1,8 +1,99 @@
-def calculate_machine_epsilon():
+import functools
+
+import numpy as np
+
+# Floating-point types the kernels can compute in
+FLOAT_DTYPES = ("float32", "float64", "longdouble")
+_SUPPORTED = {np.dtype(name) for name in FLOAT_DTYPES}
+
+
+def float_dtype(dtype=None, *values):
+    """
+    Choose the floating-point type a kernel computes in.
+
+    Parameters:
+        dtype (str or numpy.dtype, optional): The requested type: float32, float64 or longdouble.
+        *values: Inputs whose type is used when dtype is None. NumPy arrays and
+            scalars keep their floating type; Python numbers, lists and integer
+            arrays compute in float64.
+
+    Returns:
+        numpy.dtype: The type to compute in.
+
+    Raises:
+        ValueError: If dtype is not one of FLOAT_DTYPES.
+    """
+    if dtype is None:
+        dtypes = [value.dtype for value in values if isinstance(value, (np.ndarray, np.generic))]
+        dtype = np.result_type(*dtypes) if dtypes else np.dtype(np.float64)
+        if dtype not in _SUPPORTED:
+            dtype = np.dtype(np.float64)
+        return dtype
+
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError(f"dtype must be one of {', '.join(FLOAT_DTYPES)}.")
+    if dtype not in _SUPPORTED:
+        raise ValueError(f"dtype must be one of {', '.join(FLOAT_DTYPES)}.")
+    return dtype
+
+
+@functools.lru_cache(maxsize=None)
+def _machine_epsilon(dtype):
+    one = dtype.type(1)
+    two = dtype.type(2)
+    eps = dtype.type(1)
+    while (one + eps) > one:
+        eps /= two
+    return eps * two
+
+
+def calculate_machine_epsilon(dtype=float):
     """
     Calculate the machine epsilon, which is the smallest number that can be added to 1.0 to produce a distinct number greater than 1.0.
+
+    The value is measured once per type and then cached.
+
+    Parameters:
+        dtype (str or numpy.dtype, optional): float32, float64 or longdouble (default is float64).
+
+    Returns:
+        float: The machine epsilon; a NumPy scalar of dtype unless dtype is float64.
+
+    Raises:
+        ValueError: If dtype is not a supported floating-point type.
+    """
+    dtype = float_dtype(dtype)
+    eps = _machine_epsilon(dtype)
+    return float(eps) if dtype == np.float64 else eps
+
+
+def default_tolerance(dtype=float):
+    """
+    Default convergence tolerance for computations in dtype: the square root
+    of its machine epsilon, about 1.5e-8 in float64 and 3.5e-4 in float32.
+
+    Parameters:
+        dtype (str or numpy.dtype, optional): The type computed in (default is float64).
+
+    Returns:
+        float: The tolerance.
+    """
+    return float(np.sqrt(calculate_machine_epsilon(dtype)))
+
+
+def tolerance_floor(magnitude, dtype=float):
+    """
+    Smallest change an iteration can still resolve near values of the given
+    magnitude. Successive iterates closer than this differ only by rounding,
+    so a stopping tolerance below it would never be met.
+
+    Parameters:
+        magnitude (float): Size of the iterates, e.g. the largest absolute entry.
+        dtype (str or numpy.dtype, optional): The type computed in (default is float64).
+
+    Returns:
+        float: The floor for a stopping tolerance.
     """
-    eps = 1.0
-    while (1.0 + eps) > 1.0:
-        eps /= 2.0
-    return eps * 2.0
+    return 4 * float(calculate_machine_epsilon(dtype)) * float(magnitude)
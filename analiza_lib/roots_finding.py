@@ -1,4 +1,7 @@
-def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100):
+from analiza_lib.instrumentation import record_iterations
+
+
+def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100, history=None):
     """
     Newton-Raphson Method for finding a root of a function.
 
@@ -8,6 +11,7 @@ def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100):
     x0 (float): Initial guess for the root.
     epsilon (float, optional): Desired precision. Defaults to 0.0001.
     max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+    history (list, optional): If given, every iterate is appended to it.
 
     Returns:
     float: Estimated root if found within the specified tolerance.
@@ -34,6 +38,8 @@ def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100):
 
     iteration = 0
     x = x0
+    if history is not None:
+        history.append(x0)
     try:
         while iteration < max_iter:
             fx = func(x)
@@ -44,10 +50,13 @@ def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100):
 
             x_new = x - fx / fpx
             iteration += 1
+            if history is not None:
+                history.append(x_new)
 
             if abs(x_new - x) < epsilon:
                 print(f"Estimated root: {x_new}")
                 print(f"Number of iterations: {iteration}")
+                record_iterations("Newton_Raphson", iteration)
                 return x_new
 
             x = x_new
@@ -59,7 +68,7 @@ def Newton_Raphson(func, f_prime, x0, epsilon=0.0001, max_iter=100):
         raise
 
 
-def Bisection_Method(func, a, b, epsilon=0.0001, max_iter=100):
+def Bisection_Method(func, a, b, epsilon=0.0001, max_iter=100, history=None):
     """
     Bisection Method for finding a root of a function within a given interval.
 
@@ -69,6 +78,7 @@ def Bisection_Method(func, a, b, epsilon=0.0001, max_iter=100):
     b (float): End of the interval.
     epsilon (float, optional): Desired precision. Defaults to 0.0001.
     max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+    history (list, optional): If given, every iterate is appended to it.
 
     Returns:
     float: Estimated root if found within the specified tolerance.
@@ -101,6 +111,8 @@ def Bisection_Method(func, a, b, epsilon=0.0001, max_iter=100):
             midpoint = (a + b) / 2.0
             f_mid = func(midpoint)
             iteration += 1
+            if history is not None:
+                history.append(midpoint)
 
             if abs(f_mid) < epsilon:
                 break
@@ -113,13 +125,14 @@ def Bisection_Method(func, a, b, epsilon=0.0001, max_iter=100):
         root = (a + b) / 2.0
         print(f"Bisection Method: Approximate root = {root}")
         print(f"Iterations = {iteration}")
+        record_iterations("Bisection_Method", iteration)
         return root
     except Exception as e:
         print("Unexpected error: ", e)
         raise
 
 
-def Secant_Method(func, x0, x1, epsilon=0.0001, max_iter=100):
+def Secant_Method(func, x0, x1, epsilon=0.0001, max_iter=100, history=None):
     """
     Secant Method for finding a root of a function using two initial approximations.
 
@@ -129,6 +142,7 @@ def Secant_Method(func, x0, x1, epsilon=0.0001, max_iter=100):
     x1 (float): Second initial guess.
     epsilon (float, optional): Desired precision. Defaults to 0.0001.
     max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+    history (list, optional): If given, every iterate is appended to it.
 
     Returns:
     float: Estimated root if found within the specified tolerance.
@@ -152,6 +166,8 @@ def Secant_Method(func, x0, x1, epsilon=0.0001, max_iter=100):
         raise ValueError("max_iter must be a positive integer.")
 
     iteration = 0
+    if history is not None:
+        history.extend([x0, x1])
     try:
         while iteration < max_iter:
             f_x0 = func(x0)
@@ -163,10 +179,13 @@ def Secant_Method(func, x0, x1, epsilon=0.0001, max_iter=100):
 
             x2 = x1 - f_x1 * (x1 - x0) / denominator
             iteration += 1
+            if history is not None:
+                history.append(x2)
 
             if abs(x2 - x1) < epsilon:
                 print(f"Secant Method: Approximate root = {x2}")
                 print(f"Iterations = {iteration}")
+                record_iterations("Secant_Method", iteration)
                 return x2
 
             x0, x1 = x1, x2
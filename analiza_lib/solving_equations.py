@@ -1,6 +1,17 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
 import numpy as np
 
-from analiza_lib.help_functions import is_dominant_diagonal, attempt_fix_dominant_diagonal, max_norm_matrix, matrix_inverse
+from analiza_lib import kernels
+from analiza_lib.instrumentation import record_iterations
+from analiza_lib.machine_precision import float_dtype, calculate_machine_epsilon, default_tolerance, tolerance_floor
+from analiza_lib.help_functions import is_dominant_diagonal, attempt_fix_dominant_diagonal, max_norm_matrix, matrix_inverse, \
+    lu_factor, lu_solve, estimate_inverse_norm, multicolor_ordering
+
+GAUSS_SEIDEL_ORDERINGS = ("natural", "multicolor")
 
 
 def jacobi_solver(coefficients, constants, tol, previous_guess, iteration=1):
@@ -45,49 +56,13 @@ def jacobi_solver(coefficients, constants, tol, previous_guess, iteration=1):
     #
     # jacobi_solver(coefficients, constants, tol, next_guess, iteration+1)
 
-    if not isinstance(coefficients, list) or not all(isinstance(row, list) for row in coefficients):
-        raise ValueError("coefficients must be a list of lists.")
-
-    n = len(coefficients)
-    if any(len(row) != n for row in coefficients):
-        raise ValueError("Coefficient matrix must be square.")
-
-    if not isinstance(constants, list) or len(constants) != n:
-        raise ValueError("constants must be a list of length equal to the number of equations.")
-
-    if not isinstance(previous_guess, list) or len(previous_guess) != n:
-        raise ValueError("previous_guess must be a list of length equal to the number of variables.")
-
-    if not isinstance(tol, (int, float)) or tol <= 0:
-        raise ValueError("tol must be a positive number.")
-
-    if not isinstance(iteration, int) or iteration < 1:
-        raise ValueError("iteration must be a positive integer.")
-
-    # === Diagonal dominance check ===
-    if not is_dominant_diagonal(coefficients):
-        print("\nNo dominant diagonal detected. Attempting to rearrange...")
-        coefficients = attempt_fix_dominant_diagonal(coefficients)
-        if not is_dominant_diagonal(coefficients):
-            print("\nWarning: Still no dominant diagonal. Convergence is not guaranteed.\n")
-
-    # === Iteration ===
-    next_guess = []
-    for i in range(len(coefficients)):
-        sum_other = sum(coefficients[i][j]*previous_guess[j] for j in range(len(coefficients)) if i != j)
-        next_val = (constants[i] - sum_other)/coefficients[i][i]
-        next_guess.append(next_val)
+    for iteration, next_guess, converged in jacobi_iterations(coefficients, constants, tol, previous_guess, iteration):
+        print(f"Iteration {iteration}: {next_guess}")
 
-    print(f"Iteration {iteration}: {next_guess}")
+    print(f"\nTotal Iterations: {iteration}")
 
-    if all(abs(next_guess[i] - previous_guess[i]) < tol for i in range(len(coefficients))):
-        print(f"\nTotal Iterations: {iteration}")
-        return
 
-    jacobi_solver(coefficients, constants, tol, next_guess, iteration+1)
-
-
-def gauss_seidel_solver(coefficients, constants, tol, previous_guess, iteration=1):
+def gauss_seidel_solver(coefficients, constants, tol, previous_guess, iteration=1, ordering="natural"):
     """
     Solve a system of linear equations using the Gauss-Seidel iterative method.
 
@@ -101,6 +76,7 @@ def gauss_seidel_solver(coefficients, constants, tol, previous_guess, iteration=
         tol (float): Convergence tolerance for stopping criteria.
         previous_guess (list of float): Initial guess for the solution.
         iteration (int, optional): Iteration counter (default is 1).
+        ordering (str, optional): "natural" or "multicolor", see gauss_seidel_iterations (default is "natural").
 
     Returns:
         None
@@ -129,48 +105,291 @@ def gauss_seidel_solver(coefficients, constants, tol, previous_guess, iteration=
     #
     # gauss_seidel_solver(coefficients, constants, tol, current_guess, iteration+1)
 
-    if not isinstance(coefficients, list) or not all(isinstance(row, list) for row in coefficients):
-        raise ValueError("coefficients must be a list of lists.")
+    for iteration, current_guess, converged in gauss_seidel_iterations(coefficients, constants, tol, previous_guess, iteration,
+                                                                       ordering=ordering):
+        print(f"Iteration {iteration}: {current_guess}")
+
+    print(f"\nTotal Iterations: {iteration}")
+
+
+def _prepare_system(coefficients, constants, tol, previous_guess, iteration, max_iter):
+    """
+    Validate an iterative-solver input and try to make it diagonally dominant.
+
+    Parameters:
+        coefficients (list of list of float or numpy.ndarray): Coefficient matrix A.
+        constants (list of float or numpy.ndarray): Right-hand side vector b.
+        tol (float): Convergence tolerance for stopping criteria.
+        previous_guess (list of float or numpy.ndarray): Initial guess for the solution.
+        iteration (int): Number of the first iteration.
+        max_iter (int): Maximum number of iterations.
+
+    Returns:
+        list of list of float or numpy.ndarray: The (possibly rearranged) coefficient matrix.
+
+    Raises:
+        ValueError: If inputs are invalid.
+    """
+
+    if isinstance(coefficients, np.ndarray):
+        if coefficients.ndim != 2 or coefficients.shape[0] != coefficients.shape[1]:
+            raise ValueError("Coefficient matrix must be square.")
+    elif not isinstance(coefficients, list) or not all(isinstance(row, list) for row in coefficients):
+        raise ValueError("coefficients must be a list of lists or a NumPy array.")
 
     n = len(coefficients)
     if any(len(row) != n for row in coefficients):
         raise ValueError("Coefficient matrix must be square.")
 
-    if not isinstance(constants, list) or len(constants) != n:
+    if not isinstance(constants, (list, np.ndarray)) or np.ndim(constants) != 1 or len(constants) != n:
         raise ValueError("constants must be a list of length equal to the number of equations.")
 
-    if not isinstance(previous_guess, list) or len(previous_guess) != n:
+    if not isinstance(previous_guess, (list, np.ndarray)) or np.ndim(previous_guess) != 1 or len(previous_guess) != n:
         raise ValueError("previous_guess must be a list of length equal to the number of variables.")
 
-    if not isinstance(tol, (int, float)) or tol <= 0:
+    if not isinstance(tol, (int, float, np.floating)) or tol <= 0:
         raise ValueError("tol must be a positive number.")
 
     if not isinstance(iteration, int) or iteration < 1:
         raise ValueError("iteration must be a positive integer.")
 
+    if not isinstance(max_iter, int) or max_iter < iteration:
+        raise ValueError("max_iter must be an integer not smaller than iteration.")
+
     # === Diagonal dominance check ===
-    if not is_dominant_diagonal(coefficients):
+    if isinstance(coefficients, np.ndarray):
+        # The same check without indexing every element from Python
+        def dominant(matrix):
+            diagonal = np.abs(matrix.diagonal())
+            return bool(np.all(diagonal >= np.abs(matrix).sum(axis=1) - diagonal))
+    else:
+        dominant = is_dominant_diagonal
+
+    if not dominant(coefficients):
         print("\nNo dominant diagonal detected. Attempting to rearrange...")
-        coefficients = attempt_fix_dominant_diagonal(coefficients)
-        if not is_dominant_diagonal(coefficients):
+        if isinstance(coefficients, np.ndarray):
+            coefficients = np.array(attempt_fix_dominant_diagonal(coefficients))
+        else:
+            coefficients = attempt_fix_dominant_diagonal(coefficients)
+        if not dominant(coefficients):
             print("\nWarning: Still no dominant diagonal. Convergence is not guaranteed.\n")
 
-    current_guess = previous_guess.copy()
+    return coefficients
+
+
+def _jacobi_sweep(coefficients, constants, previous_guess, dtype):
+    """
+    Build one Jacobi sweep, x_new = D^-1 (b - (A - D) x).
+
+    Returns:
+        tuple: The sweep function and the initial guess in the form it takes.
+    """
+    n = len(coefficients)
+    if dtype is None:
+        def sweep(previous_guess):
+            next_guess = []
+            for i in range(n):
+                sum_other = sum(coefficients[i][j]*previous_guess[j] for j in range(n) if i != j)
+                next_val = (constants[i] - sum_other)/coefficients[i][i]
+                next_guess.append(next_val)
+            return next_guess
+        return sweep, previous_guess
+
+    dtype = float_dtype(dtype)
+    matrix = np.array(coefficients, dtype=dtype)
+    diagonal = matrix.diagonal().copy()
+    np.fill_diagonal(matrix, 0)
+    b = np.array(constants, dtype=dtype)
+
+    def sweep(previous_guess):
+        return (b - matrix @ previous_guess) / diagonal
+    return sweep, np.array(previous_guess, dtype=dtype)
+
+
+def _gauss_seidel_sweep(coefficients, constants, previous_guess, dtype, jit=True, ordering="natural"):
+    """
+    Build one Gauss-Seidel sweep, updating the entries in place row by row.
+
+    The compiled kernel from analiza_lib.kernels is used when available and
+    jit is True; otherwise lists of Python floats, or NumPy rows for a dtype.
+    The multicolor ordering updates one color of rows at a time instead.
+
+    Returns:
+        tuple: The sweep function and the initial guess in the form it takes.
+    """
+    n = len(coefficients)
+    if ordering == "multicolor":
+        matrix = np.array(coefficients, dtype=float_dtype(dtype))
+        diagonal = matrix.diagonal().copy()
+        np.fill_diagonal(matrix, 0)
+        b = np.array(constants, dtype=matrix.dtype)
+        colors = multicolor_ordering(matrix)
+
+        def sweep(previous_guess):
+            current_guess = np.array(previous_guess, dtype=matrix.dtype)
+            # Rows of one color do not couple, so they see the same values
+            # whether updated one by one or all at once
+            for rows in colors:
+                current_guess[rows] = (b[rows] - matrix[rows] @ current_guess) / diagonal[rows]
+            return current_guess if dtype is not None else current_guess.tolist()
+        return sweep, previous_guess if dtype is None else np.array(previous_guess, dtype=matrix.dtype)
+
+    kernel = kernels.get("gauss_seidel_sweep") if jit else None
+    if kernel is not None:
+        matrix = np.array(coefficients, dtype=float_dtype(dtype))
+        b = np.array(constants, dtype=matrix.dtype)
+
+        def sweep(previous_guess):
+            current_guess = np.array(previous_guess, dtype=matrix.dtype)
+            kernel(matrix, b, current_guess)
+            # Without a dtype the guesses stay lists, as on the Python path
+            return current_guess if dtype is not None else current_guess.tolist()
+        return sweep, previous_guess if dtype is None else np.array(previous_guess, dtype=matrix.dtype)
+
+    if dtype is None:
+        def sweep(previous_guess):
+            current_guess = previous_guess.copy()
+            for i in range(n):
+                sum_other = sum(coefficients[i][j]*current_guess[j] for j in range(n) if i != j)
+                current_guess[i] = (constants[i] - sum_other)/coefficients[i][i]
+            return current_guess
+        return sweep, previous_guess
+
+    dtype = float_dtype(dtype)
+    matrix = np.array(coefficients, dtype=dtype)
+    diagonal = matrix.diagonal().copy()
+    np.fill_diagonal(matrix, 0)
+    b = np.array(constants, dtype=dtype)
+
+    def sweep(previous_guess):
+        current_guess = previous_guess.copy()
+        for i in range(n):
+            current_guess[i] = (b[i] - matrix[i] @ current_guess) / diagonal[i]
+        return current_guess
+    return sweep, np.array(previous_guess, dtype=dtype)
+
+
+def _converged(current_guess, previous_guess, tol, precision):
+    """
+    Check the stopping criterion max |x_new - x_old| < tol.
+
+    The tolerance is raised to tolerance_floor when it is below the rounding
+    error of the sums in a sweep, which no iteration could get under.
+    """
+    n = len(current_guess)
+    if isinstance(current_guess, np.ndarray):
+        change = float(np.abs(current_guess - previous_guess).max(initial=0))
+        magnitude = float(np.abs(current_guess).max(initial=0))
+    else:
+        change = max((abs(current_guess[i] - previous_guess[i]) for i in range(n)), default=0)
+        magnitude = max((abs(value) for value in current_guess), default=0)
+    return change < max(tol, tolerance_floor(n * magnitude, precision))
+
+
+def jacobi_iterations(coefficients, constants, tol, previous_guess, iteration=1, max_iter=1000, dtype=None):
+    """
+    Generate the iterates of the Jacobi method one at a time.
+
+    Each iterate is produced as soon as it is computed, so callers can report
+    progress or stop early; only the current iterate is kept in memory.
+
+    Parameters:
+        coefficients (list of list of float): Coefficient matrix A.
+        constants (list of float): Right-hand side vector b.
+        tol (float): Convergence tolerance for stopping criteria, or None for
+            default_tolerance of the type computed in.
+        previous_guess (list of float): Initial guess for the solution.
+        iteration (int, optional): Number of the first iteration (default is 1).
+        max_iter (int, optional): Number of the last iteration allowed (default is 1000).
+        dtype (str or numpy.dtype, optional): float32, float64 or longdouble to
+            compute whole sweeps with NumPy in; the guesses are then arrays
+            (default is None: Python floats, guesses are lists).
+
+    Yields:
+        tuple: The iteration number, the new guess and whether it converged.
+
+    Raises:
+        ValueError: If inputs are invalid or the method does not converge within max_iter.
+    """
+    precision = float_dtype(dtype)
+    if tol is None:
+        tol = default_tolerance(precision)
+    coefficients = _prepare_system(coefficients, constants, tol, previous_guess, iteration, max_iter)
+    sweep, previous_guess = _jacobi_sweep(coefficients, constants, previous_guess, dtype)
+    first_iteration = iteration
+
+    while iteration <= max_iter:
+        next_guess = sweep(previous_guess)
+
+        converged = _converged(next_guess, previous_guess, tol, precision)
+        yield iteration, next_guess, converged
+        if converged:
+            record_iterations("jacobi_solver", iteration - first_iteration + 1)
+            return
+
+        previous_guess = next_guess
+        iteration += 1
+
+    record_iterations("jacobi_solver", iteration - first_iteration)
+    raise ValueError(f"The method did not converge after {max_iter} iterations.")
+
+
+def gauss_seidel_iterations(coefficients, constants, tol, previous_guess, iteration=1, max_iter=1000, dtype=None,
+                            ordering="natural"):
+    """
+    Generate the iterates of the Gauss-Seidel method one at a time.
+
+    Each iterate is produced as soon as it is computed, so callers can report
+    progress or stop early; only the current iterate is kept in memory.
+
+    Parameters:
+        coefficients (list of list of float): Coefficient matrix A.
+        constants (list of float): Right-hand side vector b.
+        tol (float): Convergence tolerance for stopping criteria, or None for
+            default_tolerance of the type computed in.
+        previous_guess (list of float): Initial guess for the solution.
+        iteration (int, optional): Number of the first iteration (default is 1).
+        max_iter (int, optional): Number of the last iteration allowed (default is 1000).
+        dtype (str or numpy.dtype, optional): float32, float64 or longdouble to
+            compute the row updates with NumPy in; the guesses are then arrays
+            (default is None: Python floats, guesses are lists).
+        ordering (str, optional): "natural" updates the unknowns in order;
+            "multicolor" groups them into colors of uncoupled rows
+            (multicolor_ordering, red-black for grid stencils) and updates
+            each color with one vectorized step (default is "natural").
+
+    Yields:
+        tuple: The iteration number, the new guess and whether it converged.
+
+    Raises:
+        ValueError: If inputs are invalid or the method does not converge within max_iter.
+    """
+    if ordering not in GAUSS_SEIDEL_ORDERINGS:
+        raise ValueError(f"ordering must be one of {', '.join(GAUSS_SEIDEL_ORDERINGS)}.")
+    precision = float_dtype(dtype)
+    if tol is None:
+        tol = default_tolerance(precision)
+    coefficients = _prepare_system(coefficients, constants, tol, previous_guess, iteration, max_iter)
+    sweep, previous_guess = _gauss_seidel_sweep(coefficients, constants, previous_guess, dtype, ordering=ordering)
+    first_iteration = iteration
 
-    for i in range(len(coefficients)):
-        sum_other = sum(coefficients[i][j]*current_guess[j] for j in range(len(coefficients)) if i != j)
-        current_guess[i] = (constants[i] - sum_other)/coefficients[i][i]
+    while iteration <= max_iter:
+        current_guess = sweep(previous_guess)
 
-    print(f"Iteration {iteration}: {current_guess}")
+        converged = _converged(current_guess, previous_guess, tol, precision)
+        yield iteration, current_guess, converged
+        if converged:
+            record_iterations("gauss_seidel_solver", iteration - first_iteration + 1)
+            return
 
-    if all(abs(current_guess[i] - previous_guess[i]) < tol for i in range(len(coefficients))):
-        print(f"\nTotal Iterations: {iteration}")
-        return
+        previous_guess = current_guess
+        iteration += 1
 
-    gauss_seidel_solver(coefficients, constants, tol, current_guess, iteration+1)
+    record_iterations("gauss_seidel_solver", iteration - first_iteration)
+    raise ValueError(f"The method did not converge after {max_iter} iterations.")
 
 
-def condition_number(matrix):
+def condition_number(matrix, lu=None):
     """
     Compute the condition number of a square matrix using the infinity norm.
 
@@ -179,6 +398,9 @@ def condition_number(matrix):
 
     Parameters:
         matrix (numpy.ndarray): The square matrix A.
+        lu (tuple, optional): lu_factor(matrix), possibly in lower precision. The
+            norm of the inverse is then estimated from the factors in O(n^2)
+            instead of inverting the matrix (default is None).
 
     Returns:
         float: The condition number of the matrix.
@@ -207,6 +429,8 @@ def condition_number(matrix):
         raise ValueError("Input matrix must be square.")
 
     norm_A = max_norm_matrix(matrix)
+    if lu is not None:
+        return norm_A * estimate_inverse_norm(*lu)
     matrix_inv = matrix_inverse(matrix)
     norm_A_inv = max_norm_matrix(matrix_inv)
 
@@ -214,6 +438,261 @@ def condition_number(matrix):
     return cond
 
 
+
+def mixed_precision_solver(coefficients, constants, tol=None, max_iter=30, low_dtype="float32", dtype="float64",
+                           max_condition=None):
+    """
+    Solve a dense system A x = b by mixed-precision iterative refinement.
+
+    A is factorized once in low precision (LU with partial pivoting), which
+    is the O(n^3) part and takes half the memory in float32. The solution is
+    then corrected until converged: the residual r = b - A x is computed in
+    high precision, the correction A d = r is solved with the low-precision
+    factors in O(n^2), and x += d in high precision. This reaches the
+    accuracy of a high-precision solve as long as cond(A) * eps(low_dtype)
+    is well below 1.
+
+    condition_number, estimated from the low-precision factors, decides
+    whether refinement can converge; if the matrix is too ill-conditioned,
+    or a correction fails to shrink, the system is factorized and solved in
+    high precision instead.
+
+    Parameters:
+        coefficients (list of list of float or numpy.ndarray): Coefficient matrix A.
+        constants (list of float or numpy.ndarray): Right-hand side vector b.
+        tol (float, optional): Stop when the largest correction is below tol; None
+            refines as far as dtype allows (default is None).
+        max_iter (int, optional): Maximum number of corrections (default is 30).
+        low_dtype (str or numpy.dtype, optional): Type of the factorization (default is float32).
+        dtype (str or numpy.dtype, optional): Type of the residuals and the solution (default is float64).
+        max_condition (float, optional): Largest condition number refined in low
+            precision (default is 0.1 / machine epsilon of low_dtype).
+
+    Returns:
+        tuple: The solution (numpy.ndarray of dtype), the number of corrections,
+        and the name of the type the matrix was factorized in.
+
+    Raises:
+        ValueError: If inputs are invalid or the matrix is singular.
+    """
+    low_dtype = float_dtype(low_dtype)
+    dtype = float_dtype(dtype)
+    try:
+        matrix = np.array(coefficients, dtype=dtype)
+        b = np.array(constants, dtype=dtype)
+    except (TypeError, ValueError):
+        raise ValueError("coefficients and constants must contain numeric values.")
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Coefficient matrix must be square.")
+
+    n = matrix.shape[0]
+    if b.shape != (n,):
+        raise ValueError("constants must be a list of length equal to the number of equations.")
+
+    if tol is not None and (not isinstance(tol, (int, float, np.floating)) or tol <= 0):
+        raise ValueError("tol must be a positive number.")
+
+    if not isinstance(max_iter, int) or max_iter < 1:
+        raise ValueError("max_iter must be a positive integer.")
+
+    if max_condition is None:
+        max_condition = 0.1 / calculate_machine_epsilon(low_dtype)
+
+    def solve_in_full_precision():
+        lu, perm = lu_factor(matrix)
+        record_iterations("mixed_precision_solver", 0)
+        return lu_solve(lu, perm, b), 0, dtype.name
+
+    try:
+        lu, perm = lu_factor(matrix.astype(low_dtype))
+    except ValueError:
+        # Singular in low precision, e.g. after rounding; try the full matrix
+        return solve_in_full_precision()
+
+    if not np.isfinite(lu).all() or condition_number(matrix, (lu, perm)) > max_condition:
+        return solve_in_full_precision()
+
+    x = lu_solve(lu, perm, b.astype(low_dtype)).astype(dtype)
+    previous_change = np.inf
+    for iteration in range(1, max_iter + 1):
+        residual = b - matrix @ x
+        # Scale the residual so converting it to low precision cannot underflow
+        scale = np.abs(residual).max()
+        if scale == 0:
+            record_iterations("mixed_precision_solver", iteration - 1)
+            return x, iteration - 1, low_dtype.name
+        correction = lu_solve(lu, perm, (residual / scale).astype(low_dtype)).astype(dtype) * scale
+        x += correction
+
+        change = float(np.abs(correction).max())
+        if change < max(tol or 0.0, tolerance_floor(n * np.abs(x).max(), dtype)):
+            record_iterations("mixed_precision_solver", iteration)
+            return x, iteration, low_dtype.name
+        if not change < 0.5 * previous_change:
+            # The corrections stopped shrinking. Below the low-precision error the
+            # remaining error is rounding in the residual, which a full-precision
+            # solve would not remove either; above it, refinement is not converging.
+            if change < calculate_machine_epsilon(low_dtype) * np.abs(x).max():
+                record_iterations("mixed_precision_solver", iteration)
+                return x, iteration, low_dtype.name
+            return solve_in_full_precision()
+        previous_change = change
+
+    return solve_in_full_precision()
+
+
+def _block_sweep(names, n, start, stop):
+    """
+    Worker task of block_gauss_seidel_iterations: one Gauss-Seidel sweep over
+    rows start:stop, reading the previous guess and writing the new one in
+    shared memory.
+
+    Parameters:
+        names (list of str): Shared memory names of A, b, the previous and the new guess.
+        n (int): Number of equations.
+        start (int): First row of the block.
+        stop (int): End of the block (exclusive).
+    """
+    buffers = [SharedMemory(name=name) for name in names]
+    try:
+        _sweep_block(buffers, n, start, stop)
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+
+def _sweep_block(buffers, n, start, stop):
+    # The views must be gone before the buffers can be closed, so they live only here
+    matrix = np.ndarray((n, n), dtype=np.float64, buffer=buffers[0].buf)
+    constants = np.ndarray((n,), dtype=np.float64, buffer=buffers[1].buf)
+    previous_guess = np.ndarray((n,), dtype=np.float64, buffer=buffers[2].buf)
+    next_guess = np.ndarray((n,), dtype=np.float64, buffer=buffers[3].buf)
+
+    # Rows of this block use their own new values (Gauss-Seidel), the other
+    # blocks' values from the previous sweep (Jacobi)
+    guess = previous_guess.copy()
+    for i in range(start, stop):
+        row = matrix[i]
+        guess[i] = (constants[i] - row @ guess + row[i] * guess[i]) / row[i]
+    next_guess[start:stop] = guess[start:stop]
+
+
+def block_gauss_seidel_iterations(coefficients, constants, tol, previous_guess, iteration=1, max_iter=1000,
+                                  blocks=None, executor=None):
+    """
+    Generate the iterates of a block Jacobi / Gauss-Seidel hybrid that runs
+    the row blocks in parallel processes.
+
+    The rows are split into blocks, one task per block and sweep. Within a
+    sweep each block runs Gauss-Seidel over its own rows and takes the other
+    blocks' values from the previous sweep, so the blocks are independent
+    and run on separate cores. The matrix, the constants and the two guess
+    vectors are in shared memory; tasks receive only their names and a row
+    range, never a copy of the matrix. With one block this is Gauss-Seidel.
+
+    Parameters:
+        coefficients (list of list of float or numpy.ndarray): Coefficient matrix A.
+        constants (list of float or numpy.ndarray): Right-hand side vector b.
+        tol (float): Convergence tolerance for stopping criteria, or None for default_tolerance.
+        previous_guess (list of float or numpy.ndarray): Initial guess for the solution.
+        iteration (int, optional): Number of the first iteration (default is 1).
+        max_iter (int, optional): Number of the last iteration allowed (default is 1000).
+        blocks (int, optional): Number of row blocks (default is the number of CPU cores).
+        executor (concurrent.futures.Executor, optional): Process pool to run the
+            blocks in, which can be reused across solves (default is a pool of
+            blocks spawned processes, shut down when the generator finishes).
+
+    Yields:
+        tuple: The iteration number, the new guess (numpy.ndarray) and whether it converged.
+
+    Raises:
+        ValueError: If inputs are invalid or the method does not converge within max_iter.
+    """
+    try:
+        matrix = np.asarray(coefficients, dtype=np.float64)
+        b = np.asarray(constants, dtype=np.float64)
+        guess = np.asarray(previous_guess, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("coefficients, constants and previous_guess must contain numeric values.")
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Coefficient matrix must be square.")
+
+    n = matrix.shape[0]
+    if b.shape != (n,):
+        raise ValueError("constants must be a list of length equal to the number of equations.")
+
+    if guess.shape != (n,):
+        raise ValueError("previous_guess must be a list of length equal to the number of variables.")
+
+    if tol is None:
+        tol = default_tolerance()
+    if not isinstance(tol, (int, float, np.floating)) or tol <= 0:
+        raise ValueError("tol must be a positive number.")
+
+    if not isinstance(iteration, int) or iteration < 1:
+        raise ValueError("iteration must be a positive integer.")
+
+    if not isinstance(max_iter, int) or max_iter < iteration:
+        raise ValueError("max_iter must be an integer not smaller than iteration.")
+
+    if blocks is None:
+        blocks = os.cpu_count() or 1
+    if not isinstance(blocks, int) or blocks < 1:
+        raise ValueError("blocks must be a positive integer.")
+    blocks = min(blocks, max(n, 1))
+
+    diagonal = np.abs(matrix.diagonal())
+    if np.any(diagonal == 0):
+        raise ValueError("The diagonal of the coefficient matrix must not contain zeros.")
+    if np.any(2 * diagonal < np.abs(matrix).sum(axis=1)):
+        print("\nWarning: No dominant diagonal. Convergence is not guaranteed.\n")
+
+    bounds = np.linspace(0, n, blocks + 1).astype(int)
+    buffers = []
+    arrays = {}
+    own_executor = executor is None
+    first_iteration = iteration
+    try:
+        for key, array in (("matrix", matrix), ("constants", b), ("previous", guess), ("next", guess)):
+            buffer = SharedMemory(create=True, size=max(array.nbytes, 1))
+            buffers.append(buffer)
+            arrays[key] = np.ndarray(array.shape, dtype=np.float64, buffer=buffer.buf)
+            arrays[key][...] = array
+        names = [buffer.name for buffer in buffers]
+        if own_executor:
+            executor = ProcessPoolExecutor(blocks, mp_context=multiprocessing.get_context("spawn"))
+
+        while iteration <= max_iter:
+            futures = [executor.submit(_block_sweep, names, n, int(start), int(stop))
+                       for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            for future in futures:
+                future.result()
+
+            next_guess = arrays["next"].copy()
+            converged = _converged(next_guess, arrays["previous"], tol, np.dtype(np.float64))
+            yield iteration, next_guess, converged
+            if converged:
+                record_iterations("block_gauss_seidel", iteration - first_iteration + 1)
+                return
+
+            # The new guess becomes the previous one of the next sweep
+            arrays["previous"], arrays["next"] = arrays["next"], arrays["previous"]
+            names[2], names[3] = names[3], names[2]
+            iteration += 1
+
+        record_iterations("block_gauss_seidel", iteration - first_iteration)
+        raise ValueError(f"The method did not converge after {max_iter} iterations.")
+    finally:
+        if own_executor and executor is not None:
+            executor.shutdown()
+        arrays.clear()
+        for buffer in buffers:
+            buffer.close()
+            buffer.unlink()
+
+
 # if __name__ == "__main__":
 #     import numpy as np
 #
@@ -0,0 +1,204 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "server")))
+
+import httpx
+import numpy as np
+
+# Load generator for server/api.py. By default it drives the app in-process
+# through httpx's ASGI transport, so it needs no network and no uvicorn;
+# with --url it targets a running server instead, e.g. a local
+# "uvicorn api:app". Per route it reports throughput, p50/p95/p99 latency
+# and the mean time per phase from the server's Server-Timing header:
+# queue, evaluation, plot and serialize, plus client-side JSON decoding.
+#
+#   python benchmarks/load_test.py --requests 500 --concurrency 16
+#   python benchmarks/load_test.py --url http://127.0.0.1:8000 --duration 30
+
+
+# The dashboard's example Jacobi system
+EXAMPLE_SYSTEM = {
+    "coefficients": [[4, -1, 0], [-1, 4, -1], [0, -1, 4]],
+    "constants": [15, 10, 10],
+    "tolerance": 0.0001,
+    "initial_guess": [0, 0, 0],
+}
+
+
+def interpolation_body(rng, n, plots):
+    x_vals = [float(x) for x in sorted(rng.sample(range(100), n))]
+    return {
+        "x_vals": x_vals,
+        "y_vals": [round(rng.uniform(-5, 5), 3) for _ in x_vals],
+        "x": (x_vals[0] + x_vals[-1]) / 2,
+        "plot": rng.choice(plots),
+    }
+
+
+# Route, weight and a function building a request body from a random.Random.
+# Bodies vary, so the result cache does not answer every request unless
+# --repeat-bodies is given.
+MIX = [
+    ("/jacobi", 10, lambda rng: {**EXAMPLE_SYSTEM, "tolerance": rng.choice([1e-4, 1e-6, 1e-8])}),
+    ("/gauss_seidel", 5, lambda rng: {**EXAMPLE_SYSTEM, "constants": [rng.randint(1, 20) for _ in range(3)]}),
+    ("/condition_number", 3, lambda rng: [[rng.uniform(5, 10), 1, 0], [1, rng.uniform(5, 10), 1], [0, 1, rng.uniform(5, 10)]]),
+    ("/simpsons", 10, lambda rng: {"func": "x**2 + 1", "a": 0, "b": rng.uniform(1, 10), "n": 100}),
+    ("/trapezoidal", 8, lambda rng: {"func": "x**3", "a": 0, "b": rng.uniform(1, 10), "n": 1000}),
+    ("/romberg", 6, lambda rng: {"func": "1 / (1 + x**2)", "a": 0, "b": rng.uniform(1, 10), "n": 10}),
+    ("/bisection", 8, lambda rng: {"func": "x**3 - x - 2", "x0": 1, "x1": rng.uniform(2, 3), "tol": 1e-6,
+                                   "max_iter": 100, "plot": rng.choice(["png", "none"])}),
+    ("/newton_raphson", 6, lambda rng: {"func": "x**2 - 2", "derivative": "2*x", "x0": rng.uniform(1, 3), "tol": 1e-6,
+                                        "max_iter": 100, "plot": rng.choice(["png", "none"])}),
+    ("/secant", 6, lambda rng: {"func": "x**2 - 2", "x0": 1, "x1": rng.uniform(2, 3), "tol": 1e-6,
+                                "max_iter": 100, "plot": rng.choice(["png", "none"])}),
+    ("/linear_interpolation", 6, lambda rng: interpolation_body(rng, 6, ["png", "none"])),
+    ("/lagrange", 6, lambda rng: interpolation_body(rng, 6, ["png", "svg", "none"])),
+    ("/neville", 4, lambda rng: interpolation_body(rng, 8, ["png", "none"])),
+    ("/cubic_spline", 6, lambda rng: interpolation_body(rng, 10, ["png", "series", "none"])),
+]
+
+PHASES = ("queue", "evaluation", "plot", "serialize")
+
+
+def parse_server_timing(header):
+    """
+    Parse a Server-Timing header into {name: seconds}.
+    """
+    phases = {}
+    for entry in (header or "").split(","):
+        name, _, params = entry.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur" and name:
+                phases[name] = float(value) / 1000
+    return phases
+
+
+async def run_load(client, mix, requests, duration, concurrency, seed, repeat_bodies):
+    """
+    Send requests from concurrency workers until requests are sent or duration elapses.
+
+    Returns:
+        tuple: Samples per route and the elapsed wall time.
+    """
+    rng = random.Random(seed)
+    routes = [route for route, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    builders = {route: build for route, _, build in mix}
+    fixed_bodies = {route: build(random.Random(seed)) for route, _, build in mix}
+    samples = {route: [] for route in routes}
+    sent = 0
+    deadline = None if duration is None else time.perf_counter() + duration
+
+    async def worker():
+        nonlocal sent
+        while (requests is None or sent < requests) and (deadline is None or time.perf_counter() < deadline):
+            sent += 1
+            route = rng.choices(routes, weights)[0]
+            body = fixed_bodies[route] if repeat_bodies else builders[route](rng)
+            start = time.perf_counter()
+            response = await client.post(route, json=body)
+            latency = time.perf_counter() - start
+            decode_start = time.perf_counter()
+            data = response.json()
+            decode = time.perf_counter() - decode_start
+            samples[route].append({
+                "latency": latency,
+                "decode": decode,
+                "bytes": len(response.content),
+                "ok": response.status_code == 200 and not (isinstance(data, dict) and "error" in data),
+                "phases": parse_server_timing(response.headers.get("server-timing")),
+            })
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples, elapsed):
+    """
+    Per-route throughput, latency percentiles and mean phase times, in milliseconds.
+    """
+    report = {}
+    for route, route_samples in samples.items():
+        if not route_samples:
+            continue
+        latencies = np.array([sample["latency"] for sample in route_samples]) * 1000
+        report[route] = {
+            "requests": len(route_samples),
+            "errors": sum(not sample["ok"] for sample in route_samples),
+            "throughput": len(route_samples) / elapsed,
+            "p50": float(np.percentile(latencies, 50)),
+            "p95": float(np.percentile(latencies, 95)),
+            "p99": float(np.percentile(latencies, 99)),
+            "mean_bytes": float(np.mean([sample["bytes"] for sample in route_samples])),
+            "decode": float(np.mean([sample["decode"] for sample in route_samples])) * 1000,
+            **{phase: float(np.mean([sample["phases"].get(phase, 0.0) for sample in route_samples])) * 1000
+               for phase in PHASES},
+        }
+    return report
+
+
+def print_report(report, elapsed, concurrency):
+    total = sum(row["requests"] for row in report.values())
+    print(f"{total} requests in {elapsed:.2f}s at concurrency {concurrency}: {total / elapsed:.1f} req/s")
+    header = f"{'route':<24}{'reqs':>6}{'err':>5}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}"
+    header += "".join(f"{phase:>11}" for phase in PHASES) + f"{'decode':>9}{'KB':>8}"
+    print(header + "\n" + "(times in ms; phases are server-side means)")
+    for route, row in sorted(report.items()):
+        line = f"{route:<24}{row['requests']:>6}{row['errors']:>5}{row['throughput']:>8.1f}"
+        line += f"{row['p50']:>9.1f}{row['p95']:>9.1f}{row['p99']:>9.1f}"
+        line += "".join(f"{row[phase]:>11.2f}" for phase in PHASES)
+        line += f"{row['decode']:>9.2f}{row['mean_bytes'] / 1024:>8.1f}"
+        print(line)
+
+
+async def main_async(args):
+    mix = [entry for entry in MIX if args.routes is None or entry[0].strip("/") in args.routes]
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout) as client:
+            return await run_load(client, mix, args.requests, args.duration, args.concurrency,
+                                  args.seed, args.repeat_bodies)
+
+    import api
+    # Run the app's startup and shutdown, which start and stop the process pool
+    async with api.lifespan(api.app):
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout) as client:
+            return await run_load(client, mix, args.requests, args.duration, args.concurrency,
+                                  args.seed, args.repeat_bodies)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the numerical API.")
+    parser.add_argument("--url", help="base URL of a running server (default: run the app in-process)")
+    parser.add_argument("--concurrency", type=int, default=8, help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, help="total number of requests (default 200 without --duration)")
+    parser.add_argument("--duration", type=float, help="run for this many seconds")
+    parser.add_argument("--routes", nargs="*", help="only use these routes, e.g. jacobi simpsons")
+    parser.add_argument("--repeat-bodies", action="store_true",
+                        help="send one fixed body per route, so the result cache answers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="client timeout per request in seconds")
+    parser.add_argument("--output", help="write the report to this JSON file")
+    args = parser.parse_args(argv)
+    if args.requests is None and args.duration is None:
+        args.requests = 200
+
+    samples, elapsed = asyncio.run(main_async(args))
+    report = summarize(samples, elapsed)
+    print_report(report, elapsed, args.concurrency)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"elapsed": elapsed, "concurrency": args.concurrency, "routes": report}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from analiza_lib import *
+
+# Times the public analiza_lib functions over a grid of problem sizes and
+# reports wall time, function evaluations and peak memory. Results can be
+# saved as a JSON baseline and later runs compared against it:
+#
+#   python benchmarks/run_benchmarks.py --output baseline.json
+#   python benchmarks/run_benchmarks.py --baseline baseline.json
+#
+# Timings are only comparable on the same machine.
+
+
+class CountingFunction:
+    """
+    Wrap a function and count the points it is evaluated at.
+
+    Vectorized calls count one evaluation per array element.
+
+    Parameters:
+        func (function): The function to wrap.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.count = 0
+
+    def __call__(self, x):
+        self.count += np.size(x)
+        return self.func(x)
+
+
+class CountSum:
+    """Total count of several CountingFunctions, e.g. a function and its derivative."""
+
+    def __init__(self, *counters):
+        self.counters = counters
+
+    @property
+    def count(self):
+        return sum(counter.count for counter in self.counters)
+
+
+def with_cost(func, cost):
+    """
+    Make func slower by cost multiply-adds per scalar evaluation, to measure
+    how a method scales with the price of one evaluation.
+    """
+    if cost == 0:
+        return func
+
+    def costly(x):
+        burn = 0.0
+        for _ in range(cost):
+            burn = burn * 0.5 + 1.0
+        return func(x) + 0.0 * burn
+    return costly
+
+
+def dominant_system(n, seed=0):
+    # Random strictly diagonally dominant system with solution all ones
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(-1, 1, (n, n))
+    matrix[np.diag_indices(n)] = np.abs(matrix).sum(axis=1) + 1
+    return matrix.tolist(), (matrix @ np.ones(n)).tolist()
+
+
+def grid_system(m):
+    # 5-point Laplacian stencil on an m x m grid, shifted to be diagonally dominant
+    n = m * m
+    matrix = 4.5 * np.eye(n)
+    for i in range(n):
+        row, col = divmod(i, m)
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < m and 0 <= c < m:
+                matrix[i, r * m + c] = -1
+    return matrix, matrix @ np.ones(n)
+
+
+_block_pool = None
+
+
+def block_pool():
+    # One process pool for all block solver cases, so they do not time process start-up
+    global _block_pool
+    if _block_pool is None:
+        _block_pool = ProcessPoolExecutor(os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _block_pool
+
+
+def table(n, seed=0):
+    x = np.sort(np.random.default_rng(seed).uniform(0, 10, n))
+    x = np.unique(x)
+    return x, np.sin(x)
+
+
+def cases(quick=False):
+    """
+    Yield benchmark cases as (group, name, params, make).
+
+    make() returns (run, counter): run() performs one measured call and
+    counter, if not None, has a count of function evaluations.
+    """
+    def scale(full, small):
+        return small if quick else full
+
+    # Integration versus subintervals / iterations
+    for rule in (trapezoidal_rule, simpsons_rule):
+        for n in scale((10, 1000, 100000), (10, 1000)):
+            def make(rule=rule, n=n):
+                f = CountingFunction(lambda x: np.exp(-x * x))
+                return (lambda: rule(f, 0.0, 2.0, n)), f
+            yield "integration", rule.__name__, {"subintervals": n}, make
+    for n in scale((4, 8, 12, 16), (4, 8)):
+        def make(n=n):
+            f = CountingFunction(lambda x: np.exp(-x * x))
+            return (lambda: romberg_integration(f, 0.0, 2.0, n)), f
+        yield "integration", "romberg_integration", {"iterations": n}, make
+
+    # Pointwise interpolation versus table size and query count
+    for method in (linear_interpolation, polynomial_interpolation, lagrange_interpolation, neville,
+                   cubic_spline_interpolation):
+        for n in scale((8, 32, 128), (8, 32)):
+            for queries in scale((1, 100), (1, 10)):
+                def make(method=method, n=n, queries=queries):
+                    x, y = table(n)
+                    x_vals, y_vals = x.tolist(), y.tolist()
+                    points = np.linspace(x[0], x[-1], queries + 2)[1:-1].tolist()
+                    return (lambda: [method(x_vals, y_vals, point) for point in points]), None
+                yield "interpolation", method.__name__, {"table": n, "queries": queries}, make
+
+    # Vectorized interpolants versus table size and query count
+    for method in ("linear", "cubic_spline", "polynomial"):
+        sizes = (16, 64) if method == "polynomial" else scale((1000, 100000), (1000,))
+        for n in sizes:
+            for queries in scale((1000, 100000), (1000,)):
+                def make(method=method, n=n, queries=queries):
+                    x, y = table(n)
+                    points = np.linspace(x[0], x[-1], queries)
+                    return (lambda: make_interpolant(method, x, y)(points)), None
+                yield "interpolant", method, {"table": n, "queries": queries}, make
+
+    # The same bulk evaluation in float32
+    for method in ("linear", "cubic_spline"):
+        for n in scale((1000, 100000), (1000,)):
+            def make(method=method, n=n):
+                x, y = table(n)
+                interpolant = make_interpolant(method, x, y, dtype="float32")
+                points = np.linspace(x[0], x[-1], 100000, dtype=np.float32)
+                return (lambda: interpolant(points)), None
+            yield "interpolant", method, {"table": n, "queries": 100000, "dtype": "float32"}, make
+
+    for n in scale((1000, 100000), (1000,)):
+        def make(n=n):
+            x, y = table(n)
+            points = np.linspace(x[0], x[-1], n)
+            chunks = [(x[i:i + 4096], y[i:i + 4096]) for i in range(0, len(x), 4096)]
+            return (lambda: sum(len(v) for v in stream_interpolate(chunks, points, "cubic_spline", 4096))), None
+        yield "interpolant", "stream_interpolate", {"table": n, "queries": n}, make
+
+    for name, interpolant in GRID_INTERPOLANTS.items():
+        for n in scale((16, 256), (16,)):
+            def make(interpolant=interpolant, n=n):
+                grid = np.linspace(0, 1, n)
+                values = np.sin(grid[:, None] * 3) * np.cos(grid[None, :] * 2)
+                points = np.random.default_rng(0).uniform(0, 1, (2, 10000))
+                return (lambda: interpolant(grid, grid, values)(*points)), None
+            yield "grid_interpolation", name, {"grid": n, "queries": 10000}, make
+
+    # Linear systems versus n
+    for solver in (jacobi_solver, gauss_seidel_solver):
+        for n in scale((4, 16, 64), (4, 16)):
+            def make(solver=solver, n=n):
+                coefficients, constants = dominant_system(n)
+                return (lambda: solver(coefficients, constants, 1e-8, [0.0] * n)), None
+            yield "linear_systems", solver.__name__, {"n": n}, make
+    for iterations in (jacobi_iterations, gauss_seidel_iterations):
+        for dtype in ("float64", "float32"):
+            for n in scale((64, 512), (64,)):
+                def make(iterations=iterations, dtype=dtype, n=n):
+                    coefficients, constants = dominant_system(n)
+                    return (lambda: list(iterations(coefficients, constants, None, [0.0] * n, dtype=dtype))), None
+                yield "linear_systems", iterations.__name__, {"n": n, "dtype": dtype}, make
+    for n in scale((4, 16, 32), (4, 8)):
+        def make(n=n):
+            coefficients, _ = dominant_system(n)
+            matrix = np.array(coefficients)
+            return (lambda: condition_number(matrix)), None
+        yield "linear_systems", "condition_number", {"n": n}, make
+    for ordering in ("natural", "multicolor"):
+        for m in scale((8, 16), (8,)):
+            def make(ordering=ordering, m=m):
+                matrix, constants = grid_system(m)
+                coefficients, b = matrix.tolist(), constants.tolist()
+                return (lambda: list(gauss_seidel_iterations(coefficients, b, 1e-8, [0.0] * m * m,
+                                                             ordering=ordering))), None
+            yield "linear_systems", "gauss_seidel_iterations", {"grid": m, "ordering": ordering}, make
+    for blocks in sorted({1, os.cpu_count()}):
+        for n in scale((1000, 4000), (1000,)):
+            def make(blocks=blocks, n=n):
+                coefficients, constants = dominant_system(n)
+                matrix, b = np.array(coefficients), np.array(constants)
+                return (lambda: list(block_gauss_seidel_iterations(matrix, b, 1e-8, np.zeros(n), blocks=blocks,
+                                                                   executor=block_pool()))), None
+            yield "linear_systems", "block_gauss_seidel_iterations", {"n": n, "blocks": blocks}, make
+    for n in scale((100, 400), (100,)):
+        for low_dtype in ("float32", "float64"):
+            def make(n=n, low_dtype=low_dtype):
+                coefficients, constants = dominant_system(n)
+                matrix, b = np.array(coefficients), np.array(constants)
+                return (lambda: mixed_precision_solver(matrix, b, low_dtype=low_dtype)), None
+            yield "linear_systems", "mixed_precision_solver", {"n": n, "low_dtype": low_dtype}, make
+
+    # Root finding versus the cost of one evaluation
+    for cost in scale((0, 100, 10000), (0, 100)):
+        def make(cost=cost):
+            f = CountingFunction(with_cost(lambda x: x ** 3 - x - 2, cost))
+            return (lambda: Bisection_Method(f, 1.0, 2.0, 1e-10)), f
+        yield "roots", "Bisection_Method", {"cost": cost}, make
+
+        def make(cost=cost):
+            f = CountingFunction(with_cost(lambda x: x ** 3 - x - 2, cost))
+            df = CountingFunction(with_cost(lambda x: 3 * x ** 2 - 1, cost))
+            return (lambda: Newton_Raphson(f, df, 1.5, 1e-10)), CountSum(f, df)
+        yield "roots", "Newton_Raphson", {"cost": cost}, make
+
+        def make(cost=cost):
+            f = CountingFunction(with_cost(lambda x: x ** 3 - x - 2, cost))
+            return (lambda: Secant_Method(f, 1.0, 2.0, 1e-10)), f
+        yield "roots", "Secant_Method", {"cost": cost}, make
+
+    # Plotting, with the plot cache disabled so every call renders
+    for cost in scale((0, 10000), (0,)):
+        def make(cost=cost):
+            f = CountingFunction(with_cost(lambda x: x ** 3 - x - 2, cost))
+            return (lambda: solve_and_plot_root("bisection", f, 1.0, 2.0, tol=1e-10)), f
+        yield "plots", "solve_and_plot_root", {"cost": cost}, make
+    for n in scale((8, 128), (8,)):
+        def make(n=n):
+            x, y = table(n)
+            x_vals, y_vals = x.tolist(), y.tolist()
+            return (lambda: plot_cubic_spline_interpolation_graph(x_vals, y_vals)), None
+        yield "plots", "plot_cubic_spline_interpolation_graph", {"table": n}, make
+
+    # Machine epsilon has no size parameter
+    yield "machine_precision", "calculate_machine_epsilon", {}, lambda: (calculate_machine_epsilon, None)
+
+
+def case_id(group, name, params):
+    return f"{group}/{name}" + "".join(f"[{key}={value}]" for key, value in params.items())
+
+
+def measure(make, repeat, min_time):
+    """
+    Time one case.
+
+    The case is run at least repeat times and for at least min_time seconds;
+    the fastest and median runs are reported. Peak memory is measured in a
+    separate run under tracemalloc, which slows Python code down.
+
+    Returns:
+        dict: Wall times in seconds, evaluations per run and peak memory in bytes.
+    """
+    run, counter = make()
+    # Silence the progress printed by the methods
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()  # warm-up, also fills lazy imports and caches
+        if counter is not None:
+            before = counter.count
+            run()
+            per_run = counter.count - before
+        else:
+            per_run = None
+
+        times = []
+        started = time.perf_counter()
+        while len(times) < repeat or time.perf_counter() - started < min_time:
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+            if len(times) >= 1000:
+                break
+
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "min_seconds": min(times),
+        "median_seconds": statistics.median(times),
+        "runs": len(times),
+        "evaluations": per_run,
+        "peak_bytes": peak,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare median times with a baseline.
+
+    Returns:
+        list of str: Descriptions of the cases slower than the baseline by more than tolerance.
+    """
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        ratio = result["median_seconds"] / reference["median_seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{key}: {ratio:.2f}x slower "
+                               f"({reference['median_seconds']:.3g}s -> {result['median_seconds']:.3g}s)")
+        if result["evaluations"] is not None and reference.get("evaluations") is not None and \
+                result["evaluations"] > reference["evaluations"]:
+            regressions.append(f"{key}: {result['evaluations']} evaluations instead of {reference['evaluations']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the analiza_lib algorithms.")
+    parser.add_argument("--filter", default="", help="only run cases whose id contains this text")
+    parser.add_argument("--quick", action="store_true", help="use a smaller grid of sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="minimum number of timed runs per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum timed seconds per case")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown against the baseline (default 0.25)")
+    args = parser.parse_args(argv)
+
+    # Every plot call should render, not hit the cache
+    configure_plot_cache(max_entries=0)
+
+    results = {}
+    print(f"{'case':<75} {'median':>10} {'min':>10} {'evals':>9} {'peak':>10}")
+    for group, name, params, make in cases(args.quick):
+        key = case_id(group, name, params)
+        if args.filter not in key:
+            continue
+        result = measure(make, args.repeat, args.min_time)
+        results[key] = result
+        evals = "" if result["evaluations"] is None else result["evaluations"]
+        print(f"{key:<75} {result['median_seconds']:>10.3g} {result['min_seconds']:>10.3g} "
+              f"{evals:>9} {result['peak_bytes'] / 1024:>8.0f}KB", flush=True)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": sys.version.split()[0], "numpy": np.__version__, "results": results},
+                      file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,15 +3,66 @@ import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import List, Optional
-from analiza_lib import *
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Any, List, Literal, Optional
+from analiza_lib.caching import LRUCache
+from analiza_lib.interpolation import make_interpolant
+from analiza_lib.machine_precision import default_tolerance
+from analiza_lib.solving_equations import gauss_seidel_iterations, jacobi_iterations
 from fastapi.middleware.cors import CORSMiddleware
+import ast
+import asyncio
+import contextvars
+import hashlib
+import itertools
+import json
 import numpy as np
+import random
+import threading
+import time
 
-app = FastAPI()
+import metrics
+import profiling
+import tasks
+import transport
+from job_queue import JobQueue, QueueFull
+from worker_pool import ComputePool
+
+# Numerical endpoints run in warm worker processes; sizes and limits from the environment
+compute_pool = ComputePool(
+    max_workers=int(os.environ.get("COMPUTE_WORKERS", 0)) or None,
+    default_timeout=float(os.environ.get("COMPUTE_TIMEOUT", 30)),
+    max_timeout=float(os.environ.get("COMPUTE_MAX_TIMEOUT", 300)),
+)
+
+# Long computations submitted to /jobs, run a few at a time in the same pool
+job_queue = JobQueue(
+    workers=int(os.environ.get("JOB_WORKERS", 0)) or compute_pool.max_workers,
+    max_pending=int(os.environ.get("JOB_QUEUE_SIZE", 1000)),
+    retention=float(os.environ.get("JOB_RETENTION", 3600)),
+)
+
+@asynccontextmanager
+async def lifespan(app):
+    # Starting the workers blocks until they are warm, so it runs off the event loop
+    await asyncio.to_thread(compute_pool.start)
+    job_queue.start()
+    yield
+    await job_queue.stop()
+    compute_pool.shutdown()
+
+app = FastAPI(lifespan=lifespan)
+
+# Registered interpolants, bounded by count and by coefficient memory
+INTERPOLANT_STORE_MAX_ENTRIES = 256
+INTERPOLANT_STORE_MAX_BYTES = 256 * 1024 * 1024
+interpolant_store = LRUCache(INTERPOLANT_STORE_MAX_ENTRIES, INTERPOLANT_STORE_MAX_BYTES)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,6 +74,9 @@ app.add_middleware(
 
 # ==================== Input Models ====================
 print("rrrrrrrrrrrrrrr")
+# png or svg images, series (float32 samples) or none
+PlotOutput = Literal["png", "svg", "series", "none"]
+
 class LinearSystemInput(BaseModel):
     coefficients: List[List[float]]
     constants: List[float]
@@ -36,6 +90,7 @@ class SingleVarEquationInput(BaseModel):
     x1: Optional[float] = None
     tol: float
     max_iter: int
+    plot: PlotOutput = "png"
 
 class IntegrationInput(BaseModel):
     func: str
@@ -47,171 +102,775 @@ class InterpolationInput(BaseModel):
     x_vals: List[float]
     y_vals: List[float]
     x: float
+    plot: PlotOutput = "png"
 
-# ==================== Iterative Solvers ====================
+# The image samples resolution x resolution points
+MAX_GRID_RESOLUTION = 1000
 
-@app.post("/jacobi")
-def run_jacobi(data: LinearSystemInput):
-    print("jacobi")
-    results = []
-    def print_capture(msg):
-        results.append(msg)
-    import builtins
-    original_print = builtins.print
-    builtins.print = print_capture
+class GridInterpolationInput(BaseModel):
+    method: str  # bilinear or bicubic
+    x_vals: List[float]
+    y_vals: List[float]
+    z_vals: List[List[float]]  # z_vals[i][j] at (x_vals[i], y_vals[j])
+    xs: List[float]
+    ys: List[float]
+    image: bool = False
+    resolution: int = Field(200, ge=2, le=MAX_GRID_RESOLUTION)
+
+class InterpolantDatasetInput(BaseModel):
+    method: str  # linear, polynomial, lagrange, neville or cubic_spline
+    x_vals: List[float]
+    y_vals: List[float]
+    dtype: str = "float64"  # float32 halves the memory of the stored interpolant
+
+class InterpolantQueryInput(BaseModel):
+    xs: List[float]
+
+MATRIX_ADAPTER = TypeAdapter(List[List[float]])
+
+class BatchJob(BaseModel):
+    endpoint: str  # name of a compute endpoint, e.g. "simpsons" or "lagrange"
+    params: Any  # request body of that endpoint
+    id: Optional[str] = None  # echoed back to match results to jobs
+    timeout: Optional[float] = None
+
+class BatchInput(BaseModel):
+    jobs: List[BatchJob]
+
+class JobInput(BaseModel):
+    endpoint: str  # as in BatchJob
+    params: Any
+    priority: str = "normal"  # high, normal or low
+    timeout: Optional[float] = None
+
+# ==================== Result Cache ====================
+
+# Responses of identical requests, bounded by count, total JSON size and age
+result_cache = LRUCache(
+    max_entries=int(os.environ.get("RESULT_CACHE_ENTRIES", 1024)),
+    max_bytes=int(os.environ.get("RESULT_CACHE_MAX_BYTES", 128 * 1024 * 1024)),
+    sizeof=lambda response: len(json.dumps(response)),
+    ttl=float(os.environ.get("RESULT_CACHE_TTL", 600)),
+)
+
+# Request fields holding Python expressions in x
+EXPRESSION_FIELDS = ("func", "derivative")
+
+LIBRARY_FILES = sorted(
+    [os.path.join(os.path.dirname(tasks.__file__), "tasks.py")] +
+    [os.path.join(os.path.dirname(sys.modules["analiza_lib"].__file__), name)
+     for name in os.listdir(os.path.dirname(sys.modules["analiza_lib"].__file__)) if name.endswith(".py")]
+)
+
+def library_version():
+    """
+    Fingerprint of the numerical code, from the size and modification time of its files.
+
+    Computed once at import as LIBRARY_VERSION: the workers load the code when
+    they start, so edits only take effect after a restart anyway.
+    """
+    stats = []
+    for path in LIBRARY_FILES:
+        try:
+            stat = os.stat(path)
+            stats.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stats.append((path, None, None))
+    return hashlib.sha256(repr(stats).encode()).hexdigest()
+
+LIBRARY_VERSION = library_version()
+
+def canonicalize(value, field=None):
+    """
+    Normalize a request body so that equivalent requests compare equal.
+
+    Floats lose the sign of zero and integral floats match integers given for
+    float fields (Pydantic already converts them). Expressions are parsed and
+    printed back, which removes differences in spacing and redundant
+    parentheses; text that does not parse is only stripped.
+    """
+    if isinstance(value, dict):
+        return {key: canonicalize(item, key) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, float):
+        return value + 0.0
+    if isinstance(value, str) and field in EXPRESSION_FIELDS:
+        try:
+            return ast.unparse(ast.parse(value.strip(), mode="eval"))
+        except SyntaxError:
+            return value.strip()
+    return value
+
+def result_cache_key(task, payload):
+    body = json.dumps([LIBRARY_VERSION, task.__name__, canonicalize(payload)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode()).hexdigest()
+
+# ==================== Server Timing and Metrics ====================
+
+request_seconds = metrics.Histogram(
+    "http_request_duration_seconds", "Time to answer a request.", ("method", "route", "status"))
+phase_seconds = metrics.Histogram(
+    "http_request_phase_seconds", "Time a request spent in each phase, see Server-Timing.", ("route", "phase"))
+algorithm_seconds = metrics.Histogram(
+    "analiza_algorithm_duration_seconds", "Time of one algorithm call in a worker.", ("endpoint", "algorithm"))
+function_evaluations = metrics.Histogram(
+    "analiza_function_evaluations", "User function evaluations per request.", ("endpoint", "algorithm"),
+    metrics.COUNT_BUCKETS)
+solver_iterations = metrics.Histogram(
+    "analiza_solver_iterations", "Iterations per request of the iterative methods.", ("endpoint", "algorithm"),
+    metrics.COUNT_BUCKETS)
+
+# Phase durations of the current request, reported in the Server-Timing header
+request_timings = contextvars.ContextVar("request_timings", default=None)
+
+# Profiling of the current request: the mode and the ids of the profiles taken
+request_profile = contextvars.ContextVar("request_profile", default=None)
+
+# Requests are profiled when they send "X-Profile: cprofile" or "X-Profile: sample",
+# and otherwise at random with probability PROFILE_SAMPLE_RATE
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+PROFILE_SAMPLE_MODE = os.environ.get("PROFILE_SAMPLE_MODE", "sample")
+profile_store = profiling.ProfileStore(int(os.environ.get("PROFILE_BUFFER", 50)))
+
+def profile_mode(request):
+    """
+    Returns:
+        str: The profile mode requested for this request, or None.
+    """
+    requested = request.headers.get("x-profile", "").strip().lower()
+    if requested in ("1", "true", "yes"):
+        return "cprofile"
+    if requested in profiling.PROFILE_MODES:
+        return requested
+    if PROFILE_SAMPLE_RATE and random.random() < PROFILE_SAMPLE_RATE:
+        return PROFILE_SAMPLE_MODE
+    return None
 
+def record_timings(pool_seconds, timings):
+    """
+    Split the time a request spent in the process pool into phases.
+
+    Parameters:
+        pool_seconds (float): Time from submitting the task to getting its response.
+        timings (dict): "compute" and "plot" seconds measured in the worker.
+    """
+    phases = request_timings.get()
+    if phases is None:
+        return  # not inside an HTTP request, e.g. a queued job
+    compute_seconds = timings.get("compute", pool_seconds)
+    plot_seconds = timings.get("plot", 0.0)
+    phases["queue"] += max(pool_seconds - compute_seconds, 0.0)
+    phases["evaluation"] += compute_seconds - plot_seconds
+    phases["plot"] += plot_seconds
+
+def record_measurements(task, measurements):
+    """
+    Add the instrumentation measurements of one task to the /metrics histograms.
+
+    Parameters:
+        task (function): The task, whose name without "compute_" is the endpoint label.
+        measurements (dict): Per algorithm calls, seconds, evaluations and iterations.
+    """
+    endpoint = task.__name__.removeprefix("compute_")
+    for algorithm, entry in measurements.items():
+        if entry["calls"]:
+            algorithm_seconds.observe(entry["seconds"], endpoint, algorithm)
+        if entry["evaluations"]:
+            function_evaluations.observe(entry["evaluations"], endpoint, algorithm)
+        if entry["iterations"]:
+            solver_iterations.observe(entry["iterations"], endpoint, algorithm)
+
+@app.middleware("http")
+async def server_timing(request, call_next):
+    """
+    Add a Server-Timing header: queue (waiting for and talking to a worker),
+    evaluation, plot, serialize (everything else: parsing, validation,
+    encoding the response) and total, in milliseconds. The same durations
+    feed the /metrics histograms.
+    """
+    phases = {"queue": 0.0, "evaluation": 0.0, "plot": 0.0}
+    profile = {"mode": profile_mode(request), "ids": []}
+    token = request_timings.set(phases)
+    profile_token = request_profile.set(profile)
+    start = time.perf_counter()
     try:
-        jacobi_solver(data.coefficients, data.constants, data.tolerance, data.initial_guess)
-    except Exception as e:
-        print("error:", e)
-        return {"error": str(e)}
+        response = await call_next(request)
     finally:
-        builtins.print = original_print
+        request_timings.reset(token)
+        request_profile.reset(profile_token)
+    total = time.perf_counter() - start
+    phases["serialize"] = max(total - sum(phases.values()), 0.0)
 
-    return {"iterations": results}
+    # The route template, not the path, so ids do not create new series
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    request_seconds.observe(total, request.method, route, str(response.status_code))
+    for phase, seconds in phases.items():
+        phase_seconds.observe(seconds, route, phase)
 
-@app.post("/gauss_seidel")
-def run_gauss_seidel(data: LinearSystemInput):
-    print("gauss_seidel")
-    results = []
-    def print_capture(msg):
-        results.append(msg)
-    import builtins
-    original_print = builtins.print
-    builtins.print = print_capture
+    phases["total"] = total
+    response.headers["Server-Timing"] = ", ".join(
+        f"{name};dur={seconds * 1000:.3f}" for name, seconds in phases.items())
+    if profile["ids"]:
+        # Served by /debug/profiles/{id}
+        response.headers["X-Profile-Id"] = ",".join(profile["ids"])
+    return response
+
+# ==================== Compute Pool ====================
+
+async def compute(task, payload, timeout=None, cache=True):
+    """
+    Run a task from tasks.py in the process pool.
+
+    Successful responses are cached by task and canonicalized payload; the
+    cache is cleared when the numerical code changes. Errors, including
+    timeouts, are never cached.
 
+    Parameters:
+        task (function): The task.
+        payload (object): The request body as plain data.
+        timeout (float, optional): Time limit in seconds from the timeout query parameter.
+        cache (bool, optional): Whether to use the result cache (default is True).
+
+    Returns:
+        dict: The response of the task.
+    """
+    profile = request_profile.get()
+    profile_mode = profile["mode"] if profile else None
+    key = None
+    if cache:
+        key = result_cache_key(task, payload)
+        # A profiled request always computes, or there would be nothing to profile
+        response = None if profile_mode else result_cache.get(key)
+        if response is not None:
+            return response
+
+    start = time.perf_counter()
     try:
-        gauss_seidel_solver(data.coefficients, data.constants, data.tolerance, data.initial_guess)
+        response = await compute_pool.run(task, payload, timeout, profile_mode)
     except Exception as e:
-        print("error:", e)
         return {"error": str(e)}
-    finally:
-        builtins.print = original_print
+    seconds = time.perf_counter() - start
+    record_timings(seconds, response.pop("_timings", {}))
+    record_measurements(task, response.pop("_metrics", {}))
+    recorded = response.pop("_profile", None)
+    if recorded is not None:
+        endpoint = task.__name__.removeprefix("compute_")
+        profile["ids"].append(profile_store.add(recorded, endpoint=endpoint, seconds=seconds))
+
+    if key is not None and "error" not in response:
+        try:
+            result_cache.put(key, response)
+        except ValueError:
+            pass  # larger than the whole cache
+    return response
+
+# ==================== Binary Transport ====================
+
+def binary_openapi(schema):
+    # The endpoints read the body themselves; document every accepted media type
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    return {"requestBody": {"required": True, "content": {
+        "application/json": {"schema": schema},
+        transport.NPY_MEDIA_TYPE: binary,
+        transport.MSGPACK_MEDIA_TYPE: binary,
+    }}}
+
+def as_float_array(value, ndim, name):
+    try:
+        array = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be numeric.")
+    if array.ndim != ndim:
+        raise ValueError(f"{name} must have {ndim} dimension(s).")
+    return array
+
+def read_matrix(body, content_type):
+    """
+    Decode a matrix body: JSON list of lists, .npy array or msgpack array.
+    """
+    if content_type not in transport.BINARY_MEDIA_TYPES:
+        try:
+            return MATRIX_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+    return as_float_array(transport.decode_body(body, content_type), 2, "matrix")
 
-    return {"iterations": results}
+def read_linear_system(body, content_type, tolerance=None):
+    """
+    Decode a linear system body.
 
-@app.post("/condition_number")
-def run_condition_number(matrix: List[List[float]]):
+    JSON and msgpack bodies hold the LinearSystemInput fields; in msgpack the
+    arrays may be array maps, and tolerance may come from the query instead.
+    A .npy body is the augmented matrix [A | b] of shape (n, n + 1), with
+    tolerance from the query and a zero initial guess. Binary bodies without
+    a tolerance use default_tolerance, derived from the float64 epsilon.
+
+    Returns:
+        dict: LinearSystemInput fields, NumPy arrays for binary bodies.
+
+    Raises:
+        RequestValidationError: If a JSON body is invalid.
+        ValueError: If a binary body is invalid.
+    """
+    if content_type not in transport.BINARY_MEDIA_TYPES:
+        try:
+            return LinearSystemInput.model_validate_json(body).model_dump()
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+
+    value = transport.decode_body(body, content_type)
+    if content_type == transport.NPY_MEDIA_TYPE:
+        augmented = as_float_array(value, 2, "The .npy body")
+        n = augmented.shape[0]
+        if augmented.shape[1] != n + 1:
+            raise ValueError("The .npy body must be the augmented matrix [A | b] of shape (n, n + 1).")
+        value = {"coefficients": augmented[:, :n], "constants": augmented[:, n]}
+    elif not isinstance(value, dict) or "coefficients" not in value or "constants" not in value:
+        raise ValueError("The msgpack body must be a map with coefficients and constants.")
+
+    coefficients = as_float_array(value["coefficients"], 2, "coefficients")
+    tolerance = value.get("tolerance", tolerance)
+    if tolerance is None:
+        tolerance = default_tolerance()
+    initial_guess = value.get("initial_guess")
+    return {
+        "coefficients": coefficients,
+        "constants": as_float_array(value["constants"], 1, "constants"),
+        "tolerance": float(tolerance),
+        "initial_guess": np.zeros(len(coefficients)) if initial_guess is None
+                         else as_float_array(initial_guess, 1, "initial_guess"),
+    }
+
+def encode_response(response, accept):
+    """
+    Encode a response for the Accept header: .npy holds the solution (or the
+    condition number) with the iteration count in X-Iterations, msgpack the
+    whole response. Errors and other Accept values stay JSON.
+    """
+    if "error" in response or accept not in transport.BINARY_MEDIA_TYPES:
+        if isinstance(response.get("solution"), np.ndarray):
+            response = {**response, "solution": response["solution"].tolist()}
+        return response
+    try:
+        if accept == transport.NPY_MEDIA_TYPE:
+            headers = {"X-Iterations": str(response["iterations"])} if "iterations" in response else None
+            array = response["solution"] if "solution" in response else np.float64(response["condition_number"])
+            return Response(transport.encode_npy(array), media_type=accept, headers=headers)
+        return Response(transport.encode_msgpack(response), media_type=transport.MSGPACK_MEDIA_TYPE)
+    except ValueError as e:
+        return {"error": str(e)}
+
+async def solve_linear_system(request, task, solution_task, timeout, tolerance):
+    content_type = transport.media_type(request.headers.get("content-type"))
+    accept = transport.media_type(request.headers.get("accept"))
+    try:
+        data = read_linear_system(await request.body(), content_type, tolerance)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    # Binary bodies skip the result cache, whose keys and sizes come from JSON
+    binary = content_type in transport.BINARY_MEDIA_TYPES
+    if accept in transport.BINARY_MEDIA_TYPES or binary:
+        response = await compute(solution_task, data, timeout, cache=False)
+        return encode_response(response, accept)
+    return await compute(task, data, timeout)
+
+# ==================== Iterative Solvers ====================
+
+@app.post("/jacobi", openapi_extra=binary_openapi(LinearSystemInput.model_json_schema()))
+async def run_jacobi(request: Request, timeout: Optional[float] = None, tolerance: Optional[float] = None):
+    print("jacobi")
+    return await solve_linear_system(request, tasks.compute_jacobi, tasks.compute_jacobi_solution,
+                                     timeout, tolerance)
+
+@app.post("/gauss_seidel", openapi_extra=binary_openapi(LinearSystemInput.model_json_schema()))
+async def run_gauss_seidel(request: Request, timeout: Optional[float] = None, tolerance: Optional[float] = None):
+    print("gauss_seidel")
+    return await solve_linear_system(request, tasks.compute_gauss_seidel, tasks.compute_gauss_seidel_solution,
+                                     timeout, tolerance)
+
+@app.post("/condition_number", openapi_extra=binary_openapi(MATRIX_ADAPTER.json_schema()))
+async def run_condition_number(request: Request, timeout: Optional[float] = None):
     print("condition_number")
+    content_type = transport.media_type(request.headers.get("content-type"))
     try:
-        mat_np = np.array(matrix)
-        cond = condition_number(mat_np)
-        return {"condition_number": cond}
-    except Exception as e:
+        matrix = read_matrix(await request.body(), content_type)
+    except ValueError as e:
         return {"error": str(e)}
+    binary = content_type in transport.BINARY_MEDIA_TYPES
+    response = await compute(tasks.compute_condition_number, matrix, timeout, cache=not binary)
+    return encode_response(response, transport.media_type(request.headers.get("accept")))
 
 # ==================== Root-Finding Methods ====================
 
 @app.post("/newton_raphson")
-def run_newton_raphson(data: SingleVarEquationInput):
+async def run_newton_raphson(data: SingleVarEquationInput, timeout: Optional[float] = None):
     print("newton_raphson")
-    try:
-        f1 = eval("lambda x: " + data.func)
-        if data.derivative is None:
-            raise ValueError("This method requires a derivative, but none was provided.")
-        f2 = eval("lambda x: " + data.derivative)
-        plot_b64  = plot_newtonraphson_graph(f1, f2, data.x0)
-        result = Newton_Raphson(f1, f2, data.x0, data.tol, data.max_iter)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
-        return {"error": str(e)}
+    return await compute(tasks.compute_newton_raphson, data.model_dump(), timeout)
 
 @app.post("/bisection")
-def run_bisection(data: SingleVarEquationInput):
-    try:
-        f = eval("lambda x: " + data.func)
-        plot_b64  = plot_bisection_graph(f, data.x0, data.x1)
-        result = Bisection_Method(f, data.x0, data.x1, data.tol, data.max_iter)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
-        return {"error": str(e)}
+async def run_bisection(data: SingleVarEquationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_bisection, data.model_dump(), timeout)
 
 @app.post("/secant")
-def run_secant(data: SingleVarEquationInput):
-    try:
-        f = eval("lambda x: " + data.func)
-        plot_b64  = plot_secant_graph(f, data.x0, data.x1)
-        result = Secant_Method(f, data.x0, data.x1, data.tol, data.max_iter)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
-        return {"error": str(e)}
+async def run_secant(data: SingleVarEquationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_secant, data.model_dump(), timeout)
 
 # ==================== Numerical Integration ====================
 
 @app.post("/romberg")
-def run_romberg(data: IntegrationInput):
-    try:
-        f = eval("lambda x: " + data.func)
-        result = romberg_integration(f, data.a, data.b, data.n)
-        return {"result": result}
-    except Exception as e:
-        return {"error": str(e)}
+async def run_romberg(data: IntegrationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_romberg, data.model_dump(), timeout)
 
 @app.post("/simpsons")
-def run_simpsons(data: IntegrationInput):
-    try:
-        f = eval("lambda x: " + data.func)
-        result = simpsons_rule(f, data.a, data.b, data.n)
-        return {"result": result}
-    except Exception as e:
-        return {"error": str(e)}
+async def run_simpsons(data: IntegrationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_simpsons, data.model_dump(), timeout)
 
 @app.post("/trapezoidal")
-def run_trapezoidal(data: IntegrationInput):
-    try:
-        f = eval("lambda x: " + data.func)
-        result = trapezoidal_rule(f, data.a, data.b, data.n)
-        return {"result": result}
-    except Exception as e:
-        return {"error": str(e)}
+async def run_trapezoidal(data: IntegrationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_trapezoidal, data.model_dump(), timeout)
 
 # ==================== Interpolation ====================
 
 @app.post("/linear_interpolation")
-def run_linear_interpolation(data: InterpolationInput):
+async def run_linear_interpolation(data: InterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_linear_interpolation, data.model_dump(), timeout)
+
+@app.post("/polynomial_interpolation")
+async def run_polynomial_interpolation(data: InterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_polynomial_interpolation, data.model_dump(), timeout)
+
+@app.post("/lagrange")
+async def run_lagrange(data: InterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_lagrange, data.model_dump(), timeout)
+
+@app.post("/neville")
+async def run_neville(data: InterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_neville, data.model_dump(), timeout)
+
+@app.post("/cubic_spline")
+async def run_cubic_spline(data: InterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_cubic_spline, data.model_dump(), timeout)
+
+@app.post("/grid_interpolation")
+async def run_grid_interpolation(data: GridInterpolationInput, timeout: Optional[float] = None):
+    return await compute(tasks.compute_grid_interpolation, data.model_dump(), timeout)
+
+# ==================== Streaming Iterations ====================
+
+MAX_STREAM_ITERATIONS = 100000
+
+def advance_iterations(iterations, every, stop=None):
+    """
+    Advance an iteration generator by up to every steps, fewer once stop is set.
+
+    Returns:
+        tuple: The last iterate reached, or None when the generator is exhausted.
+    """
+    last = None
+    for step in itertools.islice(iterations, every):
+        last = step
+        if stop is not None and stop.is_set():
+            break
+    return last
+
+def stream_iterations(iterations, every):
+    """
+    Stream iterates of a solver as server-sent events.
+
+    Every every-th iterate is sent as an "iteration" event, and the last one
+    as a "done" event. The solver only advances when the client has taken
+    the previous event, so a slow client slows the computation instead of
+    buffering results, and a client that disconnects stops it. Invalid input
+    or divergence ends the stream with an "error" event.
+    """
+    def event(name, data):
+        return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+    async def stream():
+        stop = threading.Event()
+        pending = None
+        try:
+            while True:
+                # Run each step off the event loop; the shield keeps the step
+                # visible as running when a disconnect cancels the wait
+                pending = asyncio.ensure_future(asyncio.to_thread(advance_iterations, iterations, every, stop))
+                step = await asyncio.shield(pending)
+                if step is None:
+                    return
+                iteration, guess, converged = step
+                if converged:
+                    yield event("done", {"iteration": iteration, "guess": guess})
+                    return
+                yield event("iteration", {"iteration": iteration, "guess": guess})
+        except Exception as e:
+            yield event("error", {"error": str(e)})
+        finally:
+            # A generator cannot be closed while its thread is inside a step,
+            # so a running step is told to stop and closes it when it returns
+            stop.set()
+            if pending is None or pending.done():
+                iterations.close()
+            else:
+                def close_after_step(step):
+                    if not step.cancelled():
+                        step.exception()  # retrieved, the client is gone
+                    iterations.close()
+                pending.add_done_callback(close_after_step)
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+def check_stream_options(every, max_iter):
+    if every < 1:
+        raise ValueError("every must be a positive integer.")
+    if not 1 <= max_iter <= MAX_STREAM_ITERATIONS:
+        raise ValueError(f"max_iter must be between 1 and {MAX_STREAM_ITERATIONS}.")
+
+@app.post("/jacobi/stream")
+def stream_jacobi(data: LinearSystemInput, every: int = 1, max_iter: int = 1000):
     try:
-        plot_b64  = plot_linear_interpolation_graph(data.x_vals, data.y_vals)
-        result = linear_interpolation(data.x_vals, data.y_vals, data.x)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
+        check_stream_options(every, max_iter)
+    except ValueError as e:
         return {"error": str(e)}
+    return stream_iterations(jacobi_iterations(data.coefficients, data.constants, data.tolerance,
+                                               data.initial_guess, max_iter=max_iter), every)
 
-@app.post("/polynomial_interpolation")
-def run_polynomial_interpolation(data: InterpolationInput):
+@app.post("/gauss_seidel/stream")
+def stream_gauss_seidel(data: LinearSystemInput, every: int = 1, max_iter: int = 1000):
     try:
-        plot_b64  = plot_polynomial_interpolation_graph(data.x_vals, data.y_vals)
-        result = polynomial_interpolation(data.x_vals, data.y_vals, data.x)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
+        check_stream_options(every, max_iter)
+    except ValueError as e:
         return {"error": str(e)}
+    return stream_iterations(gauss_seidel_iterations(data.coefficients, data.constants, data.tolerance,
+                                                     data.initial_guess, max_iter=max_iter), every)
 
-@app.post("/lagrange")
-def run_lagrange(data: InterpolationInput):
+# ==================== Batch Jobs ====================
+
+MAX_BATCH_JOBS = 1000
+
+# Endpoints available to /batch: request model and task
+BATCH_TASKS = {
+    "jacobi": (LinearSystemInput, tasks.compute_jacobi),
+    "gauss_seidel": (LinearSystemInput, tasks.compute_gauss_seidel),
+    "condition_number": (List[List[float]], tasks.compute_condition_number),
+    "newton_raphson": (SingleVarEquationInput, tasks.compute_newton_raphson),
+    "bisection": (SingleVarEquationInput, tasks.compute_bisection),
+    "secant": (SingleVarEquationInput, tasks.compute_secant),
+    "romberg": (IntegrationInput, tasks.compute_romberg),
+    "simpsons": (IntegrationInput, tasks.compute_simpsons),
+    "trapezoidal": (IntegrationInput, tasks.compute_trapezoidal),
+    "linear_interpolation": (InterpolationInput, tasks.compute_linear_interpolation),
+    "polynomial_interpolation": (InterpolationInput, tasks.compute_polynomial_interpolation),
+    "lagrange": (InterpolationInput, tasks.compute_lagrange),
+    "neville": (InterpolationInput, tasks.compute_neville),
+    "cubic_spline": (InterpolationInput, tasks.compute_cubic_spline),
+    "grid_interpolation": (GridInterpolationInput, tasks.compute_grid_interpolation),
+}
+
+def prepare_job(endpoint, params):
+    """
+    Validate the request body of a compute endpoint for /batch and /jobs.
+
+    Returns:
+        tuple: The task and its payload.
+
+    Raises:
+        ValidationError, TypeError, ValueError: If the endpoint or body is invalid.
+    """
+    if endpoint not in BATCH_TASKS:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+    model, task = BATCH_TASKS[endpoint]
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return task, model.model_validate(params).model_dump()
+    return task, [[float(value) for value in row] for row in params]
+
+async def run_batch_job(index, job):
+    """
+    Validate and run one batch job; errors are reported in its result line.
+    """
+    line = {"index": index, "id": job.id, "endpoint": job.endpoint}
     try:
-        plot_b64  = plot_lagrange_interpolation_graph(data.x_vals, data.y_vals)
-        result = lagrange_interpolation(data.x_vals, data.y_vals, data.x)
-        return {"result": result, "plot_base64": plot_b64}
-    except Exception as e:
+        task, payload = prepare_job(job.endpoint, job.params)
+        line["response"] = await compute(task, payload, job.timeout)
+    except (ValidationError, TypeError, ValueError) as e:
+        line["response"] = {"error": str(e)}
+    return line
+
+@app.post("/batch")
+async def run_batch(data: BatchInput):
+    """
+    Run many jobs in parallel and stream one NDJSON line per job as it finishes.
+
+    Lines arrive in completion order; index and id identify the job.
+    """
+    if len(data.jobs) > MAX_BATCH_JOBS:
+        return {"error": f"A batch can hold at most {MAX_BATCH_JOBS} jobs."}
+
+    async def stream():
+        pending = [asyncio.ensure_future(run_batch_job(index, job)) for index, job in enumerate(data.jobs)]
+        try:
+            for finished in asyncio.as_completed(pending):
+                yield json.dumps(await finished) + "\n"
+        finally:
+            # The client went away or the stream ended: drop the jobs still queued
+            for job in pending:
+                job.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+# ==================== Job Queue ====================
+
+@app.post("/jobs")
+async def submit_job(data: JobInput):
+    """
+    Queue a computation and return its id at once; poll /jobs/{id} for its status
+    and fetch /jobs/{id}/result when it is done.
+    """
+    try:
+        task, payload = prepare_job(data.endpoint, data.params)
+        job = job_queue.submit(lambda: compute(task, payload, data.timeout), data.priority)
+    except (ValidationError, TypeError, ValueError) as e:
         return {"error": str(e)}
+    except QueueFull as e:
+        return JSONResponse({"error": str(e)}, status_code=429)
+    return job.describe()
 
-@app.post("/neville")
-def run_neville(data: InterpolationInput):
+@app.get("/jobs/stats")
+async def job_queue_stats():
+    return job_queue.stats()
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        return {"error": "Unknown or expired job id."}
+    return job.describe()
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        return {"error": "Unknown or expired job id."}
+    if job.result is None:
+        return {**job.describe(), "error": f"The job is {job.status}."}
+    return job.result
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return {"error": "Unknown or expired job id."}
+    return job.describe()
+
+# ==================== Interpolant Registry ====================
+
+@app.post("/interpolants")
+def register_interpolant(data: InterpolantDatasetInput):
     try:
-        plot_b64  = plot_neville_interpolation_graph(data.x_vals, data.y_vals)
-        result = neville(data.x_vals, data.y_vals, data.x)
-        return {"result": result, "plot_base64": plot_b64}
+        # The id is a content hash, so registering the same table twice is free
+        digest = hashlib.sha256(f"{data.method}:{data.dtype}".encode())
+        digest.update(np.asarray(data.x_vals, dtype=float).tobytes())
+        digest.update(np.asarray(data.y_vals, dtype=float).tobytes())
+        interpolant_id = digest.hexdigest()
+
+        interpolant = interpolant_store.get(interpolant_id)
+        if interpolant is None:
+            interpolant = make_interpolant(data.method, data.x_vals, data.y_vals, data.dtype)
+            interpolant_store.put(interpolant_id, interpolant)
+        return {"id": interpolant_id, "method": data.method, "dtype": data.dtype, "nbytes": interpolant.nbytes}
     except Exception as e:
         return {"error": str(e)}
 
-@app.post("/cubic_spline")
-def run_cubic_spline(data: InterpolationInput):
+@app.post("/interpolants/{interpolant_id}/evaluate")
+def evaluate_interpolant(interpolant_id: str, data: InterpolantQueryInput):
     try:
-        plot_b64  = plot_cubic_spline_interpolation_graph(data.x_vals, data.y_vals)
-        result = cubic_spline_interpolation(data.x_vals, data.y_vals, data.x)
-        return {"result": result, "plot_base64": plot_b64}
+        interpolant = interpolant_store.get(interpolant_id)
+        if interpolant is None:
+            raise ValueError("Unknown interpolant id, register the dataset again.")
+        return {"results": interpolant(data.xs).tolist()}
     except Exception as e:
         return {"error": str(e)}
 
+@app.delete("/interpolants/{interpolant_id}")
+def delete_interpolant(interpolant_id: str):
+    if interpolant_store.pop(interpolant_id) is None:
+        return {"error": "Unknown interpolant id."}
+    return {"deleted": interpolant_id}
+
+@app.get("/interpolants/stats")
+def interpolant_store_stats():
+    return interpolant_store.stats()
+
+@app.get("/plot_cache/stats")
+async def plot_cache_stats():
+    # Every worker has its own memory tier; this reports the one that answers
+    return await compute(tasks.compute_plot_cache_stats, None, cache=False)
+
+@app.get("/result_cache/stats")
+def result_cache_stats():
+    return {"version": LIBRARY_VERSION, **result_cache.stats()}
+
+@app.delete("/result_cache")
+def clear_result_cache():
+    result_cache.clear()
+    return {"cleared": True}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """
+    Request latency, per-endpoint algorithm measurements and cache counters
+    in Prometheus text format.
+    """
+    lines = []
+    for histogram in (request_seconds, phase_seconds, algorithm_seconds, function_evaluations, solver_iterations):
+        lines += histogram.render()
+
+    caches = {"result_cache": result_cache.stats(), "interpolant_store": interpolant_store.stats()}
+    for counter in ("hits", "misses", "evictions"):
+        lines += metrics.render_samples(
+            f"cache_{counter}_total", f"Cache {counter} in the API process.", "counter",
+            [({"cache": name}, stats[counter]) for name, stats in caches.items()])
+    lines += metrics.render_samples(
+        "cache_hit_ratio", "Share of lookups answered by the cache.", "gauge",
+        [({"cache": name}, stats["hits"] / max(stats["hits"] + stats["misses"], 1)) for name, stats in caches.items()])
+    lines += metrics.render_samples("cache_bytes", "Memory held by the cache.", "gauge",
+                                    [({"cache": name}, stats["nbytes"]) for name, stats in caches.items()])
+
+    queue = job_queue.stats()
+    lines += metrics.render_samples("job_queue_jobs", "Jobs in the queue by status.", "gauge",
+                                    [({"status": status}, queue[status])
+                                     for status in ("queued", "running", "done", "failed", "cancelled")])
+    lines += metrics.render_samples("job_queue_rejected_total", "Jobs rejected because the queue was full.",
+                                    "counter", [({}, queue["rejected"])])
+    return "\n".join(lines) + "\n"
+
+@app.get("/debug/profiles")
+def list_profiles():
+    return {"max_profiles": profile_store.max_profiles, "profiles": profile_store.summaries()}
+
+@app.get("/debug/profiles/{profile_id}")
+def get_profile(profile_id: str, format: str = "text", sort: str = "cumulative", limit: int = 40):
+    """
+    Serve a stored profile as text, as a pstats file (cprofile mode) or as
+    collapsed stacks for flamegraph tools (sample mode).
+    """
+    record = profile_store.get(profile_id)
+    if record is None:
+        return {"error": "Unknown or dropped profile id."}
+    try:
+        if format == "text":
+            return PlainTextResponse(profiling.render_text(record, sort, limit))
+        if format == "pstats":
+            return Response(profiling.render_pstats(record), media_type="application/octet-stream",
+                            headers={"Content-Disposition": f'attachment; filename="{profile_id}.pstats"'})
+        if format == "collapsed":
+            return PlainTextResponse(profiling.render_collapsed(record))
+        raise ValueError("format must be text, pstats or collapsed.")
+    except (KeyError, ValueError) as e:
+        return {"error": str(e)}
+
 @app.get("/ping")
 def ping():
     print("✅ PING CALLED ✅")
@@ -0,0 +1,209 @@
+import asyncio
+import itertools
+import time
+import uuid
+from collections import deque
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted to a queue that holds max_pending jobs."""
+
+
+class Job:
+    """
+    A submitted job and, once it has run, its result.
+
+    Parameters:
+        work (function): Coroutine function taking no arguments and returning the result dict.
+        priority (str): One of JobQueue.PRIORITIES.
+    """
+
+    def __init__(self, work, priority):
+        self.id = uuid.uuid4().hex
+        self.work = work
+        self.priority = priority
+        self.status = "queued"
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+
+    def describe(self):
+        """
+        Returns:
+            dict: Id, status, priority and timestamps of the job.
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "priority": self.priority,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobQueue:
+    """
+    In-process priority queue of jobs served by a fixed number of runners.
+
+    Submitting returns at once with a job id; the runners take queued jobs
+    highest priority first (first come, first served within a priority) and
+    await their work, which normally hands the computation to the process
+    pool. At most max_pending jobs may wait; further submissions are rejected
+    with QueueFull. Finished jobs are kept for retention seconds, and at most
+    max_retained of them, so clients can fetch their results later.
+
+    Parameters:
+        workers (int, optional): Number of jobs run at the same time (default is 1).
+        max_pending (int, optional): Maximum number of queued jobs (default is 1000).
+        retention (float, optional): Seconds a finished job is kept (default is 3600).
+        max_retained (int, optional): Maximum number of finished jobs kept (default is 10000).
+
+    Raises:
+        ValueError: If a limit is not positive.
+    """
+
+    PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+    def __init__(self, workers=1, max_pending=1000, retention=3600.0, max_retained=10000):
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        if not isinstance(max_pending, int) or max_pending < 1:
+            raise ValueError("max_pending must be a positive integer.")
+        if retention <= 0:
+            raise ValueError("retention must be a positive number.")
+        if not isinstance(max_retained, int) or max_retained < 1:
+            raise ValueError("max_retained must be a positive integer.")
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retention = retention
+        self.max_retained = max_retained
+        self.pending = 0
+        self.rejected = 0
+        self.expired = 0
+        self._jobs = {}
+        self._finished = deque()  # ids in completion order
+        self._order = itertools.count()
+        self._queue = None
+        self._runners = []
+
+    def start(self):
+        """Start the runners; must be called from the running event loop."""
+        self._queue = asyncio.PriorityQueue()
+        self._runners = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Stop the runners. Running jobs are cancelled; queued jobs are dropped."""
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+
+    def submit(self, work, priority="normal"):
+        """
+        Queue a job.
+
+        Parameters:
+            work (function): Coroutine function taking no arguments and returning the result dict.
+            priority (str, optional): "high", "normal" or "low" (default is "normal").
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            ValueError: If priority is unknown.
+            QueueFull: If max_pending jobs are already queued.
+        """
+        if priority not in self.PRIORITIES:
+            raise ValueError(f"priority must be one of {', '.join(self.PRIORITIES)}.")
+        self._expire()
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise QueueFull(f"The job queue is full ({self.max_pending} jobs waiting); try again later.")
+
+        job = Job(work, priority)
+        self._jobs[job.id] = job
+        self.pending += 1
+        self._queue.put_nowait((self.PRIORITIES[priority], next(self._order), job))
+        return job
+
+    def get(self, job_id):
+        """
+        Parameters:
+            job_id (str): The job id.
+
+        Returns:
+            Job: The job, or None if it is unknown or has expired.
+        """
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued job; running and finished jobs are not affected.
+
+        The cancelled job stays in the queue until a runner takes it off, and
+        counts against max_pending until then, so submitting and cancelling
+        in a loop cannot grow the queue while the runners are busy.
+
+        Parameters:
+            job_id (str): The job id.
+
+        Returns:
+            Job: The job, or None if it is unknown or has expired.
+        """
+        job = self.get(job_id)
+        if job is not None and job.status == "queued":
+            job.status = "cancelled"
+            self._finish(job)
+        return job
+
+    def _finish(self, job):
+        job.work = None
+        job.finished = time.time()
+        self._finished.append(job.id)
+        self._expire()
+
+    def _expire(self):
+        # Finished jobs leave in completion order: too old, or too many
+        deadline = time.time() - self.retention
+        while self._finished and (len(self._finished) > self.max_retained or
+                                  self._jobs[self._finished[0]].finished < deadline):
+            del self._jobs[self._finished.popleft()]
+            self.expired += 1
+
+    async def _run(self):
+        while True:
+            _, _, job = await self._queue.get()
+            self.pending -= 1
+            if job.status != "queued":
+                continue  # cancelled while waiting
+            job.status = "running"
+            job.started = time.time()
+            try:
+                job.result = await job.work()
+            except Exception as e:
+                job.result = {"error": str(e)}
+            job.status = "failed" if "error" in job.result else "done"
+            self._finish(job)
+
+    def stats(self):
+        """
+        Report queue usage.
+
+        Returns:
+            dict: Job counts by status, limits, and rejected and expired counts.
+        """
+        counts = {status: 0 for status in ("queued", "running", "done", "failed", "cancelled")}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {
+            **counts,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "retention": self.retention,
+            "rejected": self.rejected,
+            "expired": self.expired,
+        }
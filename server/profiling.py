@@ -0,0 +1,178 @@
+import cProfile
+import io
+import itertools
+import marshal
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+
+# Opt-in profiles of the numerical work. A task runs either under cProfile,
+# which records every call with exact counts, or under a sampler thread that
+# reads the stack of the main thread every few milliseconds and keeps the
+# stack counts, ready for flamegraph tools as "collapsed" stacks.
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno})"
+
+
+def _sample_stacks(thread_id, interval, stop, stacks):
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        names = []
+        while frame is not None:
+            names.append(_frame_name(frame))
+            frame = frame.f_back
+        if names:
+            stacks[";".join(reversed(names))] += 1
+
+
+def profile_call(func, mode, interval=0.002):
+    """
+    Call func() under a profiler.
+
+    Parameters:
+        func (function): Function without arguments to profile.
+        mode (str): "cprofile" or "sample".
+        interval (float, optional): Seconds between stack samples (default is 0.002).
+
+    Returns:
+        tuple: The result of func and the profile: a dict with "mode" and either
+        "stats" (cProfile statistics) or "stacks" (collapsed stack counts).
+
+    Raises:
+        ValueError: If mode is unknown.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Profile mode must be one of {', '.join(PROFILE_MODES)}.")
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            result = func()
+        finally:
+            profiler.disable()
+        profiler.create_stats()
+        return result, {"mode": mode, "stats": profiler.stats}
+
+    stacks = Counter()
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample_stacks, args=(threading.get_ident(), interval, stop, stacks),
+                               daemon=True)
+    sampler.start()
+    try:
+        result = func()
+    finally:
+        stop.set()
+        sampler.join()
+    return result, {"mode": mode, "stacks": dict(stacks), "interval": interval}
+
+
+class _LoadedStats:
+    # pstats.Stats accepts any object with create_stats() and a stats dict
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class ProfileStore:
+    """
+    Ring buffer of the most recent profiles.
+
+    Parameters:
+        max_profiles (int, optional): Number of profiles kept (default is 50).
+
+    Raises:
+        ValueError: If max_profiles is not positive.
+    """
+
+    def __init__(self, max_profiles=50):
+        if not isinstance(max_profiles, int) or max_profiles < 1:
+            raise ValueError("max_profiles must be a positive integer.")
+        self.max_profiles = max_profiles
+        self._profiles = deque(maxlen=max_profiles)
+        self._lock = threading.Lock()
+
+    def add(self, profile, **details):
+        """
+        Store a profile from profile_call with details such as the route.
+
+        Returns:
+            str: The id of the stored profile.
+        """
+        record = {"id": uuid.uuid4().hex, "created": time.time(), **details, **profile}
+        with self._lock:
+            self._profiles.append(record)
+        return record["id"]
+
+    def get(self, profile_id):
+        """
+        Returns:
+            dict: The stored profile, or None if it is unknown or was dropped.
+        """
+        with self._lock:
+            return next((record for record in self._profiles if record["id"] == profile_id), None)
+
+    def summaries(self):
+        """
+        Returns:
+            list of dict: Newest first, each profile without its data.
+        """
+        with self._lock:
+            records = list(self._profiles)
+        return [{key: value for key, value in record.items() if key not in ("stats", "stacks")}
+                for record in reversed(records)]
+
+
+def render_text(record, sort="cumulative", limit=40):
+    """
+    Format a profile as a human-readable table.
+
+    cProfile profiles are printed by pstats, sampled ones as their most
+    frequent stacks.
+    """
+    if record["mode"] == "cprofile":
+        output = io.StringIO()
+        stats = pstats.Stats(_LoadedStats(record["stats"]), stream=output)
+        stats.sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+    total = sum(record["stacks"].values())
+    lines = [f"{total} samples every {record['interval'] * 1000:g} ms"]
+    for stack, count in itertools.islice(Counter(record["stacks"]).most_common(), limit):
+        lines.append(f"{count:>7} {count / total:>6.1%}  {stack.rsplit(';', 1)[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+def render_pstats(record):
+    """
+    Serialize a cProfile profile in the format of pstats.Stats.dump_stats,
+    loadable with pstats.Stats(path) or viewers such as snakeviz.
+
+    Raises:
+        ValueError: If the profile was sampled.
+    """
+    if record["mode"] != "cprofile":
+        raise ValueError("pstats output needs a cprofile profile.")
+    return marshal.dumps(record["stats"])
+
+
+def render_collapsed(record):
+    """
+    Format a sampled profile as collapsed stacks ("frame;frame;frame count"
+    per line), the input of flamegraph.pl and speedscope.
+
+    Raises:
+        ValueError: If the profile was taken with cProfile.
+    """
+    if record["mode"] != "sample":
+        raise ValueError("Collapsed stacks need a sample profile.")
+    return "".join(f"{stack} {count}\n" for stack, count in record["stacks"].items())
@@ -0,0 +1,275 @@
+import builtins
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from analiza_lib import instrumentation
+from analiza_lib.interpolation import (cubic_spline_interpolation, lagrange_interpolation, linear_interpolation,
+                                       neville, polynomial_interpolation)
+from analiza_lib.machine_precision import float_dtype
+from analiza_lib.solving_equations import (condition_number, gauss_seidel_iterations, gauss_seidel_solver,
+                                           jacobi_iterations, jacobi_solver)
+
+# Numerical work behind the API endpoints. Every task takes the request body
+# as a plain dict and returns the response dict, so it can run in a worker
+# process: user expressions are eval'd inside the task, never pickled.
+
+
+# Evaluation counts, algorithm times and iterations are reported to /metrics; ANALIZA_METRICS=0 turns them off
+if os.environ.get("ANALIZA_METRICS", "1") != "0":
+    instrumentation.enable()
+
+# The API process imports this module only for the task functions it hands
+# to the workers, so the plotting, root-finding, integration and grid code
+# is imported by the tasks that use it, in the workers.
+_graphs = None
+
+
+def load_graphs():
+    """
+    Import analiza_lib.graphs on first use and configure its plot cache.
+
+    Rendered plots are cached in memory; set PLOT_CACHE_DIR to add an on-disk
+    tier shared by the workers.
+
+    Returns:
+        module: analiza_lib.graphs.
+    """
+    global _graphs
+    if _graphs is None:
+        from analiza_lib import graphs
+        graphs.configure_plot_cache(directory=os.environ.get("PLOT_CACHE_DIR"))
+        _graphs = graphs
+    return _graphs
+
+
+def attach_plot(response, plot, render):
+    """
+    Add the requested plot output to a response.
+
+    "png" and "svg" images are returned base64-encoded in plot_base64.
+    "series" returns the sampled curve in series_float32 as base64 of a
+    little-endian float32 array of shape (2, n): x values, then y values.
+    "none" skips plotting entirely.
+
+    Parameters:
+        response (dict): The response holding the result.
+        plot (str): The requested plot output.
+        render (function): render(output_format) returning the base64 output.
+
+    Returns:
+        dict: The response, with the rendering time in seconds under "_timings".
+    """
+    if plot == "none":
+        return response
+    start = time.perf_counter()
+    if plot == "series":
+        response["series_float32"] = render("series")
+    else:
+        response["plot_base64"] = render(plot)
+    response["_timings"] = {"plot": time.perf_counter() - start}
+    return response
+
+
+def linear_system(data):
+    """
+    Solver arguments from LinearSystemInput fields.
+
+    Binary requests carry NumPy arrays, which are converted to the lists the
+    printing solvers take.
+
+    Parameters:
+        data (dict): LinearSystemInput fields.
+
+    Returns:
+        tuple: Coefficients, constants, tolerance and initial guess.
+    """
+    def as_list(value):
+        return value.tolist() if isinstance(value, np.ndarray) else value
+    return (as_list(data["coefficients"]), as_list(data["constants"]),
+            float(data["tolerance"]), as_list(data["initial_guess"]))
+
+
+def solve_iteratively(iterations, data):
+    """
+    Run an iteration generator to convergence and return only the solution.
+
+    Parameters:
+        iterations (function): jacobi_iterations or gauss_seidel_iterations.
+        data (dict): LinearSystemInput fields.
+
+    Binary requests carry NumPy arrays, which are swept with NumPy in their
+    own type; JSON lists take the Python path.
+
+    Returns:
+        dict: The iteration count and the solution as a float64 array, or the error.
+    """
+    try:
+        iteration, guess = 0, None
+        coefficients = data["coefficients"]
+        dtype = float_dtype(None, coefficients) if isinstance(coefficients, np.ndarray) else None
+        for iteration, guess, _ in iterations(coefficients, data["constants"], float(data["tolerance"]),
+                                              data["initial_guess"], dtype=dtype):
+            pass
+        return {"iterations": iteration, "solution": np.array(guess, dtype=float)}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def capture_iterations(solver, data):
+    """
+    Run an iterative solver and collect the lines it prints.
+
+    Parameters:
+        solver (function): jacobi_solver or gauss_seidel_solver.
+        data (dict): LinearSystemInput fields.
+
+    Returns:
+        dict: The printed iterations, or the error.
+    """
+    results = []
+    def print_capture(msg):
+        results.append(msg)
+    original_print = builtins.print
+    builtins.print = print_capture
+
+    try:
+        instrumentation.timed(solver)(*linear_system(data))
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        builtins.print = original_print
+
+    return {"iterations": results}
+
+# ==================== Iterative Solvers ====================
+
+def compute_jacobi(data):
+    return capture_iterations(jacobi_solver, data)
+
+def compute_gauss_seidel(data):
+    return capture_iterations(gauss_seidel_solver, data)
+
+def compute_jacobi_solution(data):
+    return solve_iteratively(jacobi_iterations, data)
+
+def compute_gauss_seidel_solution(data):
+    return solve_iteratively(gauss_seidel_iterations, data)
+
+def compute_condition_number(matrix):
+    try:
+        mat_np = np.array(matrix)
+        cond = instrumentation.timed(condition_number)(mat_np)
+        return {"condition_number": cond}
+    except Exception as e:
+        return {"error": str(e)}
+
+# ==================== Root-Finding Methods ====================
+
+def find_root(method, func, data, dfunc=None):
+    """
+    Solve once and plot from the same run, see solve_root and plot_root_solution.
+
+    Only the solver is timed and counted under its name; the plot is timed
+    as the plot phase.
+    """
+    graphs = load_graphs()
+    solution = graphs.solve_root(method, func, data["x0"], data["x1"], dfunc, data["tol"], data["max_iter"])
+    return attach_plot({"result": solution.root}, data["plot"],
+                       lambda output_format: graphs.plot_root_solution(solution, output_format))
+
+def compute_newton_raphson(data):
+    try:
+        f1 = eval("lambda x: " + data["func"])
+        if data["derivative"] is None:
+            raise ValueError("This method requires a derivative, but none was provided.")
+        f2 = eval("lambda x: " + data["derivative"])
+        return find_root("newton_raphson", f1, data, dfunc=f2)
+    except Exception as e:
+        return {"error": str(e)}
+
+def compute_bisection(data):
+    try:
+        f = eval("lambda x: " + data["func"])
+        return find_root("bisection", f, data)
+    except Exception as e:
+        return {"error": str(e)}
+
+def compute_secant(data):
+    try:
+        f = eval("lambda x: " + data["func"])
+        return find_root("secant", f, data)
+    except Exception as e:
+        return {"error": str(e)}
+
+# ==================== Numerical Integration ====================
+
+def integrate(rule, data):
+    try:
+        f = instrumentation.counted(eval("lambda x: " + data["func"]), rule.__name__)
+        result = instrumentation.timed(rule)(f, data["a"], data["b"], data["n"])
+        return {"result": result}
+    except Exception as e:
+        return {"error": str(e)}
+
+def compute_romberg(data):
+    from analiza_lib.integrations import romberg_integration
+    return integrate(romberg_integration, data)
+
+def compute_simpsons(data):
+    from analiza_lib.integrations import simpsons_rule
+    return integrate(simpsons_rule, data)
+
+def compute_trapezoidal(data):
+    from analiza_lib.integrations import trapezoidal_rule
+    return integrate(trapezoidal_rule, data)
+
+# ==================== Interpolation ====================
+
+def interpolate(interpolation, plot_graph, data):
+    try:
+        result = instrumentation.timed(interpolation)(data["x_vals"], data["y_vals"], data["x"])
+        return attach_plot({"result": result}, data["plot"],
+                           lambda output_format: getattr(load_graphs(), plot_graph)(
+                               data["x_vals"], data["y_vals"], output_format=output_format))
+    except Exception as e:
+        return {"error": str(e)}
+
+def compute_linear_interpolation(data):
+    return interpolate(linear_interpolation, "plot_linear_interpolation_graph", data)
+
+def compute_polynomial_interpolation(data):
+    return interpolate(polynomial_interpolation, "plot_polynomial_interpolation_graph", data)
+
+def compute_lagrange(data):
+    return interpolate(lagrange_interpolation, "plot_lagrange_interpolation_graph", data)
+
+def compute_neville(data):
+    return interpolate(neville, "plot_neville_interpolation_graph", data)
+
+def compute_cubic_spline(data):
+    return interpolate(cubic_spline_interpolation, "plot_cubic_spline_interpolation_graph", data)
+
+def compute_grid_interpolation(data):
+    from analiza_lib.grid_interpolation import GRID_INTERPOLANTS
+    try:
+        if data["method"] not in GRID_INTERPOLANTS:
+            raise ValueError(f"Unknown grid interpolation method: {data['method']}")
+        if len(data["xs"]) != len(data["ys"]):
+            raise ValueError("xs and ys must be the same length.")
+        interpolant = GRID_INTERPOLANTS[data["method"]](data["x_vals"], data["y_vals"], data["z_vals"])
+        response = {"results": interpolant(data["xs"], data["ys"]).tolist()}
+        if data["image"]:
+            title = f"{data['method'].capitalize()} Interpolation Graph"
+            response["plot_base64"] = load_graphs().plot_grid_interpolation_graph(interpolant, data["resolution"], title)
+        return response
+    except Exception as e:
+        return {"error": str(e)}
+
+def compute_plot_cache_stats(_):
+    graphs = load_graphs()
+    stats = graphs.plot_cache.stats() if graphs.plot_cache else {}
+    return {"worker": os.getpid(), **stats}
@@ -0,0 +1,156 @@
+import io
+
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # msgpack bodies are optional
+    msgpack = None
+
+# Binary request and response bodies for large matrices and vectors.
+#
+# application/x-npy is a single array in NumPy's .npy format.
+# application/msgpack is a map like the JSON body; an array can be a nested
+# list or a map {"dtype": "<f8", "shape": [n, m], "data": <bin>} holding the
+# raw little-endian values in C order.
+# Decoded arrays are read-only views of the request body, not copies.
+
+NPY_MEDIA_TYPE = "application/x-npy"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+BINARY_MEDIA_TYPES = (NPY_MEDIA_TYPE,) + MSGPACK_MEDIA_TYPES
+
+
+def media_type(header):
+    """
+    Return the bare media type of a Content-Type or Accept header, in lower case.
+    """
+    return (header or "").split(";")[0].split(",")[0].strip().lower()
+
+
+def _check_msgpack():
+    if msgpack is None:
+        raise ValueError("msgpack bodies require the msgpack package, which is not installed.")
+
+
+def decode_npy(body):
+    """
+    Read an array from .npy bytes without copying the data.
+
+    Parameters:
+        body (bytes): Contents of a .npy file.
+
+    Returns:
+        numpy.ndarray: Read-only array backed by body.
+
+    Raises:
+        ValueError: If body is not a valid .npy file of numeric data.
+    """
+    stream = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    except Exception as e:
+        raise ValueError(f"Invalid .npy body: {e}")
+    if dtype.hasobject or dtype.kind not in "iuf":
+        raise ValueError("The .npy body must hold a numeric array.")
+
+    count = int(np.prod(shape))
+    if len(body) - stream.tell() < count * dtype.itemsize:
+        raise ValueError("The .npy body is shorter than its header says.")
+    array = np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def encode_npy(array):
+    """
+    Write an array in .npy format.
+
+    Parameters:
+        array (array-like): The array.
+
+    Returns:
+        bytes: Contents of a .npy file.
+    """
+    stream = io.BytesIO()
+    np.save(stream, np.asarray(array), allow_pickle=False)
+    return stream.getvalue()
+
+
+def _decode_array_map(value):
+    if value.keys() == {"dtype", "shape", "data"} and isinstance(value["data"], bytes):
+        dtype = np.dtype(value["dtype"])
+        if dtype.hasobject or dtype.kind not in "iuf":
+            raise ValueError("Arrays must hold numeric data.")
+        return np.frombuffer(value["data"], dtype=dtype).reshape(value["shape"])
+    return value
+
+
+def _encode_array_map(value):
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        return {"dtype": value.dtype.str, "shape": list(value.shape), "data": value.tobytes()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot encode {type(value).__name__} as msgpack.")
+
+
+def decode_msgpack(body):
+    """
+    Read a msgpack body, turning array maps into NumPy arrays without copying.
+
+    Parameters:
+        body (bytes): The msgpack data.
+
+    Returns:
+        object: The decoded value.
+
+    Raises:
+        ValueError: If msgpack is not installed or body is invalid.
+    """
+    _check_msgpack()
+    try:
+        return msgpack.unpackb(body, raw=False, object_hook=_decode_array_map)
+    except Exception as e:
+        raise ValueError(f"Invalid msgpack body: {e}")
+
+
+def encode_msgpack(value):
+    """
+    Write a value as msgpack, NumPy arrays as array maps.
+
+    Parameters:
+        value (object): The value.
+
+    Returns:
+        bytes: The msgpack data.
+
+    Raises:
+        ValueError: If msgpack is not installed.
+    """
+    _check_msgpack()
+    return msgpack.packb(value, default=_encode_array_map)
+
+
+def decode_body(body, content_type):
+    """
+    Decode a binary request body.
+
+    Parameters:
+        body (bytes): The request body.
+        content_type (str): Its media type, one of BINARY_MEDIA_TYPES.
+
+    Returns:
+        object: An array for .npy bodies, the decoded value for msgpack.
+
+    Raises:
+        ValueError: If the media type is not supported or the body is invalid.
+    """
+    if content_type == NPY_MEDIA_TYPE:
+        return decode_npy(body)
+    if content_type in MSGPACK_MEDIA_TYPES:
+        return decode_msgpack(body)
+    raise ValueError(f"Unsupported content type: {content_type}")
@@ -0,0 +1,236 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from analiza_lib import instrumentation, kernels
+
+import profiling
+
+
+class ComputationTimeout(BaseException):
+    """
+    Raised inside a worker when a task runs past its time limit.
+
+    It is not an Exception, so the error handling of the task and of the
+    numerical code does not swallow it.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise ComputationTimeout("Computation timed out.")
+
+
+# Queue on which workers report when they start a task, set by the pool initializer
+_started_queue = None
+
+
+def _init_worker(started_queue):
+    global _started_queue
+    _started_queue = started_queue
+
+
+def _warm_up():
+    # analiza_lib imports matplotlib on the first plot; workers plot, so load it up front
+    import tasks
+    tasks.load_graphs()
+    import matplotlib.backends.backend_agg  # noqa: F401
+    import matplotlib.figure  # noqa: F401
+    # Compile the Numba kernels, if installed, before the first request needs them
+    kernels.warm_up()
+    return os.getpid()
+
+
+def run_with_time_limit(task, payload, timeout, profile=None, call_id=None):
+    """
+    Run a task in a worker process, interrupting it after timeout seconds.
+
+    The limit is enforced with SIGALRM in the worker itself, which stops
+    runaway Python code such as a non-terminating user expression. Tasks
+    catch exceptions and report them, so a timeout becomes an error response.
+
+    Parameters:
+        task (function): Module-level task taking the request payload.
+        payload (object): The request body as plain data.
+        timeout (float): Time limit in seconds.
+        profile (str, optional): Profile the task, "cprofile" or "sample".
+        call_id (int, optional): Reported with the start time to the pool, which
+            measures the deadline of the task from then on.
+
+    Returns:
+        dict: The response of the task, with its run time in seconds under
+        "_timings", the instrumentation measurements under "_metrics" and
+        the profile under "_profile", for the caller to remove.
+    """
+    if call_id is not None and _started_queue is not None:
+        _started_queue.put((call_id, time.time()))
+    start = time.perf_counter()
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    recorded = None
+    try:
+        if profile:
+            response, recorded = profiling.profile_call(lambda: task(payload), profile)
+        else:
+            response = task(payload)
+    except ComputationTimeout:
+        response = {"error": f"Computation timed out after {timeout:g} seconds."}
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    if isinstance(response, dict):
+        response.setdefault("_timings", {})["compute"] = time.perf_counter() - start
+        measurements = instrumentation.snapshot(reset=True)
+        if measurements:
+            response["_metrics"] = measurements
+        if recorded is not None:
+            response["_profile"] = recorded
+    return response
+
+
+class ComputePool:
+    """
+    Bounded pool of warm worker processes for the numerical endpoints.
+
+    CPU-heavy requests run in separate processes, so they scale across cores
+    instead of serializing behind the GIL, and a slow request never blocks the
+    event loop. Each call has a time limit; a request that is cancelled while
+    still queued never starts. If a worker is stuck in native code and misses
+    its limit by more than grace seconds, the whole pool is replaced. The
+    limit counts from when a worker starts the task, not from submission, so
+    time spent queued behind other requests never triggers a restart.
+
+    Parameters:
+        max_workers (int, optional): Number of worker processes (default is the CPU count).
+        default_timeout (float, optional): Time limit when a request gives none (default is 30).
+        max_timeout (float, optional): Upper bound for requested time limits (default is 300).
+        grace (float, optional): Extra seconds before a worker is considered stuck (default is 5).
+    """
+
+    def __init__(self, max_workers=None, default_timeout=30.0, max_timeout=300.0, grace=5.0):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.grace = grace
+        self._executor = None
+        self._context = multiprocessing.get_context("spawn")
+        self._started_queue = None
+        self._listener = None
+        self._call_ids = itertools.count()
+        # call id -> (event loop, future receiving the start time of the call)
+        self._waiters = {}
+        self._start_lock = None
+
+    def _new_executor(self):
+        # Spawned workers do not inherit the server's threads and locks, as forked ones would
+        return ProcessPoolExecutor(self.max_workers, mp_context=self._context,
+                                   initializer=_init_worker, initargs=(self._started_queue,))
+
+    def _listen(self, started_queue):
+        # Forward start reports from the workers to the waiting run() calls
+        while True:
+            message = started_queue.get()
+            if message is None:
+                return
+            call_id, started = message
+            waiter = self._waiters.get(call_id)
+            if waiter is not None:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_set_result, future, started)
+
+    def start(self):
+        """Start the workers and import the numerical code in each of them; blocks until they are ready."""
+        self._started_queue = self._context.SimpleQueue()
+        self._listener = threading.Thread(target=self._listen, args=(self._started_queue,), daemon=True)
+        self._listener.start()
+        self._executor = self._new_executor()
+        for future in [self._executor.submit(_warm_up) for _ in range(self.max_workers)]:
+            future.result()
+
+    def shutdown(self):
+        """Stop the workers, cancelling queued tasks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._listener is not None:
+            self._started_queue.put(None)
+            self._listener = None
+
+    def _restart(self):
+        executor = self._executor
+        self._executor = self._new_executor()
+        # ProcessPoolExecutor cannot stop a running task, so stuck workers are terminated
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, task, payload, timeout=None, profile=None):
+        """
+        Run task(payload) in a worker process.
+
+        Parameters:
+            task (function): Module-level task taking the request payload.
+            payload (object): The request body as plain data.
+            timeout (float, optional): Time limit in seconds, capped at max_timeout.
+            profile (str, optional): Profile the task, "cprofile" or "sample".
+
+        Returns:
+            dict: The response of the task, or an error when the time limit is exceeded.
+
+        Raises:
+            ValueError: If timeout is not positive.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        if timeout <= 0:
+            raise ValueError("timeout must be a positive number.")
+        timeout = min(timeout, self.max_timeout)
+
+        if self._executor is None:
+            # Starting spawns and warms up processes, which must not block the event loop
+            if self._start_lock is None:
+                self._start_lock = asyncio.Lock()
+            async with self._start_lock:
+                if self._executor is None:
+                    await asyncio.to_thread(self.start)
+
+        loop = asyncio.get_running_loop()
+        call_id = next(self._call_ids)
+        started = loop.create_future()
+        self._waiters[call_id] = (loop, started)
+        try:
+            while True:
+                executor = self._executor
+                result = asyncio.wrap_future(
+                    executor.submit(run_with_time_limit, task, payload, timeout, profile, call_id))
+                try:
+                    # Queued time is not limited; the deadline starts with the task
+                    await asyncio.wait({result, started}, return_when=asyncio.FIRST_COMPLETED)
+                    if not result.done():
+                        remaining = started.result() + timeout + self.grace - time.time()
+                        await asyncio.wait({result}, timeout=max(remaining, 0))
+                except asyncio.CancelledError:
+                    # Cancelling the request (client disconnect) cancels the queued task
+                    result.cancel()
+                    raise
+                if not result.done():
+                    # The task overran its own limit by more than grace: the worker is stuck
+                    result.add_done_callback(lambda done: done.cancelled() or done.exception())
+                    self._restart()
+                    return {"error": f"Computation timed out after {timeout:g} seconds."}
+                if executor is self._executor or not (result.cancelled() or result.exception()):
+                    return result.result()
+                # Another task restarted the pool, losing this one
+                if started.done():
+                    return {"error": "The worker running the computation was restarted."}
+        finally:
+            self._waiters.pop(call_id, None)
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The server modules import each other by name, as when run from server/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "server")))
@@ -0,0 +1,98 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from analiza_lib.caching import DiskCache, LRUCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_replacing_a_key_does_not_evict():
+    cache = LRUCache(max_entries=2, sizeof=lambda value: value)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 5)
+
+    assert len(cache) == 2 and cache.evictions == 0
+    assert cache.nbytes == 7
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = LRUCache(ttl=10, sizeof=lambda value: 8)
+    cache.put("a", 1)
+
+    now[0] += 9.9
+    assert cache.get("a") == 1
+    now[0] += 0.1
+    assert cache.get("a", "missing") == "missing"
+    assert "a" not in cache
+    assert cache.expirations == 1 and cache.nbytes == 0
+
+
+def test_byte_budget_evicts_oldest_entries():
+    cache = LRUCache(max_entries=100, max_bytes=3200)
+    for key in range(4):
+        cache.put(key, np.zeros(100))  # 800 bytes each
+
+    cache.put("large", np.zeros(200))
+    assert cache.nbytes <= 3200
+    assert 0 not in cache and 1 not in cache
+    assert 2 in cache and 3 in cache and "large" in cache
+    assert cache.evictions == 2
+
+
+def test_value_larger_than_budget_is_rejected():
+    cache = LRUCache(max_bytes=100)
+    with pytest.raises(ValueError):
+        cache.put("a", np.zeros(100))
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}, {"ttl": -1}])
+def test_invalid_limits_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        LRUCache(**kwargs)
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put("a", "text")
+
+    assert cache.get("a") == "text"
+    assert cache.get("b") is None
+    assert cache.hits == 1 and cache.misses == 1
+    assert sorted(os.listdir(tmp_path)) == ["a.cache"]
+
+
+def test_disk_cache_evicts_least_recently_used_files(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=25)
+    for age, key in enumerate("ab"):
+        cache.put(key, "x" * 10)
+        os.utime(tmp_path / f"{key}.cache", (1000 + age, 1000 + age))
+    assert cache.get("a") == "x" * 10  # "b" is now the oldest
+    cache.put("c", "x" * 10)
+
+    assert sorted(os.listdir(tmp_path)) == ["a.cache", "c.cache"]
+    assert cache.evictions == 1
+
+
+def test_disk_cache_removes_temporary_file_when_write_fails(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    with pytest.raises(UnicodeEncodeError):
+        cache.put("a", "\ud800")
+
+    assert os.listdir(tmp_path) == []
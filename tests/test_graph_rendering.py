@@ -0,0 +1,52 @@
+import base64
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from analiza_lib import graphs
+
+X_VALS = [0.0, 1.0, 2.5, 3.0, 4.5]
+
+
+@pytest.fixture(autouse=True)
+def no_plot_cache(monkeypatch):
+    monkeypatch.setattr(graphs, "plot_cache", None)
+
+
+def render(index):
+    y_vals = [np.sin(x + index) for x in X_VALS]
+    return graphs.plot_cubic_spline_interpolation_graph(X_VALS, y_vals, output_format="png")
+
+
+def test_concurrent_rendering_matches_sequential_rendering():
+    sequential = [render(index) for index in range(8)]
+    with ThreadPoolExecutor(4) as executor:
+        concurrent = list(executor.map(render, range(8)))
+    assert concurrent == sequential
+    assert len(set(sequential)) == 8
+
+
+def test_rendering_leaves_no_pyplot_figures():
+    render(0)
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    assert pyplot is None or not pyplot.get_fignums()
+
+
+@pytest.mark.parametrize("output_format, magic", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_image_formats(output_format, magic):
+    image = graphs.plot_linear_interpolation_graph(X_VALS, [1, 2, 0, 3, 1], output_format=output_format)
+    assert base64.b64decode(image).startswith(magic)
+
+
+def test_series_holds_the_sampled_curve():
+    series = graphs.plot_linear_interpolation_graph(X_VALS, [1, 2, 0, 3, 1], output_format="series")
+    xs, ys = np.frombuffer(base64.b64decode(series), dtype="<f4").reshape(2, -1)
+    assert xs[0] == X_VALS[0] and xs[-1] == X_VALS[-1]
+    np.testing.assert_allclose(ys, np.interp(xs, X_VALS, [1, 2, 0, 3, 1]), atol=1e-6)
+
+
+def test_unknown_output_format_raises():
+    with pytest.raises(ValueError):
+        graphs.plot_linear_interpolation_graph(X_VALS, [1, 2, 0, 3, 1], output_format="jpg")
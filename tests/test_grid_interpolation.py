@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from analiza_lib.grid_interpolation import (BicubicInterpolant, BilinearInterpolant, GridInterpolant,
+                                            bilinear_interpolation)
+
+X = np.array([0.0, 0.5, 1.5, 2.0, 4.0])
+Y = np.array([-1.0, 0.0, 0.25, 3.0])
+
+
+def bilinear_surface(x, y):
+    return 1.5 - 2 * x + 0.75 * y + 0.5 * x * y
+
+
+@pytest.mark.parametrize("cls", [BilinearInterpolant, BicubicInterpolant])
+def test_exact_on_bilinear_surface(cls):
+    interpolant = cls(X, Y, bilinear_surface(X[:, None], Y[None, :]))
+    rng = np.random.default_rng(0)
+    xs = np.concatenate([rng.uniform(X[0], X[-1], 200), X, [X[0], X[-1]]])
+    ys = np.concatenate([rng.uniform(Y[0], Y[-1], 200), Y[[0, 1, 2, 3, 3]], [Y[-1], Y[0]]])
+    np.testing.assert_allclose(interpolant(xs, ys), bilinear_surface(xs, ys), rtol=1e-12, atol=1e-12)
+
+
+def test_scalar_and_broadcast_queries():
+    interpolant = BilinearInterpolant(X, Y, bilinear_surface(X[:, None], Y[None, :]))
+    assert isinstance(interpolant(1.0, 1.0), float)
+    assert interpolant(1.0, 1.0) == pytest.approx(bilinear_surface(1.0, 1.0))
+    assert interpolant(np.array([0.5, 1.0, 3.0]), 0.1).shape == (3,)
+
+
+@pytest.mark.parametrize("cls", [BilinearInterpolant, BicubicInterpolant])
+@pytest.mark.parametrize("point", [(-0.1, 0.0), (4.1, 0.0), (1.0, -1.5), (1.0, 3.5)])
+def test_points_outside_grid_raise(cls, point):
+    interpolant = cls(X, Y, np.zeros((len(X), len(Y))))
+    with pytest.raises(ValueError, match="outside the range of the grid"):
+        interpolant(*point)
+
+
+@pytest.mark.parametrize("x_vals, y_vals, z_vals", [
+    ([0.0], [0.0, 1.0], [[0.0, 1.0]]),
+    ([1.0, 0.0], [0.0, 1.0], [[0.0, 1.0], [1.0, 2.0]]),
+    ([0.0, 1.0], [0.0, 1.0], [[0.0, 1.0]]),
+])
+def test_invalid_grids_raise(x_vals, y_vals, z_vals):
+    with pytest.raises(ValueError):
+        bilinear_interpolation(x_vals, y_vals, z_vals, 0.5, 0.5)
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        GridInterpolant(X, Y, np.zeros((len(X), len(Y))))
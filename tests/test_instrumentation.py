@@ -0,0 +1,31 @@
+import math
+
+import numpy as np
+import pytest
+
+from analiza_lib import instrumentation
+from analiza_lib.graphs import evaluate_batch
+
+
+@pytest.fixture
+def recording():
+    instrumentation.enable()
+    instrumentation.snapshot(reset=True)
+    yield
+    instrumentation.disable()
+    instrumentation.snapshot(reset=True)
+
+
+@pytest.mark.parametrize("func", [np.sin, math.sin, lambda x: 5.0])
+def test_evaluate_batch_counts_each_point_once(recording, func):
+    xs = np.linspace(0, 1, 40)
+    evaluate_batch(instrumentation.counted(func, "f"), xs)
+    assert instrumentation.snapshot()["f"]["evaluations"] == 40
+
+
+def test_failed_calls_are_not_counted(recording):
+    def failing(x):
+        raise ZeroDivisionError
+    with pytest.raises(ZeroDivisionError):
+        instrumentation.counted(failing, "f")(1.0)
+    assert "f" not in instrumentation.snapshot()
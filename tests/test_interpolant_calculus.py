@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from analiza_lib.interpolation import CubicSplineInterpolant, LinearInterpolant, PolynomialInterpolant
+
+X_VALS = np.array([0.0, 0.5, 1.5, 2.0, 3.5])
+Y_VALS = np.array([1.0, -0.5, 2.0, 0.0, 1.5])
+
+
+def test_linear_derivative_is_the_slope_of_each_piece():
+    derivative = LinearInterpolant(X_VALS, Y_VALS).derivative()
+    slopes = np.diff(Y_VALS) / np.diff(X_VALS)
+
+    np.testing.assert_allclose(derivative(X_VALS[:-1]), slopes)
+    np.testing.assert_allclose(derivative((X_VALS[:-1] + X_VALS[1:]) / 2), slopes)
+    assert derivative(X_VALS[-1]) == pytest.approx(slopes[-1])  # the end piece
+
+
+def test_cubic_spline_derivatives_are_continuous_at_the_knots():
+    spline = CubicSplineInterpolant(X_VALS, Y_VALS)
+    first, second = spline.derivative(), spline.derivative().derivative()
+    knots, eps = X_VALS[1:-1], 1e-7
+
+    np.testing.assert_allclose(first(knots - eps), first(knots + eps), atol=1e-5)
+    np.testing.assert_allclose(second(knots - eps), second(knots + eps), atol=1e-5)
+    np.testing.assert_allclose(second(X_VALS[[0, -1]]), 0.0, atol=1e-12)  # natural end conditions
+    np.testing.assert_allclose(first(knots), (spline(knots + eps) - spline(knots - eps)) / (2 * eps), atol=1e-6)
+
+
+def test_linear_integral_is_the_trapezoidal_rule():
+    interpolant = LinearInterpolant(X_VALS, Y_VALS)
+
+    assert interpolant.integrate(X_VALS[0], X_VALS[-1]) == pytest.approx(np.trapezoid(Y_VALS, X_VALS))
+    assert interpolant.integrate(0.0, 0.25) == pytest.approx(0.25 * (1.0 + 0.25) / 2)
+
+
+def test_cubic_spline_integral_matches_dense_quadrature():
+    spline = CubicSplineInterpolant(X_VALS, Y_VALS)
+    x = np.linspace(0.3, 3.2, 200001)
+
+    assert spline.integrate(0.3, 3.2) == pytest.approx(np.trapezoid(spline(x), x), rel=1e-8)
+    np.testing.assert_allclose(spline.antiderivative().derivative()(x[::1000]), spline(x[::1000]), atol=1e-12)
+    assert spline.antiderivative()(X_VALS[0]) == 0.0
+
+
+@pytest.mark.parametrize("interpolant", [LinearInterpolant(X_VALS, Y_VALS), CubicSplineInterpolant(X_VALS, Y_VALS),
+                                         PolynomialInterpolant(X_VALS, Y_VALS)])
+def test_reversed_and_broadcast_limits(interpolant):
+    assert interpolant.integrate(2.5, 0.5) == pytest.approx(-interpolant.integrate(0.5, 2.5))
+    assert interpolant.integrate(1.0, 1.0) == pytest.approx(0.0, abs=1e-12)
+
+    upper = np.array([[0.5, 1.0], [2.0, 3.5]])
+    integrals = interpolant.integrate(0.0, upper)
+    assert integrals.shape == (2, 2)
+    np.testing.assert_allclose(integrals, [[interpolant.integrate(0.0, b) for b in row] for row in upper])
+    np.testing.assert_allclose(interpolant.integrate([0.0, 0.5], [0.5, 0.0]),
+                               [interpolant.integrate(0.0, 0.5), -interpolant.integrate(0.0, 0.5)])
+
+
+def test_polynomial_calculus_is_exact():
+    x = np.array([-1.0, 0.0, 0.5, 2.0])
+    polynomial = PolynomialInterpolant(x, x**3 - 2 * x)
+    points = np.linspace(-1.0, 2.0, 7)
+
+    np.testing.assert_allclose(polynomial.derivative()(points), 3 * points**2 - 2, atol=1e-12)
+    assert polynomial.integrate(-1.0, 2.0) == pytest.approx((2.0**4 / 4 - 2.0**2) - (1 / 4 - 1))
+    np.testing.assert_allclose(polynomial.antiderivative()(points), (points**4 / 4 - points**2) - (1 / 4 - 1),
+                               atol=1e-12)
+
+
+def test_limits_outside_the_table_need_extrapolate():
+    with pytest.raises(ValueError):
+        LinearInterpolant(X_VALS, Y_VALS).integrate(-1.0, 1.0)
+    with pytest.raises(ValueError):
+        CubicSplineInterpolant(X_VALS, Y_VALS).integrate(0.0, [1.0, 4.0])
+    with pytest.raises(ValueError):
+        PolynomialInterpolant(X_VALS, Y_VALS, extrapolate=False).integrate(0.0, 4.0)
+
+    polynomial = PolynomialInterpolant([0.0, 1.0], [0.0, 1.0])
+    assert polynomial.integrate(0.0, 2.0) == pytest.approx(2.0)
+    spline = CubicSplineInterpolant(X_VALS, Y_VALS)
+    spline.extrapolate = True
+    assert np.isfinite(spline.integrate(-1.0, 4.0))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from analiza_lib.interpolation import (CubicSplineInterpolant, INTERPOLANT_FILE_MAGIC, LinearInterpolant,
+                                       PolynomialInterpolant, load_interpolant, save_interpolant)
+
+X = np.linspace(0, 3, 9)
+Y = np.cos(X)
+POINTS = np.array([0.0, 0.4, 1.1, 2.95, 3.0])
+
+
+@pytest.mark.parametrize("build", [
+    lambda: LinearInterpolant(X, Y),
+    lambda: CubicSplineInterpolant(X, Y),
+    lambda: PolynomialInterpolant(X, Y, extrapolate=False),
+    lambda: CubicSplineInterpolant(X, Y, dtype="float32"),
+])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(tmp_path, build, mmap):
+    interpolant = build()
+    path = tmp_path / "table.anlz"
+    save_interpolant(interpolant, path)
+
+    loaded = load_interpolant(path, mmap=mmap)
+    assert type(loaded) is type(interpolant)
+    assert loaded.extrapolate == interpolant.extrapolate
+    for name in interpolant.array_fields:
+        original = getattr(interpolant, name)
+        assert getattr(loaded, name).dtype == original.dtype
+        np.testing.assert_array_equal(getattr(loaded, name), original)
+    np.testing.assert_array_equal(loaded(POINTS), interpolant(POINTS))
+
+
+def test_file_starts_with_magic(tmp_path):
+    path = tmp_path / "table.anlz"
+    save_interpolant(LinearInterpolant(X, Y), path)
+    assert path.read_bytes().startswith(INTERPOLANT_FILE_MAGIC)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "table.npy"
+    np.save(path, Y)
+    with pytest.raises(ValueError, match="Not an interpolant file"):
+        load_interpolant(path)
+
+
+def test_unknown_kind_is_rejected(tmp_path):
+    path = tmp_path / "table.anlz"
+    save_interpolant(LinearInterpolant(X, Y), path)
+    path.write_bytes(path.read_bytes().replace(b"LinearInterpolant", b"UnknownXxxxxxxxxx", 1))
+    with pytest.raises(ValueError, match="Unknown interpolant type"):
+        load_interpolant(path)
+
+
+def test_unsupported_objects_are_not_saved(tmp_path):
+    with pytest.raises(ValueError):
+        save_interpolant(object(), tmp_path / "table.anlz")
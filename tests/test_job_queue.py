@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from job_queue import JobQueue, QueueFull
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def returning(value, delay=0.0, log=None):
+    async def work():
+        if log is not None:
+            log.append(value)
+        await asyncio.sleep(delay)
+        return {"value": value}
+    return work
+
+
+def test_full_queue_rejects_jobs():
+    async def scenario():
+        queue = JobQueue(workers=1, max_pending=2)
+        queue.start()
+        try:
+            queue.submit(returning(1))
+            queue.submit(returning(2))
+            with pytest.raises(QueueFull):
+                queue.submit(returning(3))
+            assert queue.stats()["rejected"] == 1
+            assert queue.stats()["queued"] == 2
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_finished_jobs_free_their_place():
+    async def scenario():
+        queue = JobQueue(workers=1, max_pending=1)
+        queue.start()
+        try:
+            job = queue.submit(returning(1))
+            while job.status != "done":
+                await asyncio.sleep(0.01)
+            assert job.result == {"value": 1}
+            assert queue.submit(returning(2)).status == "queued"
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_cancelled_job_never_runs():
+    async def scenario():
+        log = []
+        queue = JobQueue(workers=1)
+        queue.start()
+        try:
+            blocking = queue.submit(returning("first", delay=0.05, log=log))
+            cancelled = queue.submit(returning("cancelled", log=log))
+            last = queue.submit(returning("last", log=log))
+
+            assert queue.cancel(cancelled.id).status == "cancelled"
+            while last.status != "done":
+                await asyncio.sleep(0.01)
+
+            assert log == ["first", "last"]
+            assert blocking.status == "done"
+            assert cancelled.result is None and cancelled.finished is not None
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_cancelled_jobs_count_against_the_limit_until_discarded():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+            return {}
+
+        queue = JobQueue(workers=1, max_pending=2)
+        queue.start()
+        try:
+            running = queue.submit(blocked)
+            while running.status != "running":
+                await asyncio.sleep(0.01)
+
+            cancelled = 0
+            with pytest.raises(QueueFull):
+                for _ in range(10000):
+                    queue.cancel(queue.submit(returning(1)).id)
+                    cancelled += 1
+            assert cancelled == 2
+            assert queue._queue.qsize() == 2
+
+            # The runner discards the cancelled jobs, freeing their places
+            release.set()
+            while queue.pending:
+                await asyncio.sleep(0.01)
+            assert queue._queue.qsize() == 0
+            queue.submit(returning(2))
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_cancel_does_not_affect_running_or_unknown_jobs():
+    async def scenario():
+        queue = JobQueue(workers=1)
+        queue.start()
+        try:
+            job = queue.submit(returning(1, delay=0.05))
+            while job.status != "running":
+                await asyncio.sleep(0.01)
+            assert queue.cancel(job.id).status == "running"
+            assert queue.cancel("unknown") is None
+            while job.status != "done":
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_higher_priority_runs_first():
+    async def scenario():
+        log = []
+        queue = JobQueue(workers=1)
+        queue.start()
+        try:
+            jobs = [queue.submit(returning(name, log=log), priority)
+                    for name, priority in [("low", "low"), ("normal", "normal"), ("high", "high")]]
+            while any(job.status != "done" for job in jobs):
+                await asyncio.sleep(0.01)
+            assert log == ["high", "normal", "low"]
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_failed_work_is_reported():
+    async def scenario():
+        async def failing():
+            raise RuntimeError("broken")
+        queue = JobQueue()
+        queue.start()
+        try:
+            job = queue.submit(failing)
+            while job.status == "queued" or job.status == "running":
+                await asyncio.sleep(0.01)
+            assert job.status == "failed" and job.result == {"error": "broken"}
+        finally:
+            await queue.stop()
+    run(scenario())
+
+
+def test_unknown_priority_is_rejected():
+    queue = JobQueue()
+    with pytest.raises(ValueError):
+        queue.submit(returning(1), "urgent")
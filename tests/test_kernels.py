@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from analiza_lib import kernels
+from analiza_lib.interpolation import _neville_tableau
+from analiza_lib.solving_equations import _gauss_seidel_sweep
+
+numba = pytest.importorskip("numba")
+
+RTOL = 1e-10
+
+
+def dominant_system(n, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(-1, 1, (n, n))
+    matrix[np.diag_indices(n)] = np.abs(matrix).sum(axis=1) + 1
+    return matrix, rng.uniform(-10, 10, n)
+
+
+@pytest.mark.parametrize("n", [1, 5, 30])
+def test_gauss_seidel_sweep_compiled_matches_python(n):
+    matrix, constants = dominant_system(n)
+    compiled_kernel = numba.njit(kernels.gauss_seidel_sweep)
+    sweep, reference = _gauss_seidel_sweep(matrix.tolist(), constants.tolist(), [0.0] * n, None, jit=False)
+
+    compiled = np.zeros(n)
+    python = np.zeros(n)
+    for _ in range(10):
+        compiled_kernel(matrix, constants, compiled)
+        kernels.gauss_seidel_sweep(matrix, constants, python)
+        reference = sweep(reference)
+
+    np.testing.assert_allclose(compiled, python, rtol=RTOL)
+    np.testing.assert_allclose(compiled, reference, rtol=RTOL)
+
+
+@pytest.mark.parametrize("x", [-1.0, 0.0, 0.5, 3.3, 7.25, 10.0, 11.0])
+def test_neville_column_compiled_matches_python(x):
+    x_vals = np.linspace(0, 10, 12) + np.linspace(0, 0.3, 12) ** 2
+    y_vals = np.sin(x_vals)
+    compiled_kernel = numba.njit(kernels.neville_column)
+
+    compiled = compiled_kernel(x_vals, y_vals, x)
+    np.testing.assert_allclose(compiled, kernels.neville_column(x_vals, y_vals, x), rtol=RTOL)
+    np.testing.assert_allclose(compiled, _neville_tableau(x_vals.tolist(), y_vals.tolist(), x), rtol=RTOL)
+
+
+def test_selected_kernels_agree():
+    if not kernels.JIT_ENABLED:
+        pytest.skip("ANALIZA_JIT=0")
+    for name, result in kernels.verify().items():
+        assert result["compiled"], name
+        assert result["difference"] <= kernels.AGREEMENT_RTOL
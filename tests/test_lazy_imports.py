@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+SERVER = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "server"))
+
+
+def loaded_modules(statement):
+    # A fresh interpreter: this one has imported everything already
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=SERVER, capture_output=True, text=True, check=True)
+    return set(output.stdout.split())
+
+
+def test_api_process_does_not_load_plotting_or_task_only_modules():
+    modules = loaded_modules("import api")
+    for name in ("matplotlib", "analiza_lib.graphs", "analiza_lib.integrations",
+                 "analiza_lib.grid_interpolation", "analiza_lib.roots_finding"):
+        assert name not in modules
+
+
+def test_workers_load_the_plotting_code():
+    assert "analiza_lib.graphs" in loaded_modules("import tasks; tasks.load_graphs()")
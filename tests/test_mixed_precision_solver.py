@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from analiza_lib.help_functions import estimate_inverse_norm, lu_factor, lu_solve
+from analiza_lib.solving_equations import condition_number, mixed_precision_solver
+
+
+def hilbert(n):
+    index = np.arange(n)
+    return 1.0 / (index[:, None] + index[None, :] + 1)
+
+
+def well_conditioned_system(n, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = rng.standard_normal((n, n)) + n * np.eye(n)
+    return matrix, rng.standard_normal(n)
+
+
+@pytest.mark.parametrize("n", [3, 20, 60])
+def test_refinement_reaches_double_precision(n):
+    matrix, constants = well_conditioned_system(n)
+    solution, corrections, factor_dtype = mixed_precision_solver(matrix, constants)
+
+    assert factor_dtype == "float32" and corrections >= 1
+    assert solution.dtype == np.float64
+    np.testing.assert_allclose(solution, np.linalg.solve(matrix, constants), rtol=1e-12, atol=1e-14)
+
+
+def test_list_input_and_tolerance():
+    solution, corrections, _ = mixed_precision_solver([[4, 1], [2, 3]], [1, 2], tol=1e-3)
+    np.testing.assert_allclose(solution, np.linalg.solve([[4, 1], [2, 3]], [1, 2]), rtol=1e-3)
+    assert corrections <= mixed_precision_solver([[4, 1], [2, 3]], [1, 2])[1]
+
+
+def test_ill_conditioned_matrix_falls_back_to_double_precision():
+    matrix = hilbert(10)
+    constants = matrix @ np.ones(10)
+    solution, corrections, factor_dtype = mixed_precision_solver(matrix, constants)
+
+    assert factor_dtype == "float64" and corrections == 0
+    # cond(A) is about 3.5e13, so only the residual is small, not the error
+    np.testing.assert_allclose(matrix @ solution, constants, rtol=1e-13)
+    np.testing.assert_allclose(solution, np.ones(10), rtol=1e-2)
+
+
+@pytest.mark.parametrize("coefficients, constants", [
+    ([[1, 2], [2, 4]], [1, 2]),
+    ([[0, 0], [0, 0]], [1, 1]),
+    ([[1, 2, 3]], [1]),
+    ([[1, 2], [3, 4]], [1, 2, 3]),
+    ([["a", 2], [3, 4]], [1, 2]),
+])
+def test_invalid_systems_raise(coefficients, constants):
+    with pytest.raises(ValueError):
+        mixed_precision_solver(coefficients, constants)
+
+
+@pytest.mark.parametrize("kwargs", [{"tol": 0}, {"tol": "1e-6"}, {"max_iter": 0}])
+def test_invalid_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        mixed_precision_solver([[2, 0], [0, 2]], [1, 1], **kwargs)
+
+
+@pytest.mark.parametrize("matrix", [well_conditioned_system(30)[0], hilbert(6), np.diag([1.0, 1e-3, 1e3])])
+def test_inverse_norm_estimate_matches_the_condition_number(matrix):
+    lu, perm = lu_factor(matrix)
+    estimate = np.abs(matrix).sum(axis=1).max() * estimate_inverse_norm(lu, perm)
+    exact = np.linalg.cond(matrix, np.inf)
+
+    assert estimate <= exact * (1 + 1e-8)  # a lower bound
+    assert estimate >= exact / 3
+    assert condition_number(matrix, (lu, perm)) == pytest.approx(estimate)
+
+
+def test_lu_solve_solves_with_the_matrix_and_its_transpose():
+    matrix, constants = well_conditioned_system(8, seed=1)
+    lu, perm = lu_factor(matrix)
+
+    np.testing.assert_allclose(lu_solve(lu, perm, constants), np.linalg.solve(matrix, constants))
+    np.testing.assert_allclose(lu_solve(lu, perm, constants, transpose=True), np.linalg.solve(matrix.T, constants))
@@ -0,0 +1,142 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from analiza_lib import solving_equations
+from analiza_lib.help_functions import multicolor_ordering
+from analiza_lib.solving_equations import block_gauss_seidel_iterations, gauss_seidel_iterations
+
+
+def laplacian(size):
+    # 5-point stencil on a size x size grid, unknowns numbered row by row
+    n = size * size
+    matrix = 4 * np.eye(n)
+    for i in range(n):
+        row, column = divmod(i, size)
+        if column + 1 < size:
+            matrix[i, i + 1] = matrix[i + 1, i] = -1
+        if row + 1 < size:
+            matrix[i, i + size] = matrix[i + size, i] = -1
+    return matrix
+
+
+def dense_dominant_system(n, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(-1, 1, (n, n)) + 2 * n * np.eye(n)
+    return matrix, rng.uniform(-1, 1, n)
+
+
+def last_guess(iterations):
+    for _, guess, _ in iterations:
+        pass
+    return np.asarray(guess)
+
+
+def test_five_point_stencil_is_red_black():
+    colors = multicolor_ordering(laplacian(5))
+    red_black = (np.arange(5)[:, None] + np.arange(5)[None, :]).reshape(-1) % 2
+
+    assert len(colors) == 2
+    np.testing.assert_array_equal(colors[0], np.flatnonzero(red_black == 0))
+    np.testing.assert_array_equal(colors[1], np.flatnonzero(red_black == 1))
+
+
+def test_dense_matrix_needs_one_color_per_row():
+    colors = multicolor_ordering(dense_dominant_system(6)[0])
+    assert [color.tolist() for color in colors] == [[i] for i in range(6)]
+
+
+@pytest.mark.parametrize("dtype", [None, "float64"])
+def test_multicolor_matches_natural_ordering_on_dense_systems(dtype):
+    matrix, constants = dense_dominant_system(6)
+    natural = list(gauss_seidel_iterations(matrix.tolist(), constants.tolist(), 1e-12, [0.0] * 6, dtype=dtype))
+    multicolor = list(gauss_seidel_iterations(matrix.tolist(), constants.tolist(), 1e-12, [0.0] * 6, dtype=dtype,
+                                              ordering="multicolor"))
+
+    assert len(multicolor) == len(natural)
+    for (_, expected, _), (_, guess, _) in zip(natural, multicolor):
+        np.testing.assert_allclose(guess, expected, rtol=1e-14)
+
+
+def test_multicolor_converges_on_the_laplacian():
+    matrix = laplacian(6)
+    constants = np.ones(len(matrix))
+    guess = last_guess(gauss_seidel_iterations(matrix, constants, 1e-10, np.zeros(len(matrix)), dtype="float64",
+                                               ordering="multicolor"))
+    np.testing.assert_allclose(guess, np.linalg.solve(matrix, constants), atol=1e-8)
+
+
+def test_unknown_ordering_raises():
+    with pytest.raises(ValueError):
+        next(gauss_seidel_iterations([[2.0]], [1.0], 1e-6, [0.0], ordering="diagonal"))
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield pool
+
+
+@pytest.fixture
+def created_segments(monkeypatch):
+    names = []
+
+    class RecordingSharedMemory(SharedMemory):
+        def __init__(self, name=None, create=False, size=0):
+            super().__init__(name, create, size)
+            if create:
+                names.append(self.name)
+
+    monkeypatch.setattr(solving_equations, "SharedMemory", RecordingSharedMemory)
+    return names
+
+
+def assert_unlinked(names):
+    assert len(names) == 4
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+
+def test_block_solver_with_a_shared_executor(executor, created_segments):
+    matrix, constants = dense_dominant_system(12)
+    expected = np.linalg.solve(matrix, constants)
+
+    for blocks in (1, 3):
+        guess = last_guess(block_gauss_seidel_iterations(matrix, constants, 1e-12, np.zeros(12), blocks=blocks,
+                                                         executor=executor))
+        np.testing.assert_allclose(guess, expected, atol=1e-10)
+        assert_unlinked(created_segments)
+        created_segments.clear()
+
+    assert executor.submit(sum, [1, 2]).result() == 3  # still usable after the solves
+
+
+def test_one_block_is_gauss_seidel(executor):
+    matrix, constants = dense_dominant_system(5, seed=2)
+    blocked = [guess for _, guess, _ in block_gauss_seidel_iterations(matrix, constants, 1e-12, np.zeros(5), blocks=1,
+                                                                      executor=executor)]
+    natural = [guess for _, guess, _ in gauss_seidel_iterations(matrix, constants, 1e-12, np.zeros(5),
+                                                                dtype="float64")]
+
+    assert len(blocked) == len(natural)
+    np.testing.assert_allclose(blocked, natural, rtol=1e-13)
+
+
+def test_segments_are_unlinked_when_the_solve_stops_early(executor, created_segments):
+    matrix, constants = dense_dominant_system(8)
+    iterations = block_gauss_seidel_iterations(matrix, constants, 1e-12, np.zeros(8), blocks=2, executor=executor)
+    next(iterations)
+    iterations.close()
+    assert_unlinked(created_segments)
+
+
+def test_segments_are_unlinked_when_the_solve_does_not_converge(executor, created_segments):
+    matrix, constants = dense_dominant_system(8)
+    with pytest.raises(ValueError, match="did not converge"):
+        last_guess(block_gauss_seidel_iterations(matrix, constants, 1e-12, np.zeros(8), max_iter=2, blocks=2,
+                                                 executor=executor))
+    assert_unlinked(created_segments)
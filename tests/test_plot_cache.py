@@ -0,0 +1,67 @@
+import numpy as np
+
+from analiza_lib import graphs
+from analiza_lib.graphs import PlotCache, plot_cache_key
+
+
+def key_for(**arguments):
+    return plot_cache_key("plot", arguments)
+
+
+def test_numbers_and_sequences_are_normalized():
+    assert key_for(x=1) == key_for(x=1.0) == key_for(x=np.float32(1))
+    assert key_for(x=[1, 2]) == key_for(x=(1.0, 2.0)) == key_for(x=np.array([1, 2]))
+    assert key_for(x=[1, 2]) != key_for(x=[2, 1])
+    assert key_for(x=[1, 2]) != key_for(x=[[1, 2]])
+
+
+def test_functions_are_identified_by_their_code():
+    assert key_for(f=eval("lambda x: x**2")) == key_for(f=eval("lambda x: x**2"))
+    assert key_for(f=eval("lambda x: x**2")) != key_for(f=eval("lambda x: x**3"))
+    assert key_for(f=eval("lambda x: x**2")) != key_for(f=eval("lambda x: x*2"))
+
+
+def test_method_and_argument_names_are_part_of_the_key():
+    assert plot_cache_key("a", {"x": 1}) != plot_cache_key("b", {"x": 1})
+    assert key_for(x=1) != key_for(y=1)
+
+
+def test_unsupported_arguments_give_no_key():
+    assert key_for(x=object()) is None
+    assert key_for(x=["a", "b"]) is None
+
+
+def test_memory_tier_serves_repeated_plots():
+    cache = PlotCache()
+    cache.put("k", "image")
+
+    assert cache.get("k") == "image"
+    assert cache.get("missing") is None
+    assert cache.stats()["disk"] is None
+
+
+def test_disk_tier_is_shared_between_caches(tmp_path):
+    PlotCache(directory=str(tmp_path)).put("k", "image")
+    cache = PlotCache(directory=str(tmp_path))
+
+    assert cache.get("k") == "image"
+    assert cache.stats()["disk"]["hits"] == 1
+    assert cache.get("k") == "image"  # now from the memory tier
+    assert cache.stats()["disk"]["hits"] == 1
+
+
+def test_plot_functions_render_once_per_distinct_input(monkeypatch):
+    cache = PlotCache()
+    monkeypatch.setattr(graphs, "plot_cache", cache)
+    first = graphs.plot_linear_interpolation_graph([0, 1, 2], [1, 0, 1], output_format="svg")
+    again = graphs.plot_linear_interpolation_graph((0.0, 1.0, 2.0), [1.0, 0.0, 1.0], output_format="svg")
+    graphs.plot_linear_interpolation_graph([0, 1, 2], [1, 0, 1], output_format="png")
+
+    assert first == again
+    assert cache.memory.hits == 1 and len(cache.memory) == 2
+
+
+def test_disabled_plot_cache(monkeypatch):
+    monkeypatch.setattr(graphs, "plot_cache", graphs.plot_cache)
+    assert graphs.configure_plot_cache(max_entries=0) is None
+    assert graphs.plot_linear_interpolation_graph([0, 1], [0, 1], output_format="series")
@@ -0,0 +1,18 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+# Without the lifespan the process pool never starts: these requests must
+# fail validation before any computation
+client = TestClient(api.app)
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/bisection", {"func": "x**2 - 2", "x0": 1, "x1": 2, "tol": 1e-6, "max_iter": 100}),
+    ("/linear_interpolation", {"x_vals": [0, 1], "y_vals": [0, 1], "x": 0.5}),
+])
+def test_unknown_plot_output_is_rejected(path, body):
+    response = client.post(path, json={**body, "plot": "jpg"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][-1] == "plot"
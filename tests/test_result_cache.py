@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+import api
+import tasks
+from analiza_lib.caching import LRUCache
+
+BISECTION = {"func": "x**2 - 2", "x0": 1.0, "x1": 2.0, "tol": 1e-6, "max_iter": 100, "plot": "none"}
+
+
+def test_equivalent_requests_share_a_key():
+    key = api.result_cache_key(tasks.compute_bisection, BISECTION)
+
+    assert api.result_cache_key(tasks.compute_bisection, {**BISECTION, "func": " x ** 2-2 "}) == key
+    assert api.result_cache_key(tasks.compute_bisection, {**BISECTION, "func": "(x**2) - 2"}) == key
+    assert api.result_cache_key(tasks.compute_bisection, dict(reversed(BISECTION.items()))) == key
+
+
+def test_integers_for_float_fields_share_a_key():
+    # The endpoints key the validated body, where Pydantic has made them floats
+    body = api.SingleVarEquationInput(**{**BISECTION, "x0": 1, "x1": 2}).model_dump()
+    assert (api.result_cache_key(tasks.compute_bisection, body)
+            == api.result_cache_key(tasks.compute_bisection, api.SingleVarEquationInput(**BISECTION).model_dump()))
+
+
+def test_signed_zeros_share_a_key():
+    payload = {"x_vals": [-0.0, 1.0], "y_vals": [0.0, 1.0], "x": -0.0}
+    assert api.canonicalize(payload) == {"x_vals": [0.0, 1.0], "y_vals": [0.0, 1.0], "x": 0.0}
+    assert str(api.canonicalize(-0.0)) == "0.0"
+    assert (api.result_cache_key(tasks.compute_linear_interpolation, payload)
+            == api.result_cache_key(tasks.compute_linear_interpolation, {**payload, "x_vals": [0.0, 1.0], "x": 0.0}))
+
+
+def test_different_requests_have_different_keys():
+    key = api.result_cache_key(tasks.compute_bisection, BISECTION)
+
+    assert api.result_cache_key(tasks.compute_bisection, {**BISECTION, "func": "x**2 - 3"}) != key
+    assert api.result_cache_key(tasks.compute_bisection, {**BISECTION, "plot": "png"}) != key
+    assert api.result_cache_key(tasks.compute_secant, BISECTION) != key
+
+
+def test_unparsable_expressions_are_only_stripped():
+    assert api.canonicalize({"func": " x ** "}) == {"func": "x **"}
+    assert api.canonicalize({"name": " x ** 2 "}) == {"name": " x ** 2 "}
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Stands in for the process pool: counts the computations and returns
+    # the next queued response
+    calls = []
+    responses = []
+
+    async def run(task, payload, timeout, profile_mode):
+        calls.append(payload)
+        return dict(responses.pop(0))
+
+    monkeypatch.setattr(api.compute_pool, "run", run)
+    return calls, responses
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(api, "result_cache", LRUCache(ttl=60))
+    return clock
+
+
+def compute(payload, **kwargs):
+    return asyncio.run(api.compute(tasks.compute_bisection, payload, **kwargs))
+
+
+def test_repeated_requests_are_served_from_the_cache(pool, now):
+    calls, responses = pool
+    responses.append({"result": 1.4142})
+
+    assert compute(BISECTION) == {"result": 1.4142}
+    assert compute({**BISECTION, "func": "x ** 2 - 2"}) == {"result": 1.4142}
+    assert len(calls) == 1
+
+
+def test_cached_responses_expire(pool, now):
+    calls, responses = pool
+    responses.extend([{"result": 1.0}, {"result": 2.0}])
+
+    compute(BISECTION)
+    now[0] += 59
+    assert compute(BISECTION) == {"result": 1.0}
+    now[0] += 1
+    assert compute(BISECTION) == {"result": 2.0}
+    assert len(calls) == 2 and api.result_cache.expirations == 1
+
+
+def test_errors_are_not_cached(pool, now):
+    calls, responses = pool
+    responses.extend([{"error": "The function has the same sign at both ends"}, {"result": 1.4142}])
+
+    assert "error" in compute(BISECTION)
+    assert compute(BISECTION) == {"result": 1.4142}
+    assert len(calls) == 2
+
+
+def test_failed_computations_are_not_cached(monkeypatch, now):
+    async def run(task, payload, timeout, profile_mode):
+        raise TimeoutError("The computation timed out")
+
+    monkeypatch.setattr(api.compute_pool, "run", run)
+    assert compute(BISECTION) == {"error": "The computation timed out"}
+    assert len(api.result_cache) == 0
+
+
+def test_uncached_computations_always_run(pool, now):
+    calls, responses = pool
+    responses.extend([{"result": 1.0}, {"result": 1.0}])
+
+    compute(BISECTION, cache=False)
+    compute(BISECTION, cache=False)
+    assert len(calls) == 2 and len(api.result_cache) == 0
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import tasks
+from analiza_lib import graphs, instrumentation
+from analiza_lib.roots_finding import Bisection_Method, Newton_Raphson, Secant_Method
+
+
+def f(x):
+    return np.cos(x) - x
+
+
+def df(x):
+    return -np.sin(x) - 1
+
+
+# task, solver, request fields, and the solver run on its own with a given function
+REQUESTS = {
+    "bisection": (tasks.compute_bisection, Bisection_Method,
+                  {"func": "np.cos(x) - x", "derivative": None, "x0": 0.0, "x1": 1.0},
+                  lambda func: Bisection_Method(func, 0.0, 1.0, 1e-8, 100)),
+    "newton_raphson": (tasks.compute_newton_raphson, Newton_Raphson,
+                       {"func": "np.cos(x) - x", "derivative": "-np.sin(x) - 1", "x0": 0.5, "x1": None},
+                       lambda func: Newton_Raphson(func, df, 0.5, 1e-8, 100)),
+    "secant": (tasks.compute_secant, Secant_Method,
+               {"func": "np.cos(x) - x", "derivative": None, "x0": 0.0, "x1": 1.0},
+               lambda func: Secant_Method(func, 0.0, 1.0, 1e-8, 100)),
+}
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    tasks.load_graphs()  # configures the plot cache, which is then disabled
+    monkeypatch.setattr(graphs, "plot_cache", None)
+    instrumentation.enable()
+    instrumentation.snapshot(reset=True)
+    yield
+    instrumentation.snapshot(reset=True)
+
+
+def distinct_points(solve):
+    points = set()
+
+    def recording_f(x):
+        points.add(x)
+        return f(x)
+    solve(recording_f)
+    return len(points)
+
+
+@pytest.mark.parametrize("method", REQUESTS)
+@pytest.mark.parametrize("plot", ["png", "none"])
+def test_only_the_solver_is_counted_and_timed(recording, method, plot):
+    task, solver, fields, solve = REQUESTS[method]
+    response = task({**fields, "tol": 1e-8, "max_iter": 100, "plot": plot})
+    assert "error" not in response
+
+    measured = instrumentation.snapshot()[solver.__name__]
+    assert measured["calls"] == 1
+    expected = distinct_points(solve)
+    if method == "newton_raphson":
+        expected += measured["iterations"]  # one derivative evaluation per iteration
+    # The same with and without a plot: sampling the curve is not counted
+    assert measured["evaluations"] == expected
+
+    assert ("plot_base64" in response) == (plot == "png")
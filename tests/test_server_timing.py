@@ -0,0 +1,52 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+import tasks
+from analiza_lib import graphs
+
+
+def server_timing(response):
+    phases = {}
+    for part in response.headers["Server-Timing"].split(","):
+        name, duration = part.strip().split(";dur=")
+        phases[name] = float(duration)
+    return phases
+
+
+@pytest.mark.parametrize("task, fields", [
+    (tasks.compute_bisection, {"func": "x**3 - x - 2", "derivative": None, "x0": 1.0, "x1": 2.0}),
+    (tasks.compute_newton_raphson, {"func": "x**2 - 2", "derivative": "2*x", "x0": 1.0, "x1": None}),
+    (tasks.compute_secant, {"func": "x**2 - 2", "derivative": None, "x0": 1.0, "x1": 2.0}),
+])
+def test_root_finding_reports_render_time_as_plot(monkeypatch, task, fields):
+    tasks.load_graphs()  # configures the plot cache, which is then disabled
+    monkeypatch.setattr(graphs, "plot_cache", None)
+    response = task({**fields, "tol": 1e-6, "max_iter": 100, "plot": "png"})
+    # Rendering a PNG takes milliseconds; solving takes microseconds
+    assert response["_timings"]["plot"] > 1e-3
+
+
+def test_record_timings_splits_the_pool_time():
+    phases = {"queue": 0.0, "evaluation": 0.0, "plot": 0.0}
+    token = api.request_timings.set(phases)
+    try:
+        api.record_timings(0.5, {"compute": 0.4, "plot": 0.3})
+    finally:
+        api.request_timings.reset(token)
+    assert phases == pytest.approx({"queue": 0.1, "evaluation": 0.1, "plot": 0.3})
+
+
+def test_server_timing_header_separates_plot_from_evaluation():
+    with TestClient(api.app) as client:
+        response = client.post("/bisection", json={"func": "x**3 - x - 2.0123", "x0": 1, "x1": 2, "tol": 1e-6,
+                                                   "max_iter": 100, "plot": "png"})
+        assert response.status_code == 200 and "plot_base64" in response.json()
+        phases = server_timing(response)
+        assert set(phases) == {"queue", "evaluation", "plot", "serialize", "total"}
+        assert phases["plot"] > phases["evaluation"]
+        assert phases["plot"] <= phases["total"]
+
+        response = client.post("/bisection", json={"func": "x**3 - x - 2.0123", "x0": 1, "x1": 2, "tol": 1e-6,
+                                                   "max_iter": 100, "plot": "none"})
+        assert server_timing(response)["plot"] == 0
@@ -0,0 +1,96 @@
+import base64
+import math
+
+import pytest
+
+from analiza_lib import graphs
+from analiza_lib.roots_finding import Bisection_Method, Newton_Raphson, Secant_Method
+
+
+class ScalarFunction:
+    # cos(x) - x on Python floats only, as a user expression using math would be
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return math.cos(x) - x
+
+
+def derivative(x):
+    return -math.sin(x) - 1
+
+
+@pytest.fixture(autouse=True)
+def no_plot_cache(monkeypatch):
+    monkeypatch.setattr(graphs, "plot_cache", None)
+
+
+def old_bisection(func, a, b, tol, output_format):
+    # Before solve_and_plot_root: the endpoint solved, then the plot function
+    # solved again and sampled the unmemoized function
+    Bisection_Method(func, a, b, tol)
+    root = Bisection_Method(func, a, b, tol)
+    solve_calls = func.calls
+    graphs._plot_root_graph("plot_bisection_graph", "Bisection Method", func, root, a - 1, b + 1, output_format)
+    return solve_calls
+
+
+@pytest.mark.parametrize("output_format", ["png", "series"])
+def test_single_pass_halves_the_solver_evaluations(output_format):
+    old, new = ScalarFunction(), ScalarFunction()
+    old_solve_calls = old_bisection(old, 0.0, 1.0, 1e-8, output_format)
+    solution = graphs.solve_root("bisection", new, 0.0, 1.0, tol=1e-8)
+    new_solve_calls = new.calls
+    graphs.plot_root_solution(solution, output_format)
+
+    # 26 instead of 98 for the solve; the 60-odd plot samples are the same
+    # in both, so a whole request makes about 90 evaluations instead of 165
+    assert new_solve_calls <= old_solve_calls / 2
+    assert new.calls - new_solve_calls <= old.calls - old_solve_calls
+    assert new.calls <= 0.6 * old.calls
+
+
+def test_solver_evaluations_are_memoized():
+    func = ScalarFunction()
+    solution = graphs.solve_root("bisection", func, 0.0, 1.0, tol=1e-8)
+
+    assert func.calls == solution.memoized.evaluations == len(solution.memoized.values)
+    graphs.plot_root_solution(solution, "png")
+    assert all(x in solution.memoized.values for x in solution.history + [solution.root])
+
+
+@pytest.mark.parametrize("method, solver, arguments", [
+    ("bisection", Bisection_Method, (0.0, 1.0)),
+    ("secant", Secant_Method, (0.0, 1.0)),
+    ("newton_raphson", Newton_Raphson, (0.5,)),
+])
+def test_history_holds_the_solver_iterates(method, solver, arguments):
+    func = ScalarFunction()
+    if method == "newton_raphson":
+        solution = graphs.solve_root(method, func, arguments[0], dfunc=derivative, tol=1e-8)
+        arguments = (derivative,) + arguments
+    else:
+        solution = graphs.solve_root(method, func, *arguments, tol=1e-8)
+    history = []
+    root = solver(func, *arguments, 1e-8, 100, history)
+
+    assert solution.root == root
+    assert solution.history == history and history
+
+
+def test_iterates_are_drawn():
+    solution = graphs.solve_root("secant", ScalarFunction(), 0.0, 1.0, tol=1e-8)
+    svg = base64.b64decode(graphs.plot_root_solution(solution, "svg")).decode()
+    without_history = base64.b64decode(graphs._plot_root_graph(
+        "test", "Secant Method", solution.memoized, solution.root, solution.a, solution.b, "svg")).decode()
+
+    assert "Iterates" in svg and "Iterates" not in without_history
+
+
+def test_solve_and_plot_root_skips_the_plot():
+    func = ScalarFunction()
+    root, image = graphs.solve_and_plot_root("bisection", func, 0.0, 1.0, tol=1e-8, output_format=None)
+
+    assert image is None and root == pytest.approx(0.739085, abs=1e-6)
+    assert func.calls == graphs.solve_root("bisection", ScalarFunction(), 0.0, 1.0, tol=1e-8).memoized.evaluations
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from analiza_lib.interpolation import CubicSplineInterpolant, LinearInterpolant
+from analiza_lib.streaming_interpolation import iter_table_chunks, resample_file, stream_interpolate
+
+rng = np.random.default_rng(0)
+X = np.cumsum(rng.uniform(0.5, 1.5, 4000))
+Y = np.sin(X / 7) + 0.1 * np.cos(X)
+QUERIES = np.sort(np.concatenate([rng.uniform(X[0], X[-1], 3000), X[::37], [X[0], X[-1]]]))
+
+
+def chunked(size):
+    return [(X[start:start + size], Y[start:start + size]) for start in range(0, len(X), size)]
+
+
+@pytest.mark.parametrize("size", [7, 100, 999])
+def test_streamed_spline_matches_in_memory_spline(size):
+    streamed = np.concatenate(list(stream_interpolate(chunked(size), QUERIES, "cubic_spline", chunk_size=256)))
+    np.testing.assert_allclose(streamed, CubicSplineInterpolant(X, Y)(QUERIES), rtol=0, atol=1e-9)
+
+
+def test_streamed_linear_matches_in_memory_linear():
+    streamed = np.concatenate(list(stream_interpolate(chunked(333), QUERIES, "linear", chunk_size=100)))
+    np.testing.assert_allclose(streamed, LinearInterpolant(X, Y)(QUERIES), rtol=0, atol=1e-12)
+
+
+def test_resample_csv_to_npy(tmp_path):
+    source = tmp_path / "table.csv"
+    np.savetxt(source, np.column_stack([X, Y]), delimiter=",", header="x,y")
+    output = tmp_path / "resampled.npy"
+
+    written = resample_file(str(source), QUERIES, str(output), "cubic_spline", chunk_size=500, skip_header=1)
+    assert written == len(QUERIES)
+    np.testing.assert_allclose(np.load(output), CubicSplineInterpolant(X, Y)(QUERIES), rtol=0, atol=1e-9)
+
+
+def test_npy_chunks_cover_the_table(tmp_path):
+    source = tmp_path / "table.npy"
+    np.save(source, np.column_stack([X, Y]))
+    chunks = list(iter_table_chunks(str(source), chunk_size=1500))
+    assert [len(x) for x, _ in chunks] == [1500, 1500, 1000]
+    np.testing.assert_array_equal(np.concatenate([y for _, y in chunks]), Y)
+
+
+@pytest.mark.parametrize("queries", [[X[0] - 1], [X[-1] + 1], [X[10], X[5]]])
+def test_invalid_queries_raise(queries):
+    with pytest.raises(ValueError):
+        list(stream_interpolate(chunked(100), queries, "cubic_spline"))
+
+
+def test_unsorted_data_raises():
+    chunks = chunked(100)
+    chunks[3], chunks[4] = chunks[4], chunks[3]
+    with pytest.raises(ValueError, match="sorted"):
+        list(stream_interpolate(chunks, QUERIES))
@@ -0,0 +1,79 @@
+import io
+
+import numpy as np
+import pytest
+
+import transport
+
+
+def npy_bytes(array):
+    return transport.encode_npy(array)
+
+
+def test_npy_round_trip_is_a_read_only_view():
+    array = np.arange(12, dtype=float).reshape(3, 4)
+    decoded = transport.decode_npy(npy_bytes(array))
+    np.testing.assert_array_equal(decoded, array)
+    assert not decoded.flags.writeable
+
+
+def test_npy_fortran_order_is_kept():
+    array = np.asfortranarray(np.arange(6, dtype=np.float32).reshape(2, 3))
+    np.testing.assert_array_equal(transport.decode_npy(npy_bytes(array)), array)
+
+
+@pytest.mark.parametrize("body", [
+    b"",
+    b"not an npy file at all",
+    npy_bytes(np.zeros((4, 4)))[:40],  # truncated header
+    npy_bytes(np.zeros((4, 4)))[:-8],  # truncated data
+    npy_bytes(np.array([1 + 2j])),
+    npy_bytes(np.array(["text"])),
+])
+def test_malformed_npy_raises_value_error(body):
+    with pytest.raises(ValueError):
+        transport.decode_npy(body)
+
+
+def test_object_arrays_are_rejected():
+    stream = io.BytesIO()
+    np.lib.format.write_array_header_1_0(stream, {"descr": "|O", "fortran_order": False, "shape": (2,)})
+    with pytest.raises(ValueError, match="numeric"):
+        transport.decode_npy(stream.getvalue() + b"\0" * 16)
+
+
+def test_unsupported_content_type_raises():
+    with pytest.raises(ValueError, match="Unsupported content type"):
+        transport.decode_body(b"{}", "application/json")
+
+
+def test_media_type_strips_parameters():
+    assert transport.media_type("Application/X-NPY; charset=binary") == transport.NPY_MEDIA_TYPE
+    assert transport.media_type(None) == ""
+
+
+def test_msgpack_array_maps_round_trip():
+    pytest.importorskip("msgpack")
+    value = {"coefficients": np.eye(3), "constants": [1.0, 2.0, 3.0], "tolerance": 1e-8}
+    decoded = transport.decode_body(transport.encode_msgpack(value), transport.MSGPACK_MEDIA_TYPE)
+    np.testing.assert_array_equal(decoded["coefficients"], np.eye(3))
+    assert decoded["constants"] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("build", [
+    lambda msgpack: b"\xc1",  # never-used type byte
+    lambda msgpack: msgpack.packb({"dtype": "<f8", "shape": [3, 3], "data": b"\0" * 16}),
+    lambda msgpack: msgpack.packb({"dtype": "not a dtype", "shape": [1], "data": b"\0" * 8}),
+    lambda msgpack: msgpack.packb({"dtype": "|O", "shape": [1], "data": b"\0" * 8}),
+    lambda msgpack: msgpack.packb({"dtype": "<c16", "shape": [1], "data": b"\0" * 16}),
+])
+def test_malformed_msgpack_raises_value_error(build):
+    msgpack = pytest.importorskip("msgpack")
+    with pytest.raises(ValueError):
+        transport.decode_msgpack(build(msgpack))
+
+
+def test_msgpack_without_package_raises_value_error(monkeypatch):
+    monkeypatch.setattr(transport, "msgpack", None)
+    with pytest.raises(ValueError, match="msgpack package"):
+        transport.decode_msgpack(b"\x80")